@@ -0,0 +1,75 @@
+"""Compare the previous and current PNG data URL validators.
+
+Run from the repository root:
+
+    python benchmarks/bench_validation.py
+"""
+
+import base64
+import os
+import re
+import sys
+import timeit
+from pathlib import Path
+
+import django
+from django.conf import settings
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+settings.configure()
+django.setup()
+
+from django.core.exceptions import ValidationError  # noqa: E402
+
+from signature_pad.fields import SignaturePadField  # noqa: E402
+
+PNG_HEAD = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x01\x00\x00\x00\x00\x80\x08\x06\x00\x00\x00\x00\x00\x00\x00"
+
+
+def legacy_validate(value, max_size_kb):
+    """The regex + split + full decode validator, before the single-pass rewrite."""
+    if not re.match(r"^data:image/png;base64,[A-Za-z0-9+/]+=*$", value):
+        raise ValidationError("Invalid PNG data URL format.")
+    try:
+        header, base64_data = value.split(",", 1)
+        decoded_data = base64.b64decode(base64_data)
+        if not decoded_data.startswith(b"\x89PNG\r\n\x1a\n"):
+            raise ValidationError("Invalid PNG data: missing PNG signature.")
+        kb_size = len(decoded_data) / 1024
+        if kb_size > max_size_kb:
+            raise ValidationError("Signature image is too large.")
+    except (ValueError, base64.binascii.Error):
+        raise ValidationError("Invalid base64 data in the PNG data URL.")
+
+
+def make_data_url(size):
+    data = PNG_HEAD + os.urandom(size - len(PNG_HEAD))
+    return "data:image/png;base64," + base64.b64encode(data).decode("ascii")
+
+
+def run(label, func, value, number):
+    def call():
+        try:
+            func(value)
+        except ValidationError:
+            pass
+
+    seconds = min(timeit.repeat(call, number=number, repeat=5)) / number
+    print(f"  {label:<8} {seconds * 1e6:12.1f} us")
+
+
+def main():
+    cases = [("1 KB", 1024, 2000), ("100 KB", 100 * 1024, 200), ("10 MB", 10 * 1024 * 1024, 3)]
+    for max_size_kb in (20 * 1024, 100):
+        field = SignaturePadField(max_size_kb=max_size_kb)
+        print(f"max_size_kb={max_size_kb}")
+        for label, size, number in cases:
+            value = make_data_url(size)
+            print(f" {label}")
+            run("legacy", lambda v: legacy_validate(v, max_size_kb), value, number)
+            run("current", field.validate_png_data_url, value, number)
+
+
+if __name__ == "__main__":
+    main()
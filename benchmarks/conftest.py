@@ -0,0 +1,60 @@
+# benchmarks/conftest.py
+import random
+from io import BytesIO
+
+import django
+import pytest
+
+from signature_pad.images import encode_data_url
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:  # Pillow is needed to generate signatures
+    Image = None
+
+# (width, height, strokes): canvas sizes of a phone, a tablet and a desktop, from a
+# quick initial to a full signature with a paraph
+SIGNATURE_CASES = {
+    "phone-sparse": (360, 180, 3),
+    "tablet-medium": (768, 300, 12),
+    "desktop-dense": (1200, 400, 40),
+}
+
+
+def pytest_configure():
+    django.setup()
+
+
+def make_signature_png(width, height, strokes, seed=0):
+    """Draw random signature-like strokes on a transparent canvas, as the browser does.
+
+    Strokes are drawn at twice the size and downscaled, so edges are antialiased
+    like canvas strokes, which matters for the compressed size.
+    """
+    rng = random.Random(seed)
+    image = Image.new("RGBA", (width * 2, height * 2), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for _ in range(strokes):
+        x, y = rng.uniform(0.1, 0.9) * width * 2, rng.uniform(0.2, 0.8) * height * 2
+        points = [(x, y)]
+        for _ in range(rng.randint(10, 40)):
+            x = min(max(x + rng.gauss(12, 10), 0), width * 2)
+            y = min(max(y + rng.gauss(0, 20), 0), height * 2)
+            points.append((x, y))
+        draw.line(points, fill=(0, 0, 0, 255), width=rng.randint(3, 6), joint="curve")
+    image = image.resize((width, height), Image.LANCZOS)
+    output = BytesIO()
+    image.save(output, "PNG")
+    return output.getvalue()
+
+
+@pytest.fixture(params=list(SIGNATURE_CASES))
+def signature_png(request):
+    if Image is None:
+        pytest.skip("Pillow is not installed")
+    return make_signature_png(*SIGNATURE_CASES[request.param])
+
+
+@pytest.fixture
+def signature_data_url(signature_png):
+    return encode_data_url(signature_png)
@@ -0,0 +1,89 @@
+"""Compare event loop latency while validating signatures synchronously and asynchronously.
+
+Simulates an ASGI server handling a burst of large signature submissions next
+to lightweight requests, and reports the latency percentiles of the
+lightweight requests, which are delayed whenever validation blocks the loop.
+
+Run from the repository root:
+
+    python benchmarks/load_async.py [--signatures 200] [--size-kb 90] [--concurrency 4]
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+PNG_HEAD = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x01\x00\x00\x00\x00\x80\x08\x06\x00\x00\x00\x00\x00\x00\x00"
+
+
+def make_data_url(size):
+    data = PNG_HEAD + os.urandom(size - len(PNG_HEAD))
+    return "data:image/png;base64," + base64.b64encode(data).decode("ascii")
+
+
+async def light_requests(stop, latencies, interval=0.001):
+    """Schedule a request every interval and record how late it runs."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        latencies.append(time.perf_counter() - start - interval)
+
+
+async def run(mode, field, values):
+    latencies = []
+    stop = asyncio.Event()
+    light = asyncio.create_task(light_requests(stop, latencies))
+
+    async def submit(index, value):
+        # Submissions arrive over time, like requests, rather than all at once
+        await asyncio.sleep(index * 0.001)
+        if mode == "sync":
+            field.validate_png_data_url(value)
+        else:
+            await field.avalidate_png_data_url(value)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(submit(index, value) for index, value in enumerate(values)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await light
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    print(
+        f"  {mode:<6} total {elapsed * 1e3:8.1f} ms"
+        f"  light requests p50 {quantiles[49] * 1e3:6.2f} ms  p99 {quantiles[98] * 1e3:6.2f} ms"
+        f"  max {max(latencies) * 1e3:6.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--signatures", type=int, default=200)
+    parser.add_argument("--size-kb", type=int, default=90)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    settings.configure(SIGNATURE_PAD_MAX_WORKERS=args.concurrency, SIGNATURE_PAD_ASYNC_CONCURRENCY=args.concurrency)
+    django.setup()
+
+    from signature_pad.fields import SignaturePadField
+
+    field = SignaturePadField(max_size_kb=args.size_kb)
+    values = [make_data_url(args.size_kb * 1024) for _ in range(args.signatures)]
+    print(f"{args.signatures} signatures of {args.size_kb} KB, concurrency {args.concurrency}")
+    for mode in ("sync", "async"):
+        asyncio.run(run(mode, field, values))
+
+
+if __name__ == "__main__":
+    main()
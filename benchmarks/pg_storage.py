@@ -0,0 +1,110 @@
+"""Compare the write throughput and table size of signature columns under PostgreSQL storage settings.
+
+Creates a table per storage strategy and compression method, for data URL
+(text) and raw PNG (bytea) columns, inserts the same generated signatures in
+each, and reports the insert rate and the size of the table and its TOAST
+relation. The tables are dropped afterwards. Requires psycopg and Pillow, and
+connects with the libpq environment variables (PGHOST, PGUSER, PGPASSWORD...).
+
+Run from the repository root:
+
+    python benchmarks/pg_storage.py [--dbname postgres] [--rows 2000] [--case tablet-medium]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.db import models
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from conftest import SIGNATURE_CASES, make_signature_png  # noqa: E402
+
+# (storage, compression) settings compared, the first one being the default of text and bytea columns
+STORAGE_SETTINGS = [
+    ("extended", "pglz"),
+    ("extended", "lz4"),
+    ("main", "lz4"),
+    ("external", "default"),
+]
+BATCH_SIZE = 100
+
+
+def make_model(name, field):
+    meta = type("Meta", (), {"app_label": "signature_pad", "db_table": f"signature_pad_bench_{name.lower()}"})
+    return type(name, (models.Model,), {"__module__": __name__, "signature": field, "Meta": meta})
+
+
+def run(model, storage, compression, values):
+    from django.db import DatabaseError, connection, transaction
+
+    from signature_pad.operations import alter_column_storage
+
+    with connection.schema_editor() as editor:
+        editor.create_model(model)
+    try:
+        try:
+            with connection.schema_editor() as editor:
+                alter_column_storage(editor, model, model._meta.get_field("signature"), storage, compression)
+        except DatabaseError as e:
+            print(f"  {storage:<8} {compression:<7}  skipped: {str(e).strip()}")
+            return
+
+        start = time.perf_counter()
+        for i in range(0, len(values), BATCH_SIZE):
+            with transaction.atomic():
+                model.objects.bulk_create(model(signature=value) for value in values[i : i + BATCH_SIZE])
+        elapsed = time.perf_counter() - start
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_total_relation_size(c.oid), pg_total_relation_size(c.reltoastrelid) "
+                "FROM pg_class c WHERE c.oid = %s::regclass",
+                [model._meta.db_table],
+            )
+            total, toast = cursor.fetchone()
+        size = sum(len(value) for value in values)
+        print(
+            f"  {storage:<8} {compression:<7}  {len(values) / elapsed:8.0f} rows/s  {size / elapsed / 2**20:6.1f} MB/s"
+            f"  table {total / 2**20:7.2f} MB  toast {toast / 2**20:7.2f} MB  ({total / size:.0%} of the values)"
+        )
+    finally:
+        with connection.schema_editor() as editor:
+            editor.delete_model(model)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dbname", default="postgres")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--case", choices=sorted(SIGNATURE_CASES), default="tablet-medium")
+    args = parser.parse_args()
+
+    settings.configure(
+        DATABASES={"default": {"ENGINE": "django.db.backends.postgresql", "NAME": args.dbname}},
+        INSTALLED_APPS=["signature_pad"],
+    )
+    django.setup()
+
+    from signature_pad.fields import SignaturePadBinaryField, SignaturePadField
+    from signature_pad.images import encode_data_url
+
+    width, height, strokes = SIGNATURE_CASES[args.case]
+    pngs = [make_signature_png(width, height, strokes, seed=seed) for seed in range(args.rows)]
+    print(f"{args.rows} {args.case} signatures, {sum(map(len, pngs)) / len(pngs) / 1024:.1f} KB on average")
+    for label, field_class, values in (
+        ("data URL (text)", SignaturePadField, [encode_data_url(png) for png in pngs]),
+        ("raw PNG (bytea)", SignaturePadBinaryField, pngs),
+    ):
+        print(label)
+        for index, (storage, compression) in enumerate(STORAGE_SETTINGS):
+            model = make_model(f"{field_class.__name__}{index}", field_class(max_size_kb=1024))
+            run(model, storage, compression, values)
+
+
+if __name__ == "__main__":
+    main()
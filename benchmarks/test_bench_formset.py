@@ -0,0 +1,29 @@
+# benchmarks/test_bench_formset.py
+
+import pytest
+from django import forms
+
+from signature_pad import SignaturePadWidget
+
+FORMSET_SIZE = 200
+
+
+def make_formset(fast_render):
+    class SignatureForm(forms.Form):
+        name = forms.CharField()
+        signature = forms.CharField(widget=SignaturePadWidget(penColor="rgb(0, 0, 128)", fast_render=fast_render))
+
+    return forms.formset_factory(SignatureForm, extra=FORMSET_SIZE)()
+
+
+@pytest.mark.parametrize("fast_render", [False, True], ids=["template", "fast"])
+def test_render_formset(benchmark, fast_render):
+    """Render a formset of FORMSET_SIZE empty signature rows, with the default form layout."""
+    benchmark(str, make_formset(fast_render))
+
+
+@pytest.mark.parametrize("fast_render", [False, True], ids=["template", "fast"])
+def test_render_formset_signatures(benchmark, fast_render):
+    """Render only the signature widgets of a formset of FORMSET_SIZE rows."""
+    formset = make_formset(fast_render)
+    benchmark(lambda: [str(form["signature"]) for form in formset])
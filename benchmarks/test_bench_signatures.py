@@ -0,0 +1,59 @@
+# benchmarks/test_bench_signatures.py
+"""Benchmarks of validating, rendering and persisting signatures.
+
+Run from the repository root, and compare with the committed baseline:
+
+    python -m pytest benchmarks --benchmark-storage=benchmarks/results --benchmark-compare
+
+See DEVNOTES.md for updating the baseline.
+"""
+
+import pytest
+from django.template import Context, Template
+
+from signature_pad import SignaturePadWidget
+from tests.models import SignatureModel
+
+LIST_SIZE = 50
+
+
+@pytest.fixture
+def field():
+    return SignatureModel._meta.get_field("signature")
+
+
+def test_validate_png_data_url(benchmark, field, signature_data_url):
+    benchmark(field.validate_png_data_url, signature_data_url)
+
+
+def test_widget_get_context(benchmark, signature_data_url):
+    widget = SignaturePadWidget()
+    benchmark(widget.get_context, "signature", signature_data_url, {"id": "id_signature"})
+
+
+def test_widget_render(benchmark, signature_data_url):
+    widget = SignaturePadWidget()
+    benchmark(widget.render, "signature", signature_data_url, {"id": "id_signature"})
+
+
+@pytest.mark.django_db
+def test_model_save(benchmark, signature_data_url):
+    benchmark(SignatureModel.objects.create, signature=signature_data_url)
+
+
+@pytest.mark.django_db
+def test_model_load(benchmark, signature_data_url):
+    pk = SignatureModel.objects.create(signature=signature_data_url).pk
+    benchmark(SignatureModel.objects.get, pk=pk)
+
+
+@pytest.mark.django_db
+def test_render_list(benchmark, signature_data_url):
+    """Render a list page with LIST_SIZE inline signatures, loaded from the database."""
+    SignatureModel.objects.bulk_create(SignatureModel(signature=signature_data_url) for _ in range(LIST_SIZE))
+    template = Template('{% for obj in objects %}<img src="{{ obj.signature }}" alt="Signature">{% endfor %}')
+
+    def render():
+        return template.render(Context({"objects": SignatureModel.objects.all()}))
+
+    benchmark(render)
@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-17 09:12
+
+import signature_pad.fields
+from django.db import migrations
+from signature_pad.storage import move_to_storage
+
+
+def move_signatures_to_storage(apps, schema_editor):
+    move_to_storage(apps.get_model("demo", "Document"), "signature")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("demo", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="document",
+            name="signature",
+            field=signature_pad.fields.SignaturePadField(blank=True, null=True, storage="default"),
+        ),
+        migrations.RunPython(move_signatures_to_storage, migrations.RunPython.noop),
+    ]
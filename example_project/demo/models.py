@@ -5,7 +5,7 @@ from signature_pad import SignaturePadField
 
 class Document(models.Model):
     name = models.CharField(max_length=200)
-    signature = SignaturePadField(blank=True, null=True)
+    signature = SignaturePadField(blank=True, null=True, storage="default")
 
     def __str__(self):
         return self.name
@@ -121,6 +121,12 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Media files (signatures are saved to the default storage)
+# https://docs.djangoproject.com/en/5.1/topics/files/
+
+MEDIA_URL = "media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
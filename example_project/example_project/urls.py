@@ -1,7 +1,9 @@
 from demo.views import ClearDocumentsView, DocumentCreateView, DocumentListView
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import HttpResponse
-from django.urls import path
+from django.urls import include, path
 
 
 def favicon_view(request):
@@ -13,5 +15,6 @@ urlpatterns = [
     path("", DocumentListView.as_view(), name="document_list"),
     path("create/", DocumentCreateView.as_view(), name="document_create"),
     path("clear/", ClearDocumentsView.as_view(), name="clear_documents"),
+    path("signature-pad/", include("signature_pad.urls")),
     path("favicon.ico", favicon_view),
-]
+] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,6 +1,8 @@
-from .fields import SignaturePadField, SignaturePadWidget
+from .fields import SignaturePadBinaryField, SignaturePadField, SignaturePadStrokesField, SignaturePadWidget
 
 __all__ = [
+    "SignaturePadBinaryField",
     "SignaturePadField",
+    "SignaturePadStrokesField",
     "SignaturePadWidget",
 ]
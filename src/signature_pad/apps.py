@@ -1,7 +1,13 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class SignaturePadConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "signature_pad"
     verbose_name = "Signature Pad"
+
+    def ready(self):
+        from .assets import check_scripts
+
+        checks.register(check_scripts, checks.Tags.staticfiles)
@@ -0,0 +1,157 @@
+import json
+import re
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core import checks
+from django.forms import Media
+from django.templatetags.static import static
+from django.utils.html import format_html
+
+# Version of the signature_pad library the widget is tested with, named in the banner of the bundle
+SIGNATURE_PAD_VERSION = "5.0.4"
+WIDGET_JS = "signature_pad/js/signature_pad_widget.js"
+WIDGET_CSS = "signature_pad/css/signature_pad_widget.css"
+VENDORED_JS = "signature_pad/vendor/signature_pad.umd.min.js"
+BUNDLE_JS = "signature_pad/js/signature_pad.bundle.js"
+# Static files loaded by the widget for each value of the SIGNATURE_PAD_SCRIPTS setting
+SCRIPTS_MODES = {
+    "external": (WIDGET_JS,),
+    "vendored": (VENDORED_JS, WIDGET_JS),
+    "bundle": (BUNDLE_JS,),
+}
+# Source map comments, which ManifestStaticFilesStorage resolves and fails on when the map isn't shipped
+SOURCE_MAP_RE = re.compile(r"^\s*//[#@]\s*sourceMappingURL=.*$", re.MULTILINE)
+
+
+class DeferredScript:
+    """Script asset of a form Media, rendered with the ``defer`` attribute.
+
+    Deferred scripts are downloaded without blocking the parser and run in
+    document order once it is done, so the library still runs before the
+    widget script. The URL goes through ``static()``, so that it points to the
+    hashed file with ManifestStaticFilesStorage.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __eq__(self, other):
+        return isinstance(other, DeferredScript) and self.path == other.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path!r})"
+
+    def __html__(self):
+        return format_html('<script src="{}" defer></script>', static(self.path))
+
+
+def get_scripts_mode():
+    """Return the value of the SIGNATURE_PAD_SCRIPTS setting, "external" by default."""
+    return getattr(settings, "SIGNATURE_PAD_SCRIPTS", "external")
+
+
+def get_widget_media():
+    """Return the Media of the signature pad widget for the SIGNATURE_PAD_SCRIPTS setting.
+
+    With "external", the default, the page must load the signature_pad library
+    itself, and the widget script and stylesheet are included as before. With
+    "vendored", the copy of the library built by the ``signature_pad bundle``
+    command is loaded before the widget script, both deferred. With "bundle", a single deferred
+    script holds the library, the widget script and its styles.
+    """
+    mode = get_scripts_mode()
+    if mode == "vendored":
+        return Media(js=[DeferredScript(path) for path in SCRIPTS_MODES[mode]], css={"all": (WIDGET_CSS,)})
+    if mode == "bundle":
+        return Media(js=[DeferredScript(BUNDLE_JS)])
+    return Media(js=[WIDGET_JS], css={"all": (WIDGET_CSS,)})
+
+
+def strip_source_map(source):
+    """Remove the source map comments of a script, whose map file isn't shipped."""
+    return SOURCE_MAP_RE.sub("", source).rstrip() + "\n"
+
+
+def build_bundle(library, widget_js, widget_css):
+    """Return a single script running the library and the widget script, and adding the widget styles.
+
+    The styles are added with a ``<style>`` element in the document head, so
+    a Content Security Policy must allow inline styles for them to apply.
+
+    Args:
+        library (str): Source of the signature_pad UMD build.
+        widget_js (str): Source of the widget script.
+        widget_css (str): Source of the widget stylesheet.
+    """
+    style = (
+        "(() => {\n"
+        '  const style = document.createElement("style");\n'
+        f"  style.textContent = {json.dumps(widget_css.strip())};\n"
+        "  document.head.appendChild(style);\n"
+        "})();\n"
+    )
+    return "\n".join(
+        [
+            f"/* signature_pad {SIGNATURE_PAD_VERSION} | MIT License | github.com/szimek/signature_pad */",
+            strip_source_map(library),
+            style,
+            strip_source_map(widget_js),
+        ]
+    )
+
+
+def check_scripts(app_configs=None, **kwargs):
+    """Check that the SIGNATURE_PAD_SCRIPTS setting is valid, and that its static files are built and up to date.
+
+    The package doesn't ship the signature_pad library nor the bundle, which
+    the ``signature_pad bundle`` management command builds.
+    """
+    mode = get_scripts_mode()
+    if mode not in SCRIPTS_MODES:
+        return [
+            checks.Error(
+                f"Invalid SIGNATURE_PAD_SCRIPTS setting: {mode!r}.",
+                hint=f"Use one of: {', '.join(SCRIPTS_MODES)}.",
+                id="signature_pad.E003",
+            )
+        ]
+    if not apps.is_installed("django.contrib.staticfiles"):
+        return []
+    from django.contrib.staticfiles import finders
+
+    hint = (
+        'Build it with "manage.py signature_pad bundle --library <path to signature_pad.umd.min.js> '
+        '--output <directory of STATICFILES_DIRS>", or use SIGNATURE_PAD_SCRIPTS = "external".'
+    )
+    errors = []
+    for path in SCRIPTS_MODES[mode]:
+        found = finders.find(path)
+        if not found:
+            errors.append(
+                checks.Warning(
+                    f"The static file {path} of SIGNATURE_PAD_SCRIPTS = {mode!r} can't be found.",
+                    hint=hint,
+                    id="signature_pad.W001",
+                )
+            )
+        elif path == BUNDLE_JS and not _bundle_is_current(found):
+            errors.append(
+                checks.Warning(
+                    f"The static file {path} doesn't hold the current widget script.",
+                    hint=hint.replace("Build it", "Build it again"),
+                    id="signature_pad.W002",
+                )
+            )
+    return errors
+
+
+def _bundle_is_current(bundle_path):
+    """Return whether a bundle holds the widget script of the package, such as after an upgrade."""
+    widget_path = Path(__file__).parent / "static" / WIDGET_JS
+    bundle = Path(bundle_path).read_text(encoding="utf-8")
+    return strip_source_map(widget_path.read_text(encoding="utf-8")) in bundle
@@ -0,0 +1,38 @@
+from .fields import SignaturePadFieldMixin
+
+
+def bulk_create(model, objs, workers=None, executor="thread", **kwargs):
+    """Validate the signatures of objects and insert the valid ones with ``bulk_create``.
+
+    ``QuerySet.bulk_create`` doesn't call ``clean``, so the signature fields of
+    the objects are validated first with ``validate_many``. Invalid objects are
+    skipped and reported instead of failing the whole batch. Nor does it send
+    ``pre_save``, so the size, hash and perceptual hash fields of the valid
+    objects are updated here, as when they are saved.
+
+    Args:
+        model: The model class.
+        objs (iterable): Unsaved model instances.
+        workers (int, optional): Number of validation workers. Defaults to the
+            number of CPUs.
+        executor (str, optional): "thread" or "process". Defaults to "thread".
+        **kwargs: Arguments passed to ``QuerySet.bulk_create``, such as batch_size.
+
+    Returns:
+        tuple: The list of created objects, and a dict mapping the index of each
+            invalid object in ``objs`` to a dict of {field name: ValidationError}.
+    """
+    objs = list(objs)
+    errors = {}
+    fields = [field for field in model._meta.concrete_fields if isinstance(field, SignaturePadFieldMixin)]
+    for field in fields:
+        values = [field.value_from_object(obj) for obj in objs]
+        for index, error in enumerate(field.validate_many(values, workers=workers, executor=executor)):
+            if error is not None:
+                errors.setdefault(index, {})[field.name] = error
+    valid_objs = [obj for index, obj in enumerate(objs) if index not in errors]
+    for field in fields:
+        if field.size_field or field.hash_field or field.phash_field:
+            for obj in valid_objs:
+                field.update_metadata_fields(model, obj)
+    return model._default_manager.bulk_create(valid_objs, **kwargs), errors
@@ -0,0 +1,241 @@
+import collections
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from . import images
+
+# Rows fetched from the database per query by the exports
+EXPORT_CHUNK_SIZE = 500
+# Width of the image of a PDF page in points, and margin around it
+PDF_IMAGE_WIDTH = 400
+PDF_MARGIN = 24
+PDF_CAPTION_HEIGHT = 20
+
+
+def iter_signatures(queryset, field_name, get_name=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the (name, value) of the non-empty signatures of a queryset.
+
+    The queryset is iterated with ``iterator(chunk_size=...)``, so rows are
+    fetched a chunk at a time and not cached. Without ``get_name``, only the
+    primary key and the signature are loaded, and signatures are named after
+    the primary key.
+
+    Args:
+        queryset: The queryset of the model instances to export.
+        field_name (str): The name of the signature field.
+        get_name (callable, optional): Function returning the name of the
+            signature of an instance. The queryset must load the fields it uses.
+        chunk_size (int, optional): Number of rows fetched per query.
+    """
+    field = queryset.model._meta.get_field(field_name)
+    if get_name is None:
+        queryset = queryset.only("pk", field.attname)
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        value = getattr(instance, field.attname)
+        if value:
+            yield str(instance.pk if get_name is None else get_name(instance)), value
+
+
+def _map_ahead(func, iterable, workers):
+    """Yield ``func(item)`` for each item in order, computing up to ``2 * workers`` results ahead.
+
+    With no workers, results are computed one at a time as they are consumed.
+    """
+    if not workers:
+        yield from map(func, iterable)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="signature_pad_export") as executor:
+        pending = collections.deque()
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class _StreamBuffer:
+    """Write-only file object collecting the output of a writer until it is taken."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_zip(queryset, field_name, get_name=None, workers=0, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield a ZIP archive of the signatures of a queryset, an entry at a time.
+
+    Each signature is decoded, written as a ``<name>.png`` or ``<name>.webp``
+    entry and sent before the next one is read, so memory use doesn't depend on
+    the number of rows. Entries are stored without compression, as PNG and WebP
+    are already compressed.
+
+    Args:
+        queryset: The queryset of the model instances to export.
+        field_name (str): The name of the signature field.
+        get_name (callable, optional): Function returning the name of the
+            signature of an instance, see ``iter_signatures``.
+        workers (int, optional): Number of threads decoding signatures ahead of
+            the writer. Defaults to 0, decoding in the calling thread.
+        chunk_size (int, optional): Number of rows fetched per query.
+    """
+    field = queryset.model._meta.get_field(field_name)
+
+    def decode(item):
+        name, value = item
+        return name, field.value_to_png(value)
+
+    buffer = _StreamBuffer()
+    # Entries are dated in the current time zone, as file managers show ZIP dates as local times
+    now = timezone.localtime() if settings.USE_TZ else timezone.now()
+    date_time = now.timetuple()[:6]
+    signatures = iter_signatures(queryset, field_name, get_name, chunk_size)
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for name, data in _map_ahead(decode, signatures, workers):
+            archive.writestr(zipfile.ZipInfo(f"{name}.{images.get_image_format(data) or 'png'}", date_time), data)
+            yield buffer.take()
+    yield buffer.take()
+
+
+def stream_pdf(queryset, field_name, get_name=None, workers=0, chunk_size=EXPORT_CHUNK_SIZE):
+    """Return an iterator over a PDF document with a page per signature of a queryset, a page at a time.
+
+    Each page shows a signature on a white background, captioned with its name.
+    Pages are written as they are decoded, so memory use doesn't depend on the
+    number of rows, apart from a few bytes per page for the cross-reference
+    table written at the end. Requires Pillow.
+
+    Args:
+        queryset: The queryset of the model instances to export.
+        field_name (str): The name of the signature field.
+        get_name (callable, optional): Function returning the name of the
+            signature of an instance, see ``iter_signatures``.
+        workers (int, optional): Number of threads decoding signatures ahead of
+            the writer. Defaults to 0, decoding in the calling thread.
+        chunk_size (int, optional): Number of rows fetched per query.
+
+    Raises:
+        ImproperlyConfigured: If Pillow is not installed.
+    """
+    if images.Image is None:
+        raise ImproperlyConfigured(
+            "Pillow is required to export signatures to PDF: pip install django-signature-pad[images]"
+        )
+    field = queryset.model._meta.get_field(field_name)
+
+    def render(item):
+        name, value = item
+        return name, _get_pdf_image(field.value_to_png(value))
+
+    # Pillow is checked when called, rather than when the response starts
+    return _write_pdf(_map_ahead(render, iter_signatures(queryset, field_name, get_name, chunk_size), workers))
+
+
+def _write_pdf(pages):
+    writer = _PdfWriter()
+    yield writer.start()
+    for name, image in pages:
+        yield writer.add_page(name, *image)
+    yield writer.finish()
+
+
+def _get_pdf_image(data):
+    """Return the (width, height, compressed RGB pixels) of an image, flattened on a white background."""
+    with images.Image.open(BytesIO(data)) as image:
+        image = image.convert("RGBA")
+    page = images.Image.new("RGB", image.size, (255, 255, 255))
+    page.paste(image, mask=image.getchannel("A"))
+    return page.width, page.height, zlib.compress(page.tobytes(), 6)
+
+
+class _PdfWriter:
+    """Minimal PDF writer emitting a page at a time.
+
+    Object 1 is the catalog, 2 the page tree, written last once all pages are
+    known, and 3 the Helvetica font of the captions.
+    """
+
+    def __init__(self):
+        self.offsets = {}
+        self.position = 0
+        self.pages = []
+        self.next_number = 4
+
+    def start(self):
+        return (
+            self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+            + self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+            + self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+        )
+
+    def add_page(self, name, width, height, pixels):
+        image_number, content_number, page_number = range(self.next_number, self.next_number + 3)
+        self.next_number += 3
+        scale = min(PDF_IMAGE_WIDTH / width, 1)
+        image_width, image_height = width * scale, height * scale
+        page_width = image_width + 2 * PDF_MARGIN
+        page_height = image_height + 2 * PDF_MARGIN + PDF_CAPTION_HEIGHT
+        caption = name.encode("latin-1", "replace").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+        content = b"q %.2f 0 0 %.2f %d %d cm /Im Do Q BT /F1 10 Tf %d %d Td (%s) Tj ET" % (
+            image_width,
+            image_height,
+            PDF_MARGIN,
+            PDF_MARGIN + PDF_CAPTION_HEIGHT,
+            PDF_MARGIN,
+            PDF_MARGIN,
+            caption,
+        )
+        self.pages.append(page_number)
+        return (
+            self._stream(
+                image_number,
+                b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB "
+                b"/BitsPerComponent 8 /Filter /FlateDecode" % (width, height),
+                pixels,
+            )
+            + self._stream(content_number, b"", content)
+            + self._object(
+                page_number,
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] /Contents %d 0 R "
+                b"/Resources << /XObject << /Im %d 0 R >> /Font << /F1 3 0 R >> >> >>"
+                % (page_width, page_height, content_number, image_number),
+            )
+        )
+
+    def finish(self):
+        kids = b" ".join(b"%d 0 R" % number for number in self.pages)
+        output = self._object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.pages)))
+        xref_position = self.position
+        size = self.next_number
+        xref = [b"xref\n0 %d\n0000000000 65535 f \n" % size]
+        xref.extend(b"%010d 00000 n \n" % self.offsets[number] for number in range(1, size))
+        xref.append(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_position))
+        return output + self._write(b"".join(xref))
+
+    def _write(self, data):
+        self.position += len(data)
+        return data
+
+    def _object(self, number, body):
+        self.offsets[number] = self.position
+        return self._write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+    def _stream(self, number, dictionary, data):
+        return self._object(number, b"<< %s /Length %d >>\nstream\n%s\nendstream" % (dictionary, len(data), data))
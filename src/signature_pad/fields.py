@@ -1,18 +1,74 @@
 import base64
+import binascii
+import functools
+import hashlib
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from django.core import checks
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.core.files.storage import storages
+from django.db import models, transaction
+from django.db.models.query_utils import DeferredAttribute
+from django.db.models.signals import class_prepared, post_save, pre_save
 from django.forms import Widget
+from django.forms.renderers import get_default_renderer
+from django.forms.utils import flatatt
+from django.utils.functional import cached_property
+from django.utils.html import escape, format_html_join
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
+from . import images
+from .assets import get_widget_media
+from .operations import DB_COMPRESSIONS, DB_STORAGES
+from .images import DATA_URL_PREFIXES, PNG_HEAD_BASE64_LENGTH, PNG_IHDR_HEADER, PNG_SIGNATURE
+from .serving import get_signature_url
+from .similarity import to_signed
+from .signals import signature_rendered, signature_saved, signature_validated
+from .storage import StoredSignature, save_to_storage
+from .strokes import SignatureStrokes, parse_strokes
+from .uploads import UPLOAD_TOKEN_PREFIX, pop_upload
+
+
+# Placeholders of the markup rendered once by SignaturePadWidget.get_skeleton
+FAST_RENDER_ID = "\x00id\x00"
+FAST_RENDER_ATTRS = "\x00attrs\x00"
+FAST_RENDER_NAME = "\x00name\x00"
+FAST_RENDER_VALUE = "\x00value\x00"
+FAST_RENDER_PLACEHOLDER_RE = re.compile("\x00(?:id|attrs|name|value)\x00")
+
+
+def _send_validated(method):
+    """Send signature_validated after each call of a validation method, while it has receivers."""
+
+    @functools.wraps(method)
+    def wrapper(field, value):
+        if not signature_validated.receivers:
+            return method(field, value)
+        start = time.perf_counter()
+        try:
+            result = method(field, value)
+        except ValidationError as e:
+            duration = time.perf_counter() - start
+            signature_validated.send(
+                sender=field.__class__, field=field, size=len(value), duration=duration, code=e.code
+            )
+            raise
+        duration = time.perf_counter() - start
+        signature_validated.send(sender=field.__class__, field=field, size=len(value), duration=duration, code=None)
+        return result
+
+    return wrapper
+
 
 class SignaturePadWidget(Widget):
     """Widget for capturing handwritten signatures using the signature_pad JavaScript library.
 
     This widget renders a canvas element that allows users to draw their signature
-    with a mouse or touch input. The signature is then converted to a PNG data URL
-    and stored in a hidden input field.
+    with a mouse or touch input. The signature is then converted to a PNG data URL,
+    or to a JSON stroke payload, and stored in a hidden input field.
 
     Attributes:
         signature_pad_options (dict): Configuration options for the signature pad.
@@ -22,6 +78,33 @@ class SignaturePadWidget(Widget):
             - maxWidth: Maximum width of the signature line
             - backgroundColor: Canvas background color
             - penColor: Signature line color
+        output_format (str): "png" to submit a PNG data URL (default), or
+            "strokes" to submit the vector strokes as JSON.
+        upload_url (str): URL of the ``signature_pad:upload`` view. When set,
+            PNG signatures are uploaded as binary files before the form is
+            submitted, and the form only carries a short token.
+        lazy (bool): Create the signature pad in the browser only when it gets
+            close to the viewport or receives focus, instead of when the page
+            loads. Defaults to False.
+        max_size_kb (int): Size budget of the signature in kilobytes, set by the
+            model field. The user is asked to sign again, instead of submitting
+            the form, when the exported PNG exceeds it. Defaults to None.
+        formats (tuple): Image formats accepted by the model field, set by the
+            model field. The script exports WebP when it is accepted and the
+            browser can encode it, and PNG otherwise. Defaults to None, meaning
+            PNG only.
+        crop (bool): Crop the exported PNG to the bounds of the strokes.
+            Defaults to False.
+        output_width (int): Maximum width of the exported PNG, in pixels. Larger
+            signatures are downscaled, keeping their aspect ratio. Defaults to
+            None, exporting at the canvas resolution.
+        output_height (int): Maximum height of the exported PNG, in pixels.
+            Defaults to None.
+        fast_render (bool): Render the template once per widget, with
+            placeholders for the field name, value and attributes, and fill in
+            the placeholders on later renders instead of running the template
+            engine. Intended for formsets with many signature rows. Defaults to
+            False.
 
     Security:
         The widget itself doesn't perform validation. Security checks are
@@ -44,10 +127,34 @@ class SignaturePadWidget(Widget):
 
         Args:
             attrs (dict, optional): HTML attributes for the rendered widget.
+            output_format (str, optional): "png" or "strokes". Defaults to "png".
+            upload_url (str, optional): URL of the upload view. Defaults to None.
+            lazy (bool, optional): Initialize the signature pad lazily. Defaults
+                to False.
+            max_size_kb (int, optional): Size budget in kilobytes. Defaults to
+                None.
+            formats (tuple, optional): Accepted formats. Defaults to None.
+            crop (bool, optional): Crop to the strokes. Defaults to False.
+            output_width (int, optional): Maximum exported width. Defaults to None.
+            output_height (int, optional): Maximum exported height. Defaults to
+                None.
+            fast_render (bool, optional): Enable the fast render path. Defaults
+                to False.
             **kwargs: Additional options for the signature pad, such as dotSize,
                 minWidth, maxWidth, backgroundColor, or penColor.
         """
+        self.output_format = kwargs.pop("output_format", "png")
+        self.upload_url = kwargs.pop("upload_url", None)
+        self.lazy = kwargs.pop("lazy", False)
+        self.max_size_kb = kwargs.pop("max_size_kb", None)
+        self.formats = kwargs.pop("formats", None)
+        self.crop = kwargs.pop("crop", False)
+        self.output_width = kwargs.pop("output_width", None)
+        self.output_height = kwargs.pop("output_height", None)
+        self.fast_render = kwargs.pop("fast_render", False)
         self.signature_pad_options = self.signature_pad_options.copy()
+        # Shared with the copies of the widget made for each form, entries are checked against the options
+        self._render_cache = {}
 
         # Extract signature pad options from kwargs
         for option_name in self.signature_pad_options.keys():
@@ -56,6 +163,32 @@ class SignaturePadWidget(Widget):
 
         super().__init__(attrs, **kwargs)
 
+    def __deepcopy__(self, memo):
+        # Forms deep copy their widgets, so options changed on a form don't leak to other forms
+        obj = super().__deepcopy__(memo)
+        obj.signature_pad_options = self.signature_pad_options.copy()
+        return obj
+
+    def get_options(self):
+        """Return the options that are set, and their ``data-signature-pad-*`` attributes.
+
+        Both are computed once per widget and its copies, and cached until the
+        options change.
+
+        Returns:
+            tuple: The dict of options that are not None, and the safe string of
+                their data attributes.
+        """
+        key = tuple(self.signature_pad_options.items())
+        cached = self._render_cache.get("options")
+        if cached is None or cached[0] != key:
+            options = {k: v for k, v in key if v is not None}
+            options_attrs = format_html_join(
+                " ", 'data-signature-pad-{}="{}"', ((k.lower(), v) for k, v in options.items())
+            )
+            cached = self._render_cache["options"] = (key, options, options_attrs)
+        return cached[1:]
+
     def get_context(self, name, value, attrs):
         """Get the rendering context for the widget.
 
@@ -68,17 +201,730 @@ class SignaturePadWidget(Widget):
             dict: Context for rendering the widget template.
         """
         context = super().get_context(name, value, attrs)
-        context["widget"]["signature_pad_options"] = {
-            k: v for k, v in self.signature_pad_options.items() if v is not None
-        }
+        options, options_attrs = self.get_options()
+        context["widget"]["signature_pad_options"] = options
+        context["widget"]["signature_pad_attrs"] = options_attrs
+        context["widget"]["output_format"] = self.output_format
+        context["widget"]["upload_url"] = self.upload_url
+        context["widget"]["lazy"] = self.lazy
+        context["widget"]["max_size_kb"] = self.max_size_kb
+        context["widget"]["formats"] = self.formats
+        context["widget"]["crop"] = self.crop
+        context["widget"]["output_width"] = self.output_width
+        context["widget"]["output_height"] = self.output_height
         return context
 
-    class Media:
-        js = ("signature_pad/js/signature_pad_widget.js",)
-        css = {"all": ("signature_pad/css/signature_pad_widget.css",)}
+    def render(self, name, value, attrs=None, renderer=None):
+        if not signature_rendered.receivers:
+            return self._render_markup(name, value, attrs, renderer)
+        start = time.perf_counter()
+        html = self._render_markup(name, value, attrs, renderer)
+        signature_rendered.send(sender=self.__class__, widget=self, name=name, duration=time.perf_counter() - start)
+        return html
+
+    def _render_markup(self, name, value, attrs=None, renderer=None):
+        if not self.fast_render:
+            return super().render(name, value, attrs, renderer)
+        attrs = self.build_attrs(self.attrs, attrs)
+        replacements = {
+            FAST_RENDER_ID: escape(attrs.pop("id", "")),
+            FAST_RENDER_ATTRS: flatatt(attrs),
+            FAST_RENDER_NAME: escape(name),
+            FAST_RENDER_VALUE: escape(self.format_value(value)),
+        }
+        return mark_safe(
+            FAST_RENDER_PLACEHOLDER_RE.sub(lambda match: replacements[match[0]], self.get_skeleton(renderer))
+        )
+
+    def get_skeleton(self, renderer=None):
+        """Return the widget markup rendered with placeholders, for the fast render path.
+
+        The skeleton is cached until the options, the other widget settings or
+        the renderer change.
+        """
+        renderer = renderer or get_default_renderer()
+        key = (
+            renderer,
+            tuple(self.signature_pad_options.items()),
+            self.output_format,
+            str(self.upload_url),
+            self.lazy,
+            self.max_size_kb,
+            self.formats,
+            self.crop,
+            self.output_width,
+            self.output_height,
+        )
+        cached = self._render_cache.get("skeleton")
+        if cached is None or cached[0] != key:
+            context = self.get_context(FAST_RENDER_NAME, FAST_RENDER_VALUE, None)
+            context["widget"]["attrs"] = {"id": FAST_RENDER_ID, FAST_RENDER_ATTRS: True}
+            cached = self._render_cache["skeleton"] = (key, renderer.render(self.template_name, context))
+        return cached[1]
+
+    @property
+    def media(self):
+        # Depends on the SIGNATURE_PAD_SCRIPTS setting, see assets.get_widget_media()
+        return get_widget_media()
+
+
+class SignatureDescriptor(DeferredAttribute):
+    """Attach the signatures read from model instances to them, so that they have a ``url``.
+
+    Data URLs and raw bytes are wrapped in SignatureDataURL and SignatureBytes
+    on first access, and the wrapped value replaces the original one in the
+    instance. Stored signatures are returned unchanged, as their ``url`` is
+    the URL of the file in the storage.
+    """
+
+    def __get__(self, instance, cls=None):
+        value = super().__get__(instance, cls)
+        if instance is None:
+            return value
+        if not isinstance(value, SignatureDataURL | SignatureBytes):
+            if isinstance(value, str) and not isinstance(value, StoredSignature) and value.startswith("data:"):
+                value = SignatureDataURL(value)
+            elif isinstance(value, bytes | bytearray | memoryview):
+                value = SignatureBytes(value)
+            else:
+                return value
+            instance.__dict__[self.field.attname] = value
+        if value.instance is not instance:
+            value.instance, value.field_name = instance, self.field.name
+        return value
+
+    def __set__(self, instance, value):
+        # Defined so that values in the instance dict go through __get__
+        instance.__dict__[self.field.attname] = value
+
+
+class SignaturePadFieldMixin:
+    """Validation and form handling shared by the signature pad model fields.
+
+    Attributes:
+        max_size_kb (int): Maximum allowed size for the signature in kilobytes.
+            Defaults to 100KB.
+        optimize (bool): Whether to trim signatures to their ink and recompress
+            them with a small palette when saving. Requires Pillow. Defaults to False.
+        optimize_colors (int): Palette size of optimized signatures. Defaults to 4.
+        optimize_in_background (bool): Whether to optimize signatures in a thread
+            pool after the transaction commits, instead of during save. Defaults
+            to False.
+        defer_by_default (bool): Whether to defer loading the field in querysets
+            of the model's default manager. Defaults to False.
+        size_field (str): Name of a model field updated with the size of the PNG
+            in bytes when the instance is saved, similar to ImageField's
+            width_field.
+        hash_field (str): Name of a model field updated with the SHA-256 hex
+            digest of the PNG when the instance is saved.
+        phash_field (str): Name of a BigIntegerField updated with the
+            perceptual hash of the signature when the instance is cleaned or
+            saved, for the similarity search of signature_pad.similarity.
+            Requires Pillow.
+        formats (tuple): Accepted image formats, among "png" and "webp".
+            Defaults to ("png",). The widget submits WebP when it is accepted
+            and the browser can encode it, as lossless WebP is usually smaller
+            than PNG for line art.
+        max_width (int): Maximum width of the signature image in pixels.
+            Defaults to None (no limit).
+        max_height (int): Maximum height of the signature image in pixels.
+            Defaults to None (no limit).
+        max_pixels (int): Maximum number of pixels of the signature image.
+            Defaults to None (no limit). Dimensions are read from the image
+            header, so oversized images are rejected before decoding the payload.
+        verify_data (bool): Whether to inflate the compressed data of PNG
+            signatures and check it matches the declared dimensions. Memory use
+            is bounded, so decompression bombs are rejected without decoding
+            the image. Defaults to False.
+        db_storage (str): PostgreSQL storage strategy of the column, among
+            "plain", "main", "external" and "extended". Defaults to None,
+            keeping the default of the column type.
+        db_compression (str): PostgreSQL compression method of the column,
+            "pglz" or "lz4". Defaults to None, keeping the server default.
+            Both options are applied by the AlterSignatureStorage migration
+            operation, see signature_pad.operations.
+    """
+
+    descriptor_class = SignatureDescriptor
+    # Applied by AlterSignatureStorage rather than by AlterField
+    non_db_attrs = (*models.Field.non_db_attrs, "db_storage", "db_compression")
+
+    def __init__(self, *args, **kwargs):
+        self.max_size_kb = kwargs.pop("max_size_kb", 100)  # Default max size: 100KB
+        self.formats = tuple(kwargs.pop("formats", ("png",)))
+        self.optimize = kwargs.pop("optimize", False)
+        self.optimize_colors = kwargs.pop("optimize_colors", 4)
+        self.optimize_in_background = kwargs.pop("optimize_in_background", False)
+        self.defer_by_default = kwargs.pop("defer_by_default", False)
+        self.size_field = kwargs.pop("size_field", None)
+        self.hash_field = kwargs.pop("hash_field", None)
+        self.phash_field = kwargs.pop("phash_field", None)
+        self.max_width = kwargs.pop("max_width", None)
+        self.max_height = kwargs.pop("max_height", None)
+        self.max_pixels = kwargs.pop("max_pixels", None)
+        self.verify_data = kwargs.pop("verify_data", False)
+        self.db_storage = kwargs.pop("db_storage", None)
+        self.db_compression = kwargs.pop("db_compression", None)
+        super().__init__(*args, **kwargs)
+
+    def check(self, **kwargs):
+        return [
+            *super().check(**kwargs),
+            *self._check_optimize(),
+            *self._check_formats(),
+            *self._check_db_storage(),
+            *self._check_phash(),
+        ]
+
+    def get_db_prep_save(self, value, connection):
+        value = super().get_db_prep_save(value, connection)
+        if value and signature_saved.receivers:
+            signature_saved.send(sender=self.model, field=self, size=len(value))
+        return value
+
+    def _check_optimize(self):
+        if self.optimize and images.Image is None:
+            return [
+                checks.Error(
+                    f"Cannot use {self.__class__.__name__}(optimize=True) because Pillow is not installed.",
+                    hint="Get Pillow at https://pypi.org/project/Pillow/ or run command "
+                    '"python -m pip install django-signature-pad[images]".',
+                    obj=self,
+                    id="signature_pad.E001",
+                )
+            ]
+        return []
+
+    def _check_phash(self):
+        if self.phash_field and images.Image is None:
+            return [
+                checks.Error(
+                    f"Cannot use {self.__class__.__name__}(phash_field=...) because Pillow is not installed.",
+                    hint="Get Pillow at https://pypi.org/project/Pillow/ or run command "
+                    '"python -m pip install django-signature-pad[images]".',
+                    obj=self,
+                    id="signature_pad.E006",
+                )
+            ]
+        return []
+
+    def _check_formats(self):
+        unsupported = [image_format for image_format in self.formats if image_format not in DATA_URL_PREFIXES]
+        if unsupported or not self.formats:
+            return [
+                checks.Error(
+                    f"Unsupported signature formats: {unsupported or self.formats}.",
+                    hint=f"Use one or more of: {', '.join(DATA_URL_PREFIXES)}.",
+                    obj=self,
+                    id="signature_pad.E002",
+                )
+            ]
+        return []
+
+    def _check_db_storage(self):
+        errors = []
+        if self.db_storage is not None and self.db_storage not in DB_STORAGES:
+            errors.append(
+                checks.Error(
+                    f"Unsupported db_storage: {self.db_storage!r}.",
+                    hint=f"Use one of: {', '.join(DB_STORAGES)}.",
+                    obj=self,
+                    id="signature_pad.E004",
+                )
+            )
+        if self.db_compression is not None and self.db_compression not in DB_COMPRESSIONS:
+            errors.append(
+                checks.Error(
+                    f"Unsupported db_compression: {self.db_compression!r}.",
+                    hint=f"Use one of: {', '.join(DB_COMPRESSIONS)}.",
+                    obj=self,
+                    id="signature_pad.E005",
+                )
+            )
+        return errors
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.max_size_kb != 100:
+            kwargs["max_size_kb"] = self.max_size_kb
+        if self.formats != ("png",):
+            kwargs["formats"] = self.formats
+        if self.optimize:
+            kwargs["optimize"] = True
+        if self.optimize_colors != 4:
+            kwargs["optimize_colors"] = self.optimize_colors
+        if self.optimize_in_background:
+            kwargs["optimize_in_background"] = True
+        if self.defer_by_default:
+            kwargs["defer_by_default"] = True
+        if self.size_field:
+            kwargs["size_field"] = self.size_field
+        if self.hash_field:
+            kwargs["hash_field"] = self.hash_field
+        if self.phash_field:
+            kwargs["phash_field"] = self.phash_field
+        for option in ("max_width", "max_height", "max_pixels"):
+            if getattr(self, option) is not None:
+                kwargs[option] = getattr(self, option)
+        if self.verify_data:
+            kwargs["verify_data"] = True
+        for option in ("db_storage", "db_compression"):
+            if getattr(self, option) is not None:
+                kwargs[option] = getattr(self, option)
+        return name, path, args, kwargs
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+        if cls._meta.abstract:
+            return
+        if self.optimize and self.optimize_in_background:
+            post_save.connect(self.schedule_optimization, sender=cls)
+        if self.size_field or self.hash_field or self.phash_field:
+            pre_save.connect(self.update_metadata_fields, sender=cls)
+        if self.defer_by_default:
+            class_prepared.connect(self.defer_on_default_manager, sender=cls, weak=False)
+        # Attributes and fields of the model with the same name are left as is
+        if not hasattr(cls, f"{self.name}_info"):
+            setattr(cls, f"{self.name}_info", property(lambda instance: SignatureInfo(instance, self)))
+
+    def defer_on_default_manager(self, sender, **kwargs):
+        """Defer the field in querysets of the model's default manager.
+
+        The class of the default manager is replaced with a subclass whose
+        ``get_queryset`` defers the field. The subclass keeps the name and module
+        of the original class, so migrations still reference the original one.
+        The base manager, used for related objects and refresh_from_db, is left
+        unchanged.
+        """
+        manager = sender._meta.default_manager
+        if manager is None:
+            return
+        field_name = self.name
+
+        class DeferringManager(manager.__class__):
+            def get_queryset(self):
+                return super().get_queryset().defer(field_name)
+
+        DeferringManager.__name__ = manager.__class__.__name__
+        DeferringManager.__qualname__ = manager.__class__.__qualname__
+        DeferringManager.__module__ = manager.__class__.__module__
+        manager.__class__ = DeferringManager
+
+    def update_metadata_fields(self, sender, instance, raw=False, **kwargs):
+        """Update the size, hash and perceptual hash fields of an instance before it is saved.
+
+        Connected to ``pre_save`` when ``size_field``, ``hash_field`` or
+        ``phash_field`` is set. The value is converted as in ``pre_save`` first,
+        so that the metadata describes the PNG actually saved. Nothing is done
+        when the field is deferred, or when a stored signature already matches
+        the hash field.
+        """
+        if raw or self.attname not in instance.__dict__:
+            return
+        parsed = instance.__dict__[self.attname]
+        value = self.pre_save(instance, add=False)
+        if isinstance(value, StoredSignature) and self.hash_field:
+            if getattr(instance, self.hash_field) == value.digest:
+                return
+        # Images parsed by the form field are saved as is unless optimized
+        if isinstance(parsed, SignatureImage) and not (self.optimize and not self.optimize_in_background):
+            data, digest = parsed, parsed.digest
+        else:
+            data = images.get_image_bytes(value) if value else b""
+            digest = hashlib.sha256(data).hexdigest()
+        if self.size_field:
+            setattr(instance, self.size_field, len(data) if value else None)
+        if self.hash_field:
+            setattr(instance, self.hash_field, digest if value else "")
+        if self.phash_field:
+            self.update_phash_field(instance, data if value else None, digest)
+
+    def update_phash_field(self, instance, data, digest):
+        """Set the perceptual hash field of an instance from the image bytes of its signature.
+
+        The digest of the last image hashed is kept on the instance, so that an
+        image hashed in ``clean`` isn't decoded again on save, nor an unchanged
+        signature when the instance is saved again.
+        """
+        hashed = instance.__dict__.setdefault("_signature_phash_digests", {})
+        if data is None:
+            setattr(instance, self.phash_field, None)
+        elif hashed.get(self.attname) != digest:
+            setattr(instance, self.phash_field, to_signed(images.perceptual_hash(data)))
+        hashed[self.attname] = digest if data is not None else None
+
+    def optimize_png(self, data):
+        """Return the optimized PNG bytes of a signature.
+
+        Signatures that are already palette images are returned unchanged, so
+        that saving an instance again doesn't process its signature again, and
+        so are WebP signatures.
+        """
+        if not data.startswith(PNG_SIGNATURE) or images.is_palette_png(data):
+            return data
+        return images.optimize_png(data, colors=self.optimize_colors)
+
+    def schedule_optimization(self, sender, instance, raw=False, using=None, **kwargs):
+        """Optimize the signature of a saved instance in the background.
+
+        Connected to ``post_save`` when ``optimize_in_background`` is set. The
+        optimization runs in a thread pool once the transaction is committed.
+        """
+        value = getattr(instance, self.attname)
+        if raw or not value:
+            return
+        transaction.on_commit(
+            lambda: images.run_in_background(self.optimize_saved, sender, instance.pk, value, using),
+            using=using,
+        )
+
+    def optimize_saved(self, model, pk, value, using=None):
+        """Optimize the signature of a saved row and update it.
+
+        The row is only updated if its signature is still ``value``, so that
+        a signature changed in the meantime is never overwritten. The size,
+        hash and perceptual hash fields are updated in the same query.
+        """
+        data = self.value_to_png(value)
+        optimized = self.optimize_png(data)
+        if optimized is data:
+            return
+        updates = {self.attname: self.png_to_value(optimized)}
+        if self.size_field:
+            updates[self.size_field] = len(optimized)
+        if self.hash_field:
+            updates[self.hash_field] = hashlib.sha256(optimized).hexdigest()
+        if self.phash_field:
+            updates[self.phash_field] = to_signed(images.perceptual_hash(optimized))
+        model._default_manager.using(using).filter(pk=pk, **{self.attname: value}).update(**updates)
+
+    def formfield(self, **kwargs):
+        """Return a form field appropriate for this model field.
+
+        Args:
+            **kwargs: Additional arguments to pass to the form field.
+
+        The form field defaults to SignaturePadFormField, validating with this
+        field. A SignaturePadWidget passed in, such as from ``Meta.widgets`` of
+        a model form, is kept and gets the size budget and the formats of the
+        field unless it has its own. Other widgets, such as the
+        AdminTextareaWidget the admin passes for text fields, are replaced with
+        SignaturePadWidget.
+
+        Returns:
+            django.forms.Field: A form field instance configured with
+                SignaturePadWidget as the widget.
+        """
+        # The forms module imports the widget from this module
+        from .forms import SignaturePadFormField
+
+        widget = kwargs.get("widget")
+        if isinstance(widget, type) and issubclass(widget, SignaturePadWidget):
+            widget = widget()
+        if not isinstance(widget, SignaturePadWidget):
+            widget = SignaturePadWidget()
+        if widget.max_size_kb is None:
+            widget.max_size_kb = self.max_size_kb
+        if widget.formats is None:
+            widget.formats = self.formats
+        kwargs["widget"] = widget
+        form_class = kwargs.setdefault("form_class", SignaturePadFormField)
+        if issubclass(form_class, SignaturePadFormField):
+            kwargs.setdefault("signature_field", self)
+        return super().formfield(**kwargs)
+
+    def validate_png_data_url(self, value):
+        """Validate that the value is a properly formatted PNG data URL.
+
+        Performs multiple security checks to ensure the data is safe:
+        1. Verifies the correct data URL format for PNG
+        2. Enforces size limitations
+        3. Confirms the presence of the PNG file signature
+        4. Validates the base64 encoding is properly formatted
+
+        WebP data URLs are accepted as well when enabled by ``formats``, with the
+        RIFF header checked instead of the PNG signature.
+
+        Args:
+            value (str): The PNG data URL to validate.
+
+        Raises:
+            ValidationError: If any validation check fails, with a specific
+                error message describing the issue.
+        """
+        if not value:
+            return
+
+        self.decode_png_data_url(value)
+
+    async def avalidate_png_data_url(self, value):
+        """Asynchronous version of validate_png_data_url.
+
+        Decoding runs in the signature pad thread pool, see
+        ``signature_pad.images.run_in_executor``.
+        """
+        if not value:
+            return
+
+        await images.run_in_executor(self.decode_png_data_url, value)
+
+    @_send_validated
+    def decode_png_data_url(self, value):
+        """Validate a PNG data URL and return the decoded PNG bytes.
+
+        Checks are ordered from cheapest to most expensive, so that oversized or
+        malformed payloads are rejected before the full payload is decoded:
+        the prefix and the encoded length are checked first, then only the head
+        of the payload is decoded to check the PNG signature and IHDR chunk, and
+        finally the whole payload is decoded once in strict mode.
+
+        Args:
+            value (str): The PNG data URL to decode.
+
+        Returns:
+            bytes: The decoded PNG data.
+
+        Raises:
+            ValidationError: If any validation check fails.
+        """
+        # Check for correct data URL format for the accepted formats
+        image_format = next((f for f in self.formats if value.startswith(DATA_URL_PREFIXES.get(f, "\n"))), None)
+        if image_format is None or len(value) == len(DATA_URL_PREFIXES[image_format]):
+            raise self._format_error()
+        prefix_length = len(DATA_URL_PREFIXES[image_format])
+
+        # Check size from the encoded length, before decoding anything
+        encoded_size = len(value) - prefix_length
+        if encoded_size % 4:
+            raise self._base64_error(image_format)
+        self._check_size(encoded_size // 4 * 3 - value.endswith("=") - value.endswith("=="))
+
+        try:
+            # Check for the image header, decoding only the head of the data
+            head = base64.b64decode(value[prefix_length : prefix_length + PNG_HEAD_BASE64_LENGTH], validate=True)
+            self._check_image_head(head, image_format)
+
+            # Validate it's proper base64
+            data = base64.b64decode(value[prefix_length:], validate=True)
+
+        except (ValueError, binascii.Error):
+            raise self._base64_error(image_format)
+
+        self._check_image_data(data, image_format)
+        return data
+
+    @_send_validated
+    def validate_png(self, data):
+        """Validate raw PNG bytes, with the same checks as PNG data URLs.
+
+        WebP bytes are accepted as well when enabled by ``formats``.
+
+        Args:
+            data (bytes): The PNG data.
+
+        Raises:
+            ValidationError: If any validation check fails.
+        """
+        self._check_size(len(data))
+        image_format = images.get_image_format(data)
+        if image_format not in self.formats:
+            if self.formats != ("png",):
+                raise self._format_error()
+            image_format = "png"
+        self._check_image_head(bytes(data[:33]), image_format)
+        self._check_image_data(data, image_format)
+
+    def clean_image(self, value, model_instance):
+        """Clean a SignatureImage parsed by SignaturePadFormField, without validating the image again."""
+        self.validate(value, model_instance)
+        self.run_validators(value)
+        if self.phash_field and model_instance is not None:
+            self.update_phash_field(model_instance, value, value.digest)
+        return value
+
+    def get_uploaded_png(self, value):
+        """Return the validated image bytes of a token returned by the upload view.
+
+        The upload is deleted from the cache, so each token is resolved once.
+
+        Args:
+            value (str): The upload token value posted by SignaturePadWidget.
+
+        Raises:
+            ValidationError: If the upload expired or fails validation.
+        """
+        data = pop_upload(value)
+        if data is None:
+            raise ValidationError(_("The signature upload has expired, please sign again."), code="upload")
+        self.validate_png(data)
+        return data
+
+    def _check_size(self, size):
+        kb_size = size / 1024
+        if kb_size > self.max_size_kb:
+            raise ValidationError(
+                _("Signature image is too large (%(size).2f KB). Maximum allowed size is %(max_size)d KB."),
+                params={"size": kb_size, "max_size": self.max_size_kb},
+                code="size",
+            )
+
+    def _check_png_head(self, head):
+        if not head.startswith(PNG_SIGNATURE):
+            raise ValidationError(_("Invalid PNG data: missing PNG signature."), code="signature")
+        if head[8:16] != PNG_IHDR_HEADER:
+            raise ValidationError(_("Invalid PNG data: missing IHDR chunk."), code="header")
+
+    def _check_image_head(self, head, image_format):
+        if image_format == "png":
+            self._check_png_head(head)
+        elif images.get_image_format(head) != image_format:
+            raise ValidationError(_("Invalid WebP data: missing RIFF header."), code="signature")
+        dimensions = images.get_dimensions(head)
+        if not dimensions or not all(dimensions):
+            raise ValidationError(
+                _("Invalid %(format)s data: missing image dimensions."),
+                params={"format": images.FORMAT_NAMES[image_format]},
+                code="header",
+            )
+        self._check_dimensions(*dimensions)
+
+    def _check_dimensions(self, width, height):
+        if (self.max_width and width > self.max_width) or (self.max_height and height > self.max_height):
+            raise ValidationError(
+                _("Signature image is too large (%(width)d×%(height)d). Maximum allowed dimensions are %(limit)s."),
+                params={
+                    "width": width,
+                    "height": height,
+                    "limit": f"{self.max_width or '∞'}×{self.max_height or '∞'}",
+                },
+                code="dimensions",
+            )
+        if self.max_pixels and width * height > self.max_pixels:
+            raise ValidationError(
+                _("Signature image is too large (%(pixels)d pixels). Maximum allowed is %(max_pixels)d pixels."),
+                params={"pixels": width * height, "max_pixels": self.max_pixels},
+                code="dimensions",
+            )
+
+    def _check_image_data(self, data, image_format):
+        if not self.verify_data or image_format != "png":
+            return
+        error = images.verify_png_data(data)
+        if error == "too_large":
+            raise ValidationError(_("Invalid PNG data: image data exceeds the declared dimensions."), code="data")
+        if error:
+            raise ValidationError(_("Invalid PNG data: corrupt or truncated image data."), code="data")
+
+    def _format_error(self):
+        if self.formats == ("png",):
+            return ValidationError(_("Invalid PNG data URL format."), code="format")
+        return ValidationError(
+            _("Invalid image data URL format. Accepted formats: %(formats)s."),
+            params={"formats": ", ".join(images.FORMAT_NAMES[f] for f in self.formats)},
+            code="format",
+        )
+
+    def _base64_error(self, image_format):
+        return ValidationError(
+            _("Invalid base64 data in the %(format)s data URL."),
+            params={"format": images.FORMAT_NAMES[image_format]},
+            code="base64",
+        )
+
+    def validate_signature(self, value):
+        """Validate a PNG data URL or raw PNG bytes.
+
+        Signatures already saved to storage are not validated again.
+
+        Raises:
+            ValidationError: If any validation check fails.
+        """
+        if isinstance(value, StoredSignature) or not value:
+            return
+        if isinstance(value, bytes | bytearray | memoryview):
+            self.validate_png(value)
+        else:
+            self.validate_png_data_url(value)
+
+    async def avalidate_signature(self, value):
+        """Asynchronous version of validate_signature."""
+        if isinstance(value, StoredSignature) or not value:
+            return
+        await images.run_in_executor(self.validate_signature, value)
+
+    def validate_many(self, values, workers=None, executor="thread"):
+        """Validate many signatures in parallel, without stopping at the first error.
+
+        Intended for imports and ``bulk_create``, which don't call ``clean``.
+
+        Args:
+            values (iterable): PNG data URLs or raw PNG bytes.
+            workers (int, optional): Number of workers. Defaults to the number
+                of CPUs.
+            executor (str, optional): "thread" or "process". Base64 decoding
+                holds the GIL, so a process pool scales better on large batches,
+                at the cost of copying the values to the worker processes,
+                which set up Django from DJANGO_SETTINGS_MODULE. Defaults to
+                "thread".
+
+        Returns:
+            list: For each value, in order, None if it is valid, or the
+                ValidationError raised by its validation.
+        """
+        if executor == "process":
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=images.setup_worker_process)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+        with pool:
+            return list(pool.map(functools.partial(_validate_signature, self), values, chunksize=64))
 
 
-class SignaturePadField(models.TextField):
+def _validate_signature(field, value):
+    """Validate a signature with a field, returning the error instead of raising it."""
+    try:
+        field.validate_signature(value)
+    except ValidationError as e:
+        return e
+    return None
+
+
+class SignatureInfo:
+    """Metadata of a signature, read from the size and hash fields of an instance.
+
+    Available as ``<field name>_info`` on instances, so that list views can
+    tell whether a signature is present without loading a deferred field. When
+    the model has neither a size field nor a hash field, the signature itself
+    is loaded.
+    """
+
+    def __init__(self, instance, field):
+        self.instance = instance
+        self.field = field
+
+    @property
+    def size(self):
+        """int: The size of the PNG in bytes, or None without a size field."""
+        return getattr(self.instance, self.field.size_field) if self.field.size_field else None
+
+    @property
+    def hash(self):
+        """str: The SHA-256 hex digest of the PNG, or None without a hash field."""
+        return getattr(self.instance, self.field.hash_field) if self.field.hash_field else None
+
+    @property
+    def has_signature(self):
+        """bool: Whether the instance has a signature."""
+        if self.field.size_field:
+            return bool(self.size)
+        if self.field.hash_field:
+            return bool(self.hash)
+        return bool(getattr(self.instance, self.field.attname))
+
+    def __bool__(self):
+        return self.has_signature
+
+
+class SignaturePadField(SignaturePadFieldMixin, models.TextField):
     """Django model field for storing handwritten signatures as PNG data URLs.
 
     This field stores signatures as base64-encoded PNG data URLs and provides
@@ -87,6 +933,11 @@ class SignaturePadField(models.TextField):
     Attributes:
         max_size_kb (int): Maximum allowed size for the signature in kilobytes.
             Defaults to 100KB.
+        storage (django.core.files.storage.Storage): Optional storage backend.
+            When set, the decoded PNG is written to the storage under a
+            content-addressed key and only the key is kept in the database.
+        upload_to (str): Directory prefix of the keys in the storage.
+            Defaults to "signatures".
 
     Security Controls:
         1. Format Validation: Ensures the data follows the exact format
@@ -108,83 +959,390 @@ class SignaturePadField(models.TextField):
         Args:
             max_size_kb (int, optional): Maximum allowed size for the signature
                 in kilobytes. Defaults to 100KB.
+            storage (optional): A storage instance, a callable returning one, or
+                the alias of a storage defined in the STORAGES setting. Defaults
+                to None, which stores signatures inline as data URLs.
+            upload_to (str, optional): Directory prefix of the keys in the
+                storage. Defaults to "signatures".
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
-        self.max_size_kb = kwargs.pop("max_size_kb", 100)  # Default max size: 100KB
+        self._storage = kwargs.pop("storage", None)
+        self.upload_to = kwargs.pop("upload_to", "signatures")
         super().__init__(*args, **kwargs)
 
-    def formfield(self, **kwargs):
-        """Return a form field appropriate for this model field.
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self._storage is not None:
+            kwargs["storage"] = self._storage
+            if self.upload_to != "signatures":
+                kwargs["upload_to"] = self.upload_to
+        return name, path, args, kwargs
+
+    @cached_property
+    def storage(self):
+        """The storage backend of the field, or None for inline data URLs."""
+        if isinstance(self._storage, str):
+            return storages[self._storage]
+        if callable(self._storage):
+            return self._storage()
+        return self._storage
+
+    def store(self, data):
+        """Write PNG bytes to the field's storage.
 
         Args:
-            **kwargs: Additional arguments to pass to the form field.
+            data (bytes): The PNG data.
 
         Returns:
-            django.forms.Field: A form field instance configured with
-                SignaturePadWidget as the widget.
+            StoredSignature: The stored signature, whose key is kept in the database.
         """
-        kwargs["widget"] = SignaturePadWidget()
-        return super().formfield(**kwargs)
+        return save_to_storage(self.storage, self.upload_to, data)
 
-    def validate_png_data_url(self, value):
-        """Validate that the value is a properly formatted PNG data URL.
+    def value_to_png(self, value):
+        """Return the image bytes of a data URL or a stored signature, as saved."""
+        if isinstance(value, StoredSignature):
+            return value.read()
+        return images.decode_data_url(value)
 
-        Performs multiple security checks to ensure the data is safe:
-        1. Verifies the correct data URL format for PNG
-        2. Validates the base64 encoding is properly formatted
-        3. Confirms the presence of the PNG file signature
-        4. Enforces size limitations
+    def png_to_value(self, data):
+        """Return the database value for PNG bytes: a storage key or a data URL."""
+        if self.storage is not None:
+            return self.store(data)
+        return images.encode_data_url(data)
+
+    def from_db_value(self, value, expression, connection):
+        if value and self.storage is not None:
+            return StoredSignature(value, self.storage)
+        return value
+
+    def pre_save(self, model_instance, add):
+        value = super().pre_save(model_instance, add)
+        optimize = self.optimize and not self.optimize_in_background
+        # Uploaded signatures are resolved to PNG bytes by clean
+        if isinstance(value, bytes):
+            value = self.png_to_value(self.optimize_png(value) if optimize and value else bytes(value))
+            setattr(model_instance, self.attname, value)
+            return value
+        if value and value.startswith("data:") and optimize and images.is_palette_data_url(value):
+            optimize = False
+        if value and value.startswith("data:") and (self.storage is not None or optimize):
+            data = images.decode_data_url(value)
+            if optimize:
+                data = self.optimize_png(data)
+            value = self.png_to_value(data)
+            setattr(model_instance, self.attname, value)
+        return value
+
+    def clean(self, value, model_instance):
+        """Validate the signature data before saving to the database.
 
         Args:
             value (str): The PNG data URL to validate.
+            model_instance: The model instance the field belongs to.
+
+        Returns:
+            str: The validated value.
 
         Raises:
-            ValidationError: If any validation check fails, with a specific
-                error message describing the issue.
+            ValidationError: If any validation check fails.
         """
-        if not value:
-            return
+        # Parsed and validated by SignaturePadFormField
+        if isinstance(value, SignatureImage):
+            return self.clean_image(value, model_instance)
+        value = super().clean(value, model_instance)
+        if value and value.startswith(UPLOAD_TOKEN_PREFIX):
+            return SignatureBytes(self.get_uploaded_png(value))
+        # Signatures already saved to storage were validated before being stored
+        if not isinstance(value, StoredSignature):
+            self.validate_png_data_url(value)
+        return value
 
-        # Check for correct data URL format for PNG
-        if not re.match(r"^data:image/png;base64,[A-Za-z0-9+/]+=*$", value):
-            raise ValidationError(_("Invalid PNG data URL format."))
 
-        try:
-            # Extract the base64 data part
-            header, base64_data = value.split(",", 1)
+class SignatureValueMixin:
+    """URL of a signature read from a model instance, through SignatureDescriptor.
 
-            # Validate it's proper base64
-            decoded_data = base64.b64decode(base64_data)
-
-            # Check for PNG signature in the decoded data
-            if not decoded_data.startswith(b"\x89PNG\r\n\x1a\n"):
-                raise ValidationError(_("Invalid PNG data: missing PNG signature."))
-
-            # Check size
-            kb_size = len(decoded_data) / 1024
-            if kb_size > self.max_size_kb:
-                raise ValidationError(
-                    _("Signature image is too large (%(size).2f KB). Maximum allowed size is %(max_size)d KB."),
-                    params={"size": kb_size, "max_size": self.max_size_kb},
-                )
+    Attributes:
+        instance: The model instance the signature was read from.
+        field_name (str): The name of the signature field.
+    """
+
+    instance = None
+    field_name = None
+
+    @property
+    def url(self):
+        """str: The URL of the view serving the signature, see ``get_signature_url``."""
+        if self.instance is None:
+            raise ValueError("The signature isn't attached to a model instance.")
+        return get_signature_url(self.instance, self.field_name)
+
+
+class SignatureDataURL(SignatureValueMixin, str):
+    """PNG or WebP data URL of a signature stored inline by SignaturePadField.
+
+    The value is the data URL itself, for ``<img src="{{ obj.signature }}">``,
+    and its ``url`` is the URL of the view serving the image, which browsers
+    can cache across pages.
+    """
+
+    def __reduce__(self):
+        # The instance is attached again when the value is read from it
+        return self.__class__, (str(self),)
+
+
+class SignatureBytes(SignatureValueMixin, bytes):
+    """Raw PNG or WebP bytes of a signature stored by SignaturePadBinaryField.
+
+    Converting the value to a string returns a data URL, so templates such as
+    ``<img src="{{ obj.signature }}">`` keep working. The data URL is only
+    encoded when first accessed. The ``url`` of values read from an instance is
+    the URL of the view serving the image.
+    """
+
+    def __reduce__(self):
+        return self.__class__, (bytes(self),)
+
+    @property
+    def image_bytes(self):
+        """bytes: The image data."""
+        return bytes(self)
+
+    @property
+    def png_bytes(self):
+        """bytes: The image data, transcoded to PNG if needed."""
+        return images.to_png(bytes(self))
+
+    @cached_property
+    def data_url(self):
+        """str: The image data encoded as a data URL."""
+        return images.encode_data_url(self)
+
+    def __str__(self):
+        return self.data_url
+
+
+class SignatureImage(SignatureBytes):
+    """Validated signature image, as parsed by SignaturePadFormField.
+
+    The value holds the image bytes decoded from the submitted data URL or
+    upload, along with their format, dimensions and hash, so that the model
+    field and later processing don't decode the submission again. Signature
+    model fields accept it without validating it again.
+    """
 
-        except (ValueError, base64.binascii.Error):
-            raise ValidationError(_("Invalid base64 data in the PNG data URL."))
+    def __new__(cls, data):
+        obj = super().__new__(cls, data)
+        obj._format = images.get_image_format(data)
+        obj._dimensions = images.get_dimensions(data[:33]) or (0, 0)
+        return obj
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.format} {self.width}×{self.height}, {len(self)} bytes>"
+
+    @property
+    def format(self):
+        """str: The image format, "png" or "webp"."""
+        return self._format
+
+    @property
+    def width(self):
+        """int: The width of the image in pixels, from its header."""
+        return self._dimensions[0]
+
+    @property
+    def height(self):
+        """int: The height of the image in pixels, from its header."""
+        return self._dimensions[1]
+
+    @cached_property
+    def digest(self):
+        """str: The SHA-256 hex digest of the image."""
+        return hashlib.sha256(self).hexdigest()
+
+
+class SignaturePadBinaryField(SignaturePadFieldMixin, models.BinaryField):
+    """Django model field for storing handwritten signatures as raw PNG bytes.
+
+    Storing the decoded PNG instead of its base64 data URL saves about a third of
+    the space on disk and on the wire. The field accepts the data URLs posted by
+    SignaturePadWidget, validates and decodes them once in ``clean``, and returns
+    SignatureBytes values exposing ``png_bytes`` and ``data_url``.
+
+    Attributes:
+        max_size_kb (int): Maximum allowed size for the signature in kilobytes.
+            Defaults to 100KB.
+
+    Security Controls:
+        Data URLs go through the same checks as SignaturePadField before being
+        decoded. See SignaturePadField.decode_png_data_url.
+
+    Raises:
+        ValidationError: When any of the security validation checks fail.
+    """
+
+    empty_values = [*models.Field.empty_values, b""]
+
+    def __init__(self, *args, **kwargs):
+        # Unlike BinaryField, the field is editable through SignaturePadWidget
+        kwargs.setdefault("editable", True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.editable:
+            del kwargs["editable"]
+        else:
+            kwargs["editable"] = False
+        return name, path, args, kwargs
+
+    def to_python(self, value):
+        if isinstance(value, str) and value.startswith("data:"):
+            return SignatureBytes(self.decode_png_data_url(value))
+        if isinstance(value, str) and value.startswith(UPLOAD_TOKEN_PREFIX):
+            return SignatureBytes(self.get_uploaded_png(value))
+        value = super().to_python(value)
+        if value is None or isinstance(value, SignatureBytes):
+            return value
+        return SignatureBytes(value)
 
     def clean(self, value, model_instance):
         """Validate the signature data before saving to the database.
 
+        Data URLs and upload tokens are validated while being decoded, and raw
+        bytes go through the same checks by ``validate_png``. Other strings,
+        such as base64 without a data URL prefix, are rejected.
+
         Args:
-            value (str): The PNG data URL to validate.
+            value: The data URL, upload token or image bytes to validate.
             model_instance: The model instance the field belongs to.
 
         Returns:
-            str: The validated value.
+            SignatureBytes: The validated image bytes.
+
+        Raises:
+            ValidationError: If any validation check fails.
+        """
+        # Parsed and validated by SignaturePadFormField
+        if isinstance(value, SignatureImage):
+            return self.clean_image(value, model_instance)
+        if isinstance(value, str) and value and not value.startswith(("data:", UPLOAD_TOKEN_PREFIX)):
+            raise self._format_error()
+        decoded = isinstance(value, str)
+        value = super().clean(value, model_instance)
+        if value and not decoded:
+            self.validate_png(value)
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return SignatureBytes(value)
+
+    def value_to_png(self, value):
+        """Return the image bytes of a value, as saved."""
+        return bytes(value)
+
+    def png_to_value(self, data):
+        """Return the database value for PNG bytes."""
+        return SignatureBytes(data)
+
+    def pre_save(self, model_instance, add):
+        value = super().pre_save(model_instance, add)
+        optimize = self.optimize and not self.optimize_in_background
+        # Data URLs assigned directly to the instance, without calling clean
+        if isinstance(value, str):
+            value = SignatureBytes(images.decode_data_url(value))
+            setattr(model_instance, self.attname, value)
+        if value and optimize:
+            value = SignatureBytes(self.optimize_png(value))
+            setattr(model_instance, self.attname, value)
+        return value
+
+
+class SignaturePadStrokesField(models.TextField):
+    """Django model field for storing handwritten signatures as vector strokes.
+
+    The widget submits the strokes drawn on the pad as compact JSON instead of a
+    PNG, which is typically an order of magnitude smaller and can be rendered at
+    any resolution. Values are SignatureStrokes objects, rendering the strokes
+    as SVG or PNG on demand.
+
+    Attributes:
+        max_size_kb (int): Maximum allowed size of the JSON payload in kilobytes.
+            Defaults to 100KB.
+        max_points (int): Maximum total number of points. Defaults to 5000.
+        max_canvas_size (int): Maximum canvas width and height in CSS pixels.
+            Defaults to 4096.
+
+    Security Controls:
+        1. Size Limitation: The payload size is checked before parsing it.
+        2. Format Validation: The payload must follow the stroke format, with
+           integer coordinates and CSS colors only.
+        3. Bounds Checking: The number of points is limited, and every point
+           must lie within the declared canvas.
+
+    Raises:
+        ValidationError: When any of the security validation checks fail.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.max_size_kb = kwargs.pop("max_size_kb", 100)
+        self.max_points = kwargs.pop("max_points", 5000)
+        self.max_canvas_size = kwargs.pop("max_canvas_size", 4096)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.max_size_kb != 100:
+            kwargs["max_size_kb"] = self.max_size_kb
+        if self.max_points != 5000:
+            kwargs["max_points"] = self.max_points
+        if self.max_canvas_size != 4096:
+            kwargs["max_canvas_size"] = self.max_canvas_size
+        return name, path, args, kwargs
+
+    def formfield(self, **kwargs):
+        kwargs["widget"] = SignaturePadWidget(output_format="strokes")
+        return super().formfield(**kwargs)
+
+    def to_python(self, value):
+        if isinstance(value, str) and value:
+            return SignatureStrokes(value)
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        return self.to_python(value)
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if isinstance(value, SignatureStrokes):
+            return value.json
+        return value
+
+    def value_to_string(self, obj):
+        value = self.value_from_object(obj)
+        return value.json if isinstance(value, SignatureStrokes) else value
+
+    def validate_strokes(self, value):
+        """Validate a JSON stroke payload.
+
+        Args:
+            value (str): The JSON stroke payload.
 
         Raises:
             ValidationError: If any validation check fails.
         """
+        kb_size = len(value) / 1024
+        if kb_size > self.max_size_kb:
+            raise ValidationError(
+                _("Signature data is too large (%(size).2f KB). Maximum allowed size is %(max_size)d KB."),
+                params={"size": kb_size, "max_size": self.max_size_kb},
+            )
+        parse_strokes(value, max_points=self.max_points, max_canvas_size=self.max_canvas_size)
+
+    def clean(self, value, model_instance):
         value = super().clean(value, model_instance)
-        self.validate_png_data_url(value)
+        if value:
+            self.validate_strokes(value.json)
         return value
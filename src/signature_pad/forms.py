@@ -0,0 +1,88 @@
+from asgiref.sync import sync_to_async
+from django import forms
+from django.core.validators import ProhibitNullCharactersValidator
+
+from . import images
+from .fields import SignatureBytes, SignatureImage, SignaturePadField, SignaturePadWidget
+from .storage import StoredSignature
+from .uploads import UPLOAD_TOKEN_PREFIX
+
+# Options of the model field validating the signatures of standalone form fields
+SIGNATURE_FIELD_OPTIONS = ("max_size_kb", "formats", "max_width", "max_height", "max_pixels", "verify_data")
+
+
+class SignaturePadFormField(forms.CharField):
+    """Form field parsing signature data URLs and upload tokens into SignatureImage values.
+
+    The submitted data URL is validated and decoded once, and the cleaned value
+    is a SignatureImage holding the image bytes, format, dimensions and hash.
+    Signature model fields save it without decoding or validating it again.
+
+    It is the default form field of SignaturePadField and
+    SignaturePadBinaryField, validating with the options of the model field.
+    In forms without a model, the validation options of the model fields are
+    accepted instead: ``max_size_kb``, ``formats``, ``max_width``,
+    ``max_height``, ``max_pixels`` and ``verify_data``.
+
+    Attributes:
+        signature_field: The signature model field validating the values.
+    """
+
+    widget = SignaturePadWidget
+
+    def __init__(self, *, signature_field=None, **kwargs):
+        options = {option: kwargs.pop(option) for option in SIGNATURE_FIELD_OPTIONS if option in kwargs}
+        super().__init__(**kwargs)
+        self.signature_field = signature_field or SignaturePadField(**options)
+        # Values are images, and data URLs never contain null characters
+        self.validators = [v for v in self.validators if not isinstance(v, ProhibitNullCharactersValidator)]
+        if isinstance(self.widget, SignaturePadWidget) and self.widget.max_size_kb is None:
+            self.widget.max_size_kb = self.signature_field.max_size_kb
+        if isinstance(self.widget, SignaturePadWidget) and self.widget.formats is None:
+            self.widget.formats = self.signature_field.formats
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return self.empty_value
+        # Initial values, and values already parsed
+        if isinstance(value, SignatureBytes | StoredSignature):
+            return value
+        if value.startswith(UPLOAD_TOKEN_PREFIX):
+            return SignatureImage(self.signature_field.get_uploaded_png(value))
+        return SignatureImage(self.signature_field.decode_png_data_url(value))
+
+
+class AsyncSignatureFormMixin:
+    """Form mixin validating signatures without blocking the event loop, for async views.
+
+    Cleaning a form decodes and checks every signature it contains, which is
+    CPU-bound. ``ais_valid`` runs the whole cleaning in the signature pad thread
+    pool instead, with at most ``SIGNATURE_PAD_ASYNC_CONCURRENCY`` forms being
+    cleaned at once per event loop.
+
+    Usage::
+
+        class DocumentForm(AsyncSignatureFormMixin, forms.ModelForm):
+            class Meta:
+                model = Document
+                fields = ["signature"]
+
+        async def sign(request):
+            form = DocumentForm(request.POST)
+            if await form.ais_valid():
+                await form.asave()
+    """
+
+    async def ais_valid(self):
+        """Asynchronous version of is_valid."""
+        if self.is_bound and self._errors is None:
+            await images.run_in_executor(self.full_clean)
+        return self.is_valid()
+
+    async def asave(self, commit=True):
+        """Asynchronous version of save, for model forms.
+
+        Like the async ORM methods, the save runs in the thread used for
+        synchronous database access.
+        """
+        return await sync_to_async(self.save)(commit)
@@ -0,0 +1,392 @@
+import asyncio
+import base64
+import functools
+import struct
+import threading
+import weakref
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+
+try:
+    from PIL import Image, ImageChops
+except ImportError:  # Pillow is an optional dependency
+    Image = None
+
+PNG_DATA_URL_PREFIX = "data:image/png;base64,"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Length and type of the IHDR chunk, which must immediately follow the signature
+PNG_IHDR_HEADER = b"\x00\x00\x00\rIHDR"
+# Base64 characters covering the PNG signature and the whole IHDR chunk (33 bytes),
+# which also covers the WebP header up to the image dimensions (30 bytes)
+PNG_HEAD_BASE64_LENGTH = 44
+# Offset of the color type in the IHDR chunk, and the value for palette images
+PNG_COLOR_TYPE_OFFSET = 25
+PNG_COLOR_TYPE_PALETTE = 3
+
+WEBP_DATA_URL_PREFIX = "data:image/webp;base64,"
+# Data URL prefixes and display names of the supported image formats
+DATA_URL_PREFIXES = {"png": PNG_DATA_URL_PREFIX, "webp": WEBP_DATA_URL_PREFIX}
+FORMAT_NAMES = {"png": "PNG", "webp": "WebP"}
+# Side of the grid of perceptual hashes, which have PHASH_SIZE ** 2 bits
+PHASH_SIZE = 8
+
+
+def decode_data_url(value):
+    """Return the data of a data URL, without any validation."""
+    return base64.b64decode(value.split(",", 1)[-1])
+
+
+def encode_data_url(data):
+    """Return PNG or WebP bytes encoded as a data URL."""
+    prefix = DATA_URL_PREFIXES.get(get_image_format(data), PNG_DATA_URL_PREFIX)
+    return prefix + base64.b64encode(data).decode("ascii")
+
+
+def get_image_format(data):
+    """Return "png" or "webp" from the first bytes of an image, or None if the format is not supported."""
+    if data.startswith(PNG_SIGNATURE):
+        return "png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def get_dimensions(data):
+    """Return the (width, height) of a PNG or WebP image from its header, or None if it can't be read.
+
+    Only the first 30 bytes are read: the IHDR chunk of PNG images, and the VP8,
+    VP8L or VP8X chunk header of WebP images.
+    """
+    image_format = get_image_format(data)
+    if image_format == "png" and data[8:16] == PNG_IHDR_HEADER and len(data) >= 24:
+        return struct.unpack(">II", data[16:24])
+    if image_format != "webp" or len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+        # Lossy: 14-bit dimensions after the frame start code
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and data[20] == 0x2F:
+        # Lossless: 14-bit width and height minus one, packed after the signature byte
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        # Extended: 24-bit canvas width and height minus one
+        return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+    return None
+
+
+# Channels per pixel of each PNG color type
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+# Offset, and spacing in both directions, of the pixels of each Adam7 interlacing pass
+PNG_ADAM7_PASSES = ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4), (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2))
+
+
+def get_png_data_size(head):
+    """Return the size of the decompressed image data declared by a PNG IHDR chunk, or None if invalid.
+
+    Each row of pixels is preceded by a filter type byte, and interlaced images
+    are made of the seven reduced images of the Adam7 passes.
+    """
+    if len(head) < 29 or head[25] not in PNG_CHANNELS or head[24] not in (1, 2, 4, 8, 16):
+        return None
+    width, height = struct.unpack(">II", head[16:24])
+    bits_per_pixel = PNG_CHANNELS[head[25]] * head[24]
+    if not head[28]:
+        return height * (1 + (width * bits_per_pixel + 7) // 8)
+    size = 0
+    for x, y, dx, dy in PNG_ADAM7_PASSES:
+        pass_width = max(width - x + dx - 1, 0) // dx
+        pass_height = max(height - y + dy - 1, 0) // dy
+        if pass_width and pass_height:
+            size += pass_height * (1 + (pass_width * bits_per_pixel + 7) // 8)
+    return size
+
+
+def verify_png_data(data, chunk_size=64 * 1024):
+    """Decompress the IDAT stream of a PNG and check it matches the declared dimensions.
+
+    The stream is inflated in chunks of at most ``chunk_size`` bytes, which are
+    counted and discarded, and decompression stops as soon as the output
+    exceeds the size declared by the IHDR chunk. Memory use is bounded whatever
+    the input, so decompression bombs are detected without decoding the image.
+
+    Returns:
+        str: None if the data is valid, otherwise "invalid" for a malformed
+            chunk or stream, "too_large" for a stream inflating to more than
+            the declared size, or "truncated" for a stream ending early.
+    """
+    expected_size = get_png_data_size(data[:33])
+    if expected_size is None:
+        return "invalid"
+    data = memoryview(data)
+    decompressor = zlib.decompressobj()
+    size = 0
+    offset = len(PNG_SIGNATURE)
+    while offset + 8 <= len(data):
+        length = int.from_bytes(data[offset : offset + 4], "big")
+        chunk_type = bytes(data[offset + 4 : offset + 8])
+        chunk = data[offset + 8 : offset + 8 + length]
+        if len(chunk) < length:
+            return "invalid"
+        offset += 12 + length
+        if chunk_type == b"IEND":
+            break
+        if chunk_type != b"IDAT":
+            continue
+        try:
+            while chunk and not decompressor.eof:
+                # Allow one byte more than expected, to detect streams inflating past the declared size
+                size += len(decompressor.decompress(chunk, min(chunk_size, expected_size - size + 1)))
+                if size > expected_size:
+                    return "too_large"
+                chunk = decompressor.unconsumed_tail
+        except zlib.error:
+            return "invalid"
+    if not decompressor.eof or size < expected_size:
+        return "truncated"
+    return None
+
+
+def get_image_bytes(value):
+    """Return the image bytes of any signature field value, as saved.
+
+    Values exposing ``image_bytes`` (stored, binary and stroke signatures) are
+    read through it, and plain strings are decoded as data URLs.
+    """
+    if hasattr(value, "image_bytes"):
+        return value.image_bytes
+    return decode_data_url(value)
+
+
+def get_png_bytes(value):
+    """Return the PNG bytes of any signature field value, transcoding WebP signatures with to_png."""
+    if hasattr(value, "png_bytes"):
+        return value.png_bytes
+    return to_png(decode_data_url(value))
+
+
+@functools.lru_cache(maxsize=64)
+def to_png(data):
+    """Return image bytes as PNG, for consumers such as PDF generators that only read PNG.
+
+    PNG data is returned as is, and other formats are transcoded with Pillow.
+    Recent results are cached.
+
+    Raises:
+        ImproperlyConfigured: If the data is not PNG and Pillow is not installed.
+    """
+    if not data or data.startswith(PNG_SIGNATURE):
+        return data
+    if Image is None:
+        raise ImproperlyConfigured(
+            "Pillow is required to convert signatures to PNG: pip install django-signature-pad[images]"
+        )
+    with Image.open(BytesIO(data)) as image:
+        output = BytesIO()
+        image.save(output, "PNG")
+    return output.getvalue()
+
+
+def to_webp(data):
+    """Return image bytes as lossless WebP, transcoding other formats with Pillow.
+
+    Raises:
+        ImproperlyConfigured: If the data is not WebP and Pillow is not installed.
+    """
+    if not data or get_image_format(data) == "webp":
+        return data
+    if Image is None:
+        raise ImproperlyConfigured(
+            "Pillow is required to convert signatures to WebP: pip install django-signature-pad[images]"
+        )
+    with Image.open(BytesIO(data)) as image:
+        output = BytesIO()
+        image.save(output, "WEBP", lossless=True)
+    return output.getvalue()
+
+
+def is_palette_png(data):
+    """Return True if PNG bytes hold a palette image, such as those produced by optimize_png."""
+    return data[PNG_COLOR_TYPE_OFFSET : PNG_COLOR_TYPE_OFFSET + 1] == bytes([PNG_COLOR_TYPE_PALETTE])
+
+
+def is_palette_data_url(value):
+    """Return True if a PNG data URL holds a palette image, decoding only its head."""
+    head = value.split(",", 1)[-1][:PNG_HEAD_BASE64_LENGTH]
+    try:
+        return is_palette_png(base64.b64decode(head))
+    except ValueError:
+        return False
+
+
+def optimize_png(data, colors=4, threshold=16):
+    """Trim a signature PNG to its ink and recompress it with a small palette.
+
+    The background color is taken from the top-left pixel. The image is cropped
+    to the bounding box of the pixels differing from it, quantized to a palette
+    of ``colors`` entries (2 colors give a 1-bit PNG), and saved at the maximum
+    zlib compression level.
+
+    Args:
+        data (bytes): The PNG data.
+        colors (int, optional): Size of the palette. Defaults to 4.
+        threshold (int, optional): Minimum difference with the background for
+            a pixel to count as ink, which ignores faint antialiasing noise.
+            Defaults to 16.
+
+    Returns:
+        bytes: The optimized PNG data, or the original data if it was smaller.
+
+    Raises:
+        ImproperlyConfigured: If Pillow is not installed.
+    """
+    if Image is None:
+        raise ImproperlyConfigured(
+            "Pillow is required to optimize signatures: pip install django-signature-pad[images]"
+        )
+
+    with Image.open(BytesIO(data)) as image:
+        image = image.convert("RGBA")
+
+    background = Image.new("RGBA", image.size, image.getpixel((0, 0)))
+    difference = functools.reduce(ImageChops.lighter, ImageChops.difference(image, background).split())
+    bbox = difference.point(lambda value: 255 if value > threshold else 0).getbbox()
+    if bbox:
+        image = image.crop(bbox)
+
+    output = BytesIO()
+    image.quantize(colors=colors, method=Image.Quantize.FASTOCTREE).save(output, "PNG", optimize=True)
+    optimized = output.getvalue()
+    return optimized if len(optimized) < len(data) else data
+
+
+def perceptual_hash(data, threshold=16):
+    """Return the 64-bit perceptual hash of the ink of a signature image.
+
+    The ink is found as in ``optimize_png``, as the pixels differing from the
+    top-left one, so the hash doesn't depend on the pen and background colors.
+    The image is cropped to the ink, which makes the hash insensitive to where
+    the signature was drawn on the canvas, and to the canvas size, and its ink
+    intensity is averaged down to 9x8 pixels. Each bit tells whether a pixel has
+    less ink than its right neighbour (a difference hash), so similar
+    signatures have hashes differing in few bits.
+
+    Args:
+        data (bytes): The PNG or WebP data.
+        threshold (int, optional): Minimum difference with the background for
+            a pixel to count as ink when cropping. Defaults to 16.
+
+    Returns:
+        int: The unsigned 64-bit hash. Blank signatures hash to 0.
+
+    Raises:
+        ImproperlyConfigured: If Pillow is not installed.
+    """
+    if Image is None:
+        raise ImproperlyConfigured("Pillow is required to hash signatures: pip install django-signature-pad[images]")
+
+    with Image.open(BytesIO(data)) as image:
+        image = image.convert("RGBA")
+
+    background = Image.new("RGBA", image.size, image.getpixel((0, 0)))
+    ink = functools.reduce(ImageChops.lighter, ImageChops.difference(image, background).split())
+    bbox = ink.point(lambda value: 255 if value > threshold else 0).getbbox()
+    if not bbox:
+        return 0
+    pixels = ink.crop(bbox).resize((PHASH_SIZE + 1, PHASH_SIZE), Image.Resampling.BOX).tobytes()
+    phash = 0
+    for row in range(PHASH_SIZE):
+        for column in range(PHASH_SIZE):
+            left = pixels[row * (PHASH_SIZE + 1) + column]
+            phash = phash << 1 | (left < pixels[row * (PHASH_SIZE + 1) + column + 1])
+    return phash
+
+
+# Thread pool shared by the process, created on first use by get_executor
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the thread pool used to process signatures outside of the request.
+
+    The pool is created on first use and shared by all callers, so background
+    optimization and async validation are bounded together. The number of
+    threads is set by the ``SIGNATURE_PAD_MAX_WORKERS`` setting, and defaults
+    to 2.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "SIGNATURE_PAD_MAX_WORKERS", 2), thread_name_prefix="signature_pad"
+                )
+    return _executor
+
+
+def setup_worker_process():
+    """Set up Django in a worker process, as the initializer of a ProcessPoolExecutor.
+
+    Model fields sent to worker processes are unpickled from the app registry,
+    which processes started with the "spawn" or "forkserver" methods load
+    through the DJANGO_SETTINGS_MODULE environment variable.
+    """
+    if not apps.ready:
+        django.setup()
+
+
+def run_in_background(func, *args, **kwargs):
+    """Run a function in the thread pool returned by get_executor.
+
+    Database connections opened by the function are closed when it returns.
+
+    Returns:
+        concurrent.futures.Future: The future of the function call.
+    """
+
+    def call():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    return get_executor().submit(call)
+
+
+# Semaphores are bound to an event loop, so one is kept per running loop
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def get_semaphore():
+    """Return the semaphore limiting concurrent async calls of run_in_executor on the running loop.
+
+    The limit is set by the ``SIGNATURE_PAD_ASYNC_CONCURRENCY`` setting, and
+    defaults to ``SIGNATURE_PAD_MAX_WORKERS``.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        limit = getattr(settings, "SIGNATURE_PAD_ASYNC_CONCURRENCY", getattr(settings, "SIGNATURE_PAD_MAX_WORKERS", 2))
+        semaphore = _semaphores[loop] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def run_in_executor(func, *args, **kwargs):
+    """Await a function run by run_in_background, without blocking the event loop.
+
+    Coroutines wait on get_semaphore before submitting work, so a burst of large
+    signatures queues on the event loop instead of filling the thread pool of
+    get_executor, which background optimization shares.
+    """
+    async with get_semaphore():
+        return await asyncio.wrap_future(run_in_background(func, *args, **kwargs))
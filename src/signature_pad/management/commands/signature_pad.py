@@ -0,0 +1,369 @@
+import functools
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from signature_pad import assets, images
+from signature_pad.fields import SignaturePadField, SignaturePadFieldMixin
+from signature_pad.storage import StoredSignature, _batches, find_orphans, is_referenced
+
+
+def get_signature_fields(field_class=SignaturePadField):
+    """Return (model, field) pairs for the signature fields of all installed models."""
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+        if isinstance(field, field_class)
+    ]
+
+
+# Functions applied to each signature by the processing subcommands. They are
+# defined at module level so that they can run in worker processes, and decode
+# the values there, as base64 decoding and image processing hold the GIL.
+# Stored signatures are read beforehand and passed as bytes.
+
+
+def _get_data(field, value):
+    return value if isinstance(value, bytes) else field.value_to_png(value)
+
+
+def _scan(field, value):
+    try:
+        data = _get_data(field, value)
+    except ValueError:
+        return None
+    return len(data), images.get_image_format(data)
+
+
+def _validate(field, value):
+    try:
+        field.validate_signature(value)
+    except ValidationError as e:
+        return " ".join(e.messages)
+    return None
+
+
+def _recompress(field, value, min_size=0):
+    try:
+        data = _get_data(field, value)
+        if len(data) < min_size:
+            return None
+        optimized = field.optimize_png(data)
+    except (OSError, ValueError):
+        return None
+    return (optimized, len(data) - len(optimized)) if len(optimized) < len(data) else None
+
+
+def _convert(field, value, image_format="png"):
+    convert = {"png": images.to_png, "webp": images.to_webp}[image_format]
+    try:
+        data = _get_data(field, value)
+        converted = convert(data)
+    except (OSError, ValueError):
+        return None
+    return (converted, len(data) - len(converted)) if converted != data else None
+
+
+def _get_location_key(storage, upload_to):
+    """Return a key identifying the directory of a storage, the same for storage instances over the same files."""
+    try:
+        return ("path", storage.path(upload_to))
+    except NotImplementedError:
+        return (id(storage), upload_to)
+
+
+class Command(BaseCommand):
+    help = "Maintenance tasks for signatures stored by signature pad fields."
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest="subcommand", required=True)
+
+        gc = subparsers.add_parser(
+            "gc",
+            help="Delete stored signature files that no row references anymore.",
+        )
+        gc.add_argument(
+            "--min-age",
+            type=int,
+            default=3600,
+            help="Only delete files older than this number of seconds (default: 3600).",
+        )
+        gc.add_argument("--dry-run", action="store_true", help="List orphan files without deleting them.")
+
+        scan = subparsers.add_parser("scan", help="Report the number, size and formats of stored signatures.")
+        validate = subparsers.add_parser(
+            "validate",
+            help="Validate stored signatures against the current field options and list invalid rows.",
+        )
+        recompress = subparsers.add_parser(
+            "recompress",
+            help="Trim and recompress stored PNG signatures with a small palette, as the optimize option does.",
+        )
+        recompress.add_argument(
+            "--min-size-kb",
+            type=float,
+            default=0,
+            help="Only recompress signatures larger than this size in kilobytes (default: 0).",
+        )
+        convert = subparsers.add_parser("convert", help="Convert stored signatures to another image format.")
+        convert.add_argument(
+            "--to",
+            choices=sorted(images.DATA_URL_PREFIXES),
+            required=True,
+            help="Image format to convert signatures to. WebP signatures are saved lossless.",
+        )
+        for subparser in (scan, validate, recompress, convert):
+            subparser.add_argument(
+                "labels",
+                nargs="*",
+                metavar="app_label.Model[.field]",
+                help="Restrict processing to these models or fields (default: all signature fields).",
+            )
+            subparser.add_argument(
+                "--batch-size",
+                type=int,
+                default=500,
+                help="Number of rows read, and updated, per query (default: 500).",
+            )
+            subparser.add_argument(
+                "--workers",
+                type=int,
+                default=1,
+                help="Number of worker processes, 0 for one per CPU (default: 1, no worker processes).",
+            )
+            subparser.add_argument(
+                "--checkpoint",
+                help="JSON file recording the last primary key processed for each field. A later run with the "
+                "same file resumes after it.",
+            )
+        for subparser in (recompress, convert):
+            subparser.add_argument("--dry-run", action="store_true", help="Report changes without saving them.")
+
+        bundle = subparsers.add_parser(
+            "bundle",
+            help="Write the vendored signature_pad library, and a bundle of it with the widget script and styles, "
+            "for SIGNATURE_PAD_SCRIPTS.",
+        )
+        bundle.add_argument(
+            "--library",
+            help="signature_pad UMD build to use, such as dist/signature_pad.umd.min.js of the npm package "
+            "(default: the copy written to --output by a previous run).",
+        )
+        bundle.add_argument(
+            "--output",
+            required=True,
+            help="Static files directory to write to, such as a directory of STATICFILES_DIRS.",
+        )
+
+    def handle(self, *args, subcommand, **options):
+        self.subcommand = subcommand
+        getattr(self, f"handle_{subcommand}")(**options)
+
+    def handle_gc(self, min_age, dry_run, **options):
+        # Signature files are content-addressed: a key names the same signature in every
+        # storage, so each location is checked against the references of all the fields.
+        # Fields may also use separate storage instances over the same files, such as
+        # callable storages, which would otherwise only see their own references.
+        references = []
+        locations = {}
+        for model, field in get_signature_fields():
+            if field.storage is None:
+                continue
+            locations.setdefault(_get_location_key(field.storage, field.upload_to), (field.storage, field.upload_to))
+            references.append((model._base_manager.all(), field.attname))
+
+        deleted = 0
+        for storage, upload_to in locations.values():
+            for name in find_orphans(storage, upload_to, references, timedelta(seconds=min_age)):
+                if dry_run:
+                    self.stdout.write(name)
+                elif is_referenced(name, references):
+                    # Saved since the batch was checked, reusing the existing file
+                    continue
+                else:
+                    storage.delete(name)
+                deleted += 1
+
+        action = "Found" if dry_run else "Deleted"
+        self.stdout.write(self.style.SUCCESS(f"{action} {deleted} orphan signature file(s)."))
+
+    def handle_bundle(self, library, output, **options):
+        static_dir = Path(assets.__file__).parent / "static"
+        # Rebuilding the bundle, such as after an upgrade, reuses the library written by a previous run
+        library_path = Path(library) if library else Path(output) / assets.VENDORED_JS
+        if not library_path.is_file():
+            raise CommandError(f"The signature_pad library {library_path} doesn't exist, set it with --library.")
+        library = assets.strip_source_map(library_path.read_text(encoding="utf-8"))
+        bundle = assets.build_bundle(
+            library,
+            (static_dir / assets.WIDGET_JS).read_text(encoding="utf-8"),
+            (static_dir / assets.WIDGET_CSS).read_text(encoding="utf-8"),
+        )
+        for path, content in ((assets.VENDORED_JS, library), (assets.BUNDLE_JS, bundle)):
+            target = Path(output) / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding="utf-8")
+            self.stdout.write(f"Wrote {target} ({len(content.encode()) / 1024:.1f} KB).")
+
+    def handle_scan(self, **options):
+        for model, field, label in self.run(options):
+            count, total, largest, oversized, unreadable, formats = 0, 0, 0, 0, 0, Counter()
+            for batch in self.process(model, field, label, _scan, options):
+                for obj, result in batch:
+                    if result is None:
+                        unreadable += 1
+                        continue
+                    size, image_format = result
+                    count += 1
+                    total += size
+                    largest = max(largest, size)
+                    oversized += size > field.max_size_kb * 1024
+                    formats[image_format or "unknown"] += 1
+            summary = ", ".join(f"{image_format} {n}" for image_format, n in formats.most_common()) or "none"
+            self.stdout.write(
+                f"{label}: {count} signature(s), {total / 1024:.1f} KB in total, largest {largest / 1024:.1f} KB, "
+                f"{oversized} over {field.max_size_kb} KB, {unreadable} unreadable, formats: {summary}."
+            )
+
+    def handle_validate(self, **options):
+        invalid = 0
+        for model, field, label in self.run(options):
+            for batch in self.process(model, field, label, _validate, options):
+                for obj, error in batch:
+                    if error:
+                        invalid += 1
+                        self.stdout.write(f"{label} pk={obj.pk}: {error}")
+        style = self.style.ERROR if invalid else self.style.SUCCESS
+        self.stdout.write(style(f"Found {invalid} invalid signature(s)."))
+
+    def handle_recompress(self, min_size_kb, **options):
+        self.require_pillow("recompress")
+        func = functools.partial(_recompress, min_size=int(min_size_kb * 1024))
+        for model, field, label in self.run(options):
+            self.update(model, field, label, func, options)
+
+    def handle_convert(self, to, **options):
+        self.require_pillow("convert")
+        for model, field, label in self.run(options):
+            if to not in field.formats:
+                self.stderr.write(f"Skipping {label}: the field doesn't accept {images.FORMAT_NAMES[to]}.")
+                continue
+            self.update(model, field, label, functools.partial(_convert, image_format=to), options)
+
+    def require_pillow(self, subcommand):
+        if images.Image is None:
+            raise CommandError(
+                f"Pillow is required to {subcommand} signatures: pip install django-signature-pad[images]"
+            )
+
+    def run(self, options):
+        """Yield (model, field, label) for the selected fields, within a worker pool and checkpoint."""
+        fields = [
+            (model, field, f"{model._meta.label}.{field.name}")
+            for model, field in get_signature_fields(SignaturePadFieldMixin)
+        ]
+        if options["labels"]:
+            labels = {label.lower() for label in options["labels"]}
+            fields = [
+                (model, field, label)
+                for model, field, label in fields
+                if label.lower() in labels or model._meta.label_lower in labels
+            ]
+            if not fields:
+                raise CommandError(f"No signature fields match: {', '.join(options['labels'])}.")
+
+        self.checkpoint_path = options["checkpoint"]
+        self.checkpoint = {}
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                self.checkpoint = json.load(f)
+
+        workers = options["workers"]
+        self.pool = None
+        if workers != 1:
+            self.pool = ProcessPoolExecutor(max_workers=workers or None, initializer=images.setup_worker_process)
+        try:
+            yield from fields
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown()
+
+    def process(self, model, field, label, func, options):
+        """Yield batches of (instance, result) pairs of ``func(field, value)`` for the non-empty values of a field.
+
+        Rows are read in primary key order with keyset pagination, loading only
+        the primary key and the field. The checkpoint is saved once the caller is
+        done with a batch, so an interrupted run resumes after the last complete
+        batch.
+        """
+        key = f"{self.subcommand} {label}"
+        queryset = model._base_manager.exclude(**{f"{field.attname}__isnull": True}).only("pk", field.attname)
+        for batch in _batches(queryset, options["batch_size"], self.checkpoint.get(key)):
+            objs = [obj for obj in batch if getattr(obj, field.attname)]
+            # Stored signatures are read here, as storages can't always be shared with worker processes
+            values = [getattr(obj, field.attname) for obj in objs]
+            values = [value.read() if isinstance(value, StoredSignature) else value for value in values]
+            if self.pool is None:
+                results = map(functools.partial(func, field), values)
+            else:
+                results = self.pool.map(functools.partial(func, field), values, chunksize=16)
+            yield list(zip(objs, results))
+            if self.checkpoint_path and not options.get("dry_run"):
+                self.checkpoint[key] = model._meta.pk.value_to_string(batch[-1])
+                with open(f"{self.checkpoint_path}.tmp", "w") as f:
+                    json.dump(self.checkpoint, f, indent=2)
+                os.replace(f"{self.checkpoint_path}.tmp", self.checkpoint_path)
+
+    def update(self, model, field, label, func, options):
+        """Save the signatures for which ``func`` returns new image bytes, one ``bulk_update`` per batch.
+
+        ``func`` returns None for signatures left unchanged, or the new image
+        bytes and the number of bytes saved.
+
+        Each batch is updated in a short transaction locking only its rows.
+        Rows whose signature changed since they were read are left unchanged.
+        """
+        update_fields = [field.attname, *filter(None, (field.size_field, field.hash_field))]
+        updated, changed, saved = 0, 0, 0
+        for batch in self.process(model, field, label, func, options):
+            changes = [(obj, *result) for obj, result in batch if result is not None]
+            if not changes or options["dry_run"]:
+                updated += len(changes)
+                saved += sum(size for obj, data, size in changes)
+                continue
+            with transaction.atomic(using=model._base_manager.db):
+                current = dict(
+                    model._base_manager.select_for_update()
+                    .filter(pk__in=[obj.pk for obj, data, size in changes])
+                    .values_list("pk", field.attname)
+                )
+                objs = []
+                for obj, data, size in changes:
+                    if current.get(obj.pk) != getattr(obj, field.attname):
+                        changed += 1
+                        continue
+                    saved += size
+                    setattr(obj, field.attname, field.png_to_value(data))
+                    if field.size_field:
+                        setattr(obj, field.size_field, len(data))
+                    if field.hash_field:
+                        setattr(obj, field.hash_field, hashlib.sha256(data).hexdigest())
+                    objs.append(obj)
+                model._base_manager.bulk_update(objs, update_fields)
+            updated += len(objs)
+
+        action = "Would update" if options["dry_run"] else "Updated"
+        message = f"{label}: {action} {updated} signature(s), {saved / 1024:.1f} KB saved."
+        if changed:
+            message += f" {changed} signature(s) changed during the run were skipped."
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,119 @@
+from django.db import NotSupportedError
+from django.db.migrations.operations.base import Operation
+
+# PostgreSQL column storage strategies and compression methods of the db_storage and db_compression options
+DB_STORAGES = ("plain", "main", "external", "extended")
+DB_COMPRESSIONS = ("pglz", "lz4")
+# Defaults of text and bytea columns, restored when the options are unset
+DEFAULT_DB_STORAGE = "extended"
+DEFAULT_DB_COMPRESSION = "default"
+
+
+def alter_column_storage(schema_editor, model, field, storage=DEFAULT_DB_STORAGE, compression=DEFAULT_DB_COMPRESSION):
+    """Set the storage strategy and compression method of the column of a field on PostgreSQL.
+
+    Does nothing on other databases. Only values written afterwards are
+    affected: existing values keep the storage and compression they were
+    written with until they are updated.
+
+    Args:
+        schema_editor: The schema editor of the connection.
+        model: The model class of the field.
+        field: The field whose column to alter.
+        storage (str, optional): One of DB_STORAGES. Defaults to "extended".
+        compression (str, optional): One of DB_COMPRESSIONS, or "default" for
+            the server default (the ``default_toast_compression`` setting).
+
+    Raises:
+        NotSupportedError: If a compression method is set before PostgreSQL 14.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    column = schema_editor.quote_name(field.column)
+    actions = [f"ALTER COLUMN {column} SET STORAGE {storage.upper()}"]
+    if connection.pg_version >= 140000:
+        actions.append(f"ALTER COLUMN {column} SET COMPRESSION {compression}")
+    elif compression != DEFAULT_DB_COMPRESSION:
+        raise NotSupportedError("Column compression methods require PostgreSQL 14 or later.")
+    schema_editor.execute(f"ALTER TABLE {schema_editor.quote_name(model._meta.db_table)} {', '.join(actions)}")
+
+
+class AlterSignatureStorage(Operation):
+    """Migration operation applying the db_storage and db_compression options of a signature field.
+
+    AlterField leaves the column unchanged when only these options change, so
+    this operation is added to the migration after it, or after the CreateModel
+    or AddField of the field. The storage and compression default to the
+    options of the field, and fall back to the defaults of the column type when
+    they are unset. The operation doesn't change the migration state, so the
+    field options of the previous migration can't be read when reversing it:
+    reversing applies ``old_storage`` and ``old_compression``, which default to
+    the defaults of the column type. Does nothing on databases other than
+    PostgreSQL.
+
+    Args:
+        model_name (str): Name of the model.
+        name (str): Name of the signature field.
+        storage (str, optional): Storage strategy overriding the field option.
+        compression (str, optional): Compression method overriding the field
+            option.
+        old_storage (str, optional): Storage strategy restored when reversing.
+        old_compression (str, optional): Compression method restored when
+            reversing.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name, name, storage=None, compression=None, old_storage=None, old_compression=None):
+        for value in (storage, old_storage):
+            if value is not None and value not in DB_STORAGES:
+                raise ValueError(f"Unsupported storage {value!r}, use one of: {', '.join(DB_STORAGES)}.")
+        for value in (compression, old_compression):
+            if value is not None and value not in DB_COMPRESSIONS:
+                raise ValueError(f"Unsupported compression {value!r}, use one of: {', '.join(DB_COMPRESSIONS)}.")
+        self.model_name = model_name
+        self.name = name
+        self.storage = storage
+        self.compression = compression
+        self.old_storage = old_storage
+        self.old_compression = old_compression
+
+    @property
+    def model_name_lower(self):
+        return self.model_name.lower()
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        field = model._meta.get_field(self.name)
+        alter_column_storage(
+            schema_editor,
+            model,
+            field,
+            self.storage or getattr(field, "db_storage", None) or DEFAULT_DB_STORAGE,
+            self.compression or getattr(field, "db_compression", None) or DEFAULT_DB_COMPRESSION,
+        )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        alter_column_storage(
+            schema_editor,
+            model,
+            model._meta.get_field(self.name),
+            self.old_storage or DEFAULT_DB_STORAGE,
+            self.old_compression or DEFAULT_DB_COMPRESSION,
+        )
+
+    def describe(self):
+        return f"Alter storage of {self.name} on {self.model_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"alter_{self.model_name_lower}_{self.name.lower()}_storage"
@@ -0,0 +1,146 @@
+import base64
+import hashlib
+
+from django.conf import settings
+from django.core import signing
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+from .images import DATA_URL_PREFIXES, get_image_format
+from .storage import StoredSignature
+
+SERVE_TOKEN_SALT = "signature_pad.serve"
+# Lifetime of the URLs returned by get_signature_url in seconds, unless set by SIGNATURE_PAD_URL_MAX_AGE
+SERVE_TOKEN_MAX_AGE = 60 * 60 * 24
+# Size of the chunks read from storage or sliced from raw bytes
+SERVE_CHUNK_SIZE = 64 * 1024
+# Base64 characters decoded at a time, a multiple of 4 so that chunks decode independently
+SERVE_BASE64_CHUNK_SIZE = SERVE_CHUNK_SIZE // 3 * 4
+CONTENT_TYPES = {"png": "image/png", "webp": "image/webp"}
+
+
+def get_signature_url(instance, field_name):
+    """Return the URL of the view serving the signature of a saved model instance.
+
+    The URL holds a signed token identifying the model, field and primary key,
+    so that it can't be forged to read the signatures of other rows, and a
+    version derived from the content hash, so that responses can be cached
+    until the signature changes. The token expires, see ``load_token``.
+
+    Raises:
+        ValueError: If the instance has no primary key.
+    """
+    if instance.pk is None:
+        raise ValueError("The signature of an unsaved instance has no URL.")
+    field = instance._meta.get_field(field_name)
+    token = signing.dumps(
+        [instance._meta.label_lower, field.name, instance._meta.pk.value_to_string(instance)],
+        salt=SERVE_TOKEN_SALT,
+    )
+    digest = get_signature_digest(instance, field)
+    return f"{reverse('signature_pad:signature', args=[token])}?v={digest[:16]}"
+
+
+def load_token(token):
+    """Return the (model label, field name, primary key) of a token, or raise signing.BadSignature.
+
+    Tokens expire after the ``SIGNATURE_PAD_URL_MAX_AGE`` setting, in seconds,
+    which defaults to a day, raising signing.SignatureExpired.
+    """
+    return signing.loads(
+        token, salt=SERVE_TOKEN_SALT, max_age=getattr(settings, "SIGNATURE_PAD_URL_MAX_AGE", SERVE_TOKEN_MAX_AGE)
+    )
+
+
+def has_access(request, instance, field_name):
+    """Return whether a request may read the signature of an instance through its URL.
+
+    The ``SIGNATURE_PAD_ACCESS_CHECK`` setting is a function, or its dotted
+    path, called with the request, the instance and the field name. Without
+    it, anyone with a URL returned by ``get_signature_url`` may read the
+    signature until the URL expires.
+    """
+    check = getattr(settings, "SIGNATURE_PAD_ACCESS_CHECK", None)
+    if check is None:
+        return True
+    if isinstance(check, str):
+        check = import_string(check)
+    return check(request, instance, field_name)
+
+
+def get_signature_digest(instance, field):
+    """Return the SHA-256 hex digest identifying the signature of an instance.
+
+    The hash field of the instance is used when set, then the digest in the key
+    of stored signatures. Otherwise the image bytes, or the text of the data
+    URL, are hashed in chunks.
+    """
+    if field.hash_field and getattr(instance, field.hash_field):
+        return getattr(instance, field.hash_field)
+    value = getattr(instance, field.attname)
+    if isinstance(value, StoredSignature):
+        return value.digest
+    digest = hashlib.sha256()
+    if isinstance(value, str):
+        for start in range(0, len(value), SERVE_BASE64_CHUNK_SIZE):
+            digest.update(value[start : start + SERVE_BASE64_CHUNK_SIZE].encode("ascii"))
+    else:
+        digest.update(value)
+    return digest.hexdigest()
+
+
+def get_content_type(value):
+    """Return the content type of a data URL, raw image bytes or stored signature."""
+    if isinstance(value, StoredSignature):
+        image_format = value.name.rsplit(".", 1)[-1]
+    elif isinstance(value, str):
+        image_format = next((f for f, prefix in DATA_URL_PREFIXES.items() if value.startswith(prefix)), None)
+    else:
+        image_format = get_image_format(value[:16])
+    return CONTENT_TYPES.get(image_format, "image/png")
+
+
+def get_size(value):
+    """Return the size in bytes of the image of a signature, without decoding it."""
+    if isinstance(value, StoredSignature):
+        return value.storage.size(value.name)
+    if isinstance(value, str):
+        encoded_size = len(value) - value.index(",") - 1
+        return encoded_size // 4 * 3 - value.endswith("=") - value.endswith("==")
+    return len(value)
+
+
+def iter_chunks(value, start=0, end=None):
+    """Yield the image bytes of a signature in chunks, optionally from ``start`` to ``end`` (exclusive).
+
+    Stored signatures are read from storage a chunk at a time, and data URLs are
+    decoded a chunk at a time, so the whole image is never held in memory in
+    addition to the value itself.
+    """
+    if isinstance(value, StoredSignature):
+        chunks = _iter_file(value)
+    elif isinstance(value, str):
+        chunks = _iter_data_url(value)
+    else:
+        data = memoryview(value)
+        chunks = (data[i : i + SERVE_CHUNK_SIZE] for i in range(0, len(data), SERVE_CHUNK_SIZE))
+    position = 0
+    for chunk in chunks:
+        chunk_start, position = position, position + len(chunk)
+        if position <= start:
+            continue
+        if end is not None and chunk_start >= end:
+            break
+        yield bytes(chunk[max(start - chunk_start, 0) : None if end is None else end - chunk_start])
+
+
+def _iter_file(value):
+    with value.open() as f:
+        while chunk := f.read(SERVE_CHUNK_SIZE):
+            yield chunk
+
+
+def _iter_data_url(value):
+    offset = value.index(",") + 1
+    for start in range(offset, len(value), SERVE_BASE64_CHUNK_SIZE):
+        yield base64.b64decode(value[start : start + SERVE_BASE64_CHUNK_SIZE])
@@ -0,0 +1,21 @@
+from django.dispatch import Signal
+
+# Instrumentation signals. Timings are only measured, and signals only sent,
+# while at least one receiver is connected, so that hot paths cost a single
+# check otherwise.
+
+# Sent after a signature is validated, whether it is valid or not.
+# Arguments: field, size (bytes of the data URL or raw image as received),
+# duration (seconds) and code (None when valid, otherwise the code of the
+# ValidationError: "format", "base64", "signature", "header", "size",
+# "dimensions" or "data").
+signature_validated = Signal()
+
+# Sent when a signature is written to the database, by save, bulk_create and
+# bulk_update. The sender is the model. Arguments: field and size (bytes of
+# the database value, which is the storage key for storage-backed fields).
+signature_saved = Signal()
+
+# Sent after a signature pad widget is rendered.
+# Arguments: widget, name and duration (seconds).
+signature_rendered = Signal()
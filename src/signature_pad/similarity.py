@@ -0,0 +1,139 @@
+import itertools
+
+from django.db import models
+
+from . import images
+
+PHASH_BITS = images.PHASH_SIZE**2
+# Perceptual hashes are searched by segments of PHASH_SEGMENT_BITS bits, each with an expression index
+PHASH_SEGMENTS = 4
+PHASH_SEGMENT_BITS = PHASH_BITS // PHASH_SEGMENTS
+# Largest distance searched, at which each segment is searched within a distance of 2 (137 values)
+MAX_SIMILARITY_DISTANCE = 3 * PHASH_SEGMENTS - 1
+
+
+def to_signed(phash):
+    """Return an unsigned 64-bit hash as the signed integer stored in a BigIntegerField."""
+    return phash - (1 << PHASH_BITS) if phash >= 1 << (PHASH_BITS - 1) else phash
+
+
+def hamming_distance(phash, other):
+    """Return the number of bits differing between two hashes, signed or not."""
+    return ((phash ^ other) & ((1 << PHASH_BITS) - 1)).bit_count()
+
+
+class PhashSegment(models.Func):
+    """Segment of the perceptual hash stored in a field, numbered from the most significant bits.
+
+    The shift and mask are written in the SQL rather than passed as parameters,
+    so that queries match the expression indexes of ``phash_indexes()``: SQLite
+    and prepared statements only use an expression index for the very same
+    expression.
+    """
+
+    template = "((%(expressions)s >> %(shift)d) & %(mask)d)"
+    output_field = models.BigIntegerField()
+
+    def __init__(self, expression, index, **extra):
+        super().__init__(
+            expression,
+            shift=PHASH_BITS - PHASH_SEGMENT_BITS * (index + 1),
+            mask=(1 << PHASH_SEGMENT_BITS) - 1,
+            **extra,
+        )
+
+
+def phash_indexes(field_name, name):
+    """Return the expression indexes of the segments of a perceptual hash field, for ``Meta.indexes``.
+
+    Args:
+        field_name (str): Name of the field holding the hash, the
+            ``phash_field`` of the signature field.
+        name (str): Prefix of the index names, suffixed with the segment
+            number. Index names are limited to 30 characters.
+    """
+    return [models.Index(PhashSegment(field_name, index), name=f"{name}_{index}") for index in range(PHASH_SEGMENTS)]
+
+
+def _segment_variants(segment, distance):
+    """Return the segment values within a Hamming distance of a segment."""
+    variants = [segment]
+    for bits in range(1, distance + 1):
+        for positions in itertools.combinations(range(PHASH_SEGMENT_BITS), bits):
+            variants.append(segment ^ sum(1 << position for position in positions))
+    return variants
+
+
+class SignatureQuerySet(models.QuerySet):
+    """QuerySet finding the signatures similar to a given one, by the distance between their perceptual hashes.
+
+    Use it as the manager of models with a signature field with a
+    ``phash_field``: ``objects = SignatureQuerySet.as_manager()``.
+    """
+
+    def similar_signatures(self, value, max_distance=6, field_name=None):
+        """Return the instances whose signature is within ``max_distance`` bits of a signature.
+
+        The search is a multi-index Hamming search: the 64-bit hash is split
+        into 4 segments of 16 bits, and two hashes within ``max_distance`` bits
+        have at least one segment within ``max_distance // 4`` bits. Rows with
+        such a segment are found through the expression indexes of
+        ``phash_indexes()``, then their exact distance is computed, so lookups
+        read a small fraction of the table.
+
+        Args:
+            value: The signature to compare, as a data URL, image bytes, a
+                signature field value, or a hash computed by
+                ``images.perceptual_hash()``.
+            max_distance (int, optional): Maximum number of differing bits, up
+                to MAX_SIMILARITY_DISTANCE. Defaults to 6.
+            field_name (str, optional): Name of the signature field. Defaults
+                to the only signature field of the model with a ``phash_field``.
+
+        Returns:
+            list: The matching instances, closest first, with the distance in
+            their ``similarity_distance`` attribute.
+
+        Raises:
+            ValueError: If ``max_distance`` is out of range, or the field can't
+                be determined.
+        """
+        if not 0 <= max_distance <= MAX_SIMILARITY_DISTANCE:
+            raise ValueError(f"max_distance must be between 0 and {MAX_SIMILARITY_DISTANCE}.")
+        field = self._get_phash_signature_field(field_name)
+        if isinstance(value, int):
+            phash = to_signed(value)
+        else:
+            data = value if isinstance(value, bytes) else images.get_image_bytes(value)
+            phash = to_signed(images.perceptual_hash(data))
+
+        radius = max_distance // PHASH_SEGMENTS
+        segments = {
+            f"_phash_segment_{index}": PhashSegment(field.phash_field, index) for index in range(PHASH_SEGMENTS)
+        }
+        condition = models.Q()
+        for index, alias in enumerate(segments):
+            segment = (phash >> (PHASH_BITS - PHASH_SEGMENT_BITS * (index + 1))) & ((1 << PHASH_SEGMENT_BITS) - 1)
+            condition |= models.Q(**{f"{alias}__in": _segment_variants(segment, radius)})
+        candidates = self.alias(**segments).filter(condition).values_list("pk", field.phash_field)
+
+        distances = {}
+        for pk, other in candidates.iterator():
+            distance = hamming_distance(phash, other)
+            if distance <= max_distance:
+                distances[pk] = distance
+        matches = list(self.in_bulk(list(distances)).values())
+        for instance in matches:
+            instance.similarity_distance = distances[instance.pk]
+        return sorted(matches, key=lambda instance: (instance.similarity_distance, instance.pk))
+
+    def _get_phash_signature_field(self, field_name):
+        if field_name is not None:
+            field = self.model._meta.get_field(field_name)
+            if not getattr(field, "phash_field", None):
+                raise ValueError(f"{self.model._meta.label}.{field_name} has no phash_field.")
+            return field
+        fields = [field for field in self.model._meta.concrete_fields if getattr(field, "phash_field", None)]
+        if len(fields) != 1:
+            raise ValueError(f"Set field_name, {self.model._meta.label} has {len(fields)} fields with a phash_field.")
+        return fields[0]
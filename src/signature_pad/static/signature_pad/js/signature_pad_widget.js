@@ -1,11 +1,74 @@
 /* signature_pad/static/signature_pad/js/signature_pad_widget.js */
-document.addEventListener("DOMContentLoaded", () => {
-  if (typeof SignaturePad === "undefined") {
-    console.error("SignaturePad is not available");
-    return;
+(() => {
+  const CANVAS_SELECTOR = '.signature-pad-wrapper canvas[id$="-pad"]';
+
+  // Signature pads by canvas, created when initialized, and canvases already set up
+  const signaturePads = new Map();
+  const setUpCanvases = new WeakSet();
+
+  // Uploads of each form in progress, forms whose submission a pad blocked, and forms being
+  // submitted again once their uploads are done
+  const pendingUploads = new WeakMap();
+  const blockedForms = new WeakSet();
+  const resubmittedForms = new WeakSet();
+
+  // Submit a form once, after the uploads of all its pads are done. Every pad of the form
+  // handles the same submit event, so uploads are collected until the event is dispatched.
+  function queueUpload(form, upload, submitter) {
+    let uploads = pendingUploads.get(form);
+    if (!uploads) {
+      uploads = [];
+      pendingUploads.set(form, uploads);
+      setTimeout(() => {
+        pendingUploads.delete(form);
+        const blocked = blockedForms.has(form);
+        blockedForms.delete(form);
+        Promise.all(uploads).then((results) => {
+          if (blocked || !results.every(Boolean)) {
+            return;
+          }
+          resubmittedForms.add(form);
+          try {
+            form.requestSubmit(submitter);
+          } finally {
+            resubmittedForms.delete(form);
+          }
+        });
+      });
+    }
+    uploads.push(upload);
   }
 
-  const signaturePads = {};
+  // Encode the strokes of a signature pad as compact JSON (see signature_pad/strokes.py):
+  // integer x, y, time and pressure per point, with x, y and time delta-encoded within
+  // each stroke, and time counted from the first point of the signature
+  function encodeStrokes(signaturePad, width, height) {
+    width = Math.max(Math.round(width), 1);
+    height = Math.max(Math.round(height), 1);
+    const clamp = (value, max) => Math.min(Math.max(Math.round(value), 0), max);
+
+    let startTime = null;
+    const strokes = signaturePad.toData().map((group) => {
+      const points = [];
+      let last = { x: 0, y: 0, time: 0 };
+      group.points.forEach((point) => {
+        if (startTime === null) {
+          startTime = point.time;
+        }
+        const current = {
+          x: clamp(point.x, width),
+          y: clamp(point.y, height),
+          time: Math.max(Math.round(point.time - startTime), last.time),
+        };
+        const pressure = clamp((point.pressure ?? 0.5) * 100, 100);
+        points.push(current.x - last.x, current.y - last.y, current.time - last.time, pressure);
+        last = current;
+      });
+      return { c: group.penColor, min: group.minWidth, max: group.maxWidth, p: points };
+    });
+
+    return JSON.stringify({ v: 1, w: width, h: height, s: strokes.filter((stroke) => stroke.p.length) });
+  }
 
   // Define allowed options with their correct casing
   const allowedOptions = {
@@ -16,13 +79,8 @@ document.addEventListener("DOMContentLoaded", () => {
     signaturePadPencolor: "penColor",
   };
 
-  document.querySelectorAll('.signature-pad-wrapper canvas[id$="-pad"]').forEach((canvas) => {
-    const container = canvas.closest(".signature-pad-container");
-    const wrapper = canvas.closest(".signature-pad-wrapper");
-    const input = container.querySelector('input[type="hidden"]');
-    const clearButton = container.querySelector(".signature-pad-clear-button");
-
-    // Get signature pad options from data attributes
+  // Get signature pad options from data attributes
+  function getOptions(canvas) {
     const options = {};
 
     // Check only for our allowed options
@@ -44,63 +102,273 @@ document.addEventListener("DOMContentLoaded", () => {
       }
     });
 
-    // Function to resize the canvas
-    function resizeCanvas() {
-      // Save current signature as data
-      let signatureData = null;
-      if (signaturePads[canvas.id] && !signaturePads[canvas.id].isEmpty()) {
-        signatureData = signaturePads[canvas.id].toData();
-      }
+    return options;
+  }
 
-      // Get the display size of the canvas from its parent wrapper
-      const containerWidth = wrapper.clientWidth;
-      const containerHeight = wrapper.clientHeight;
+  // Size the canvas to its wrapper, scaled for high-DPI displays
+  function sizeCanvas(canvas) {
+    const wrapper = canvas.closest(".signature-pad-wrapper");
+    const dpr = window.devicePixelRatio || 1;
+    canvas.width = wrapper.clientWidth * dpr;
+    canvas.height = wrapper.clientHeight * dpr;
+    canvas.getContext("2d").scale(dpr, dpr);
+  }
 
-      // For high-DPI displays, adjust the canvas size
-      const dpr = window.devicePixelRatio || 1;
+  // Resize the canvas of a signature pad, keeping its signature
+  function resizePad(canvas) {
+    const signaturePad = signaturePads.get(canvas);
+    const wrapper = canvas.closest(".signature-pad-wrapper");
+    const dpr = window.devicePixelRatio || 1;
+    if (!signaturePad || !canvas.isConnected) {
+      return;
+    }
+    // Resizing clears the canvas, so skip pads whose size didn't change
+    const width = Math.floor(wrapper.clientWidth * dpr);
+    const height = Math.floor(wrapper.clientHeight * dpr);
+    if (canvas.width === width && canvas.height === height) {
+      return;
+    }
 
-      // Set canvas internal dimensions scaled for DPI
-      canvas.width = containerWidth * dpr;
-      canvas.height = containerHeight * dpr;
+    const signatureData = signaturePad.isEmpty() ? null : signaturePad.toData();
+    sizeCanvas(canvas);
+    signaturePad.clear();
+    if (signatureData && signatureData.length > 0) {
+      signaturePad.fromData(signatureData);
+    }
+  }
+
+  // One debounced resize handler for all pads, fed by window events and the ResizeObserver
+  const pendingResizes = new Set();
+  let resizeTimer;
+  function scheduleResize(canvases, delay = 250) {
+    for (const canvas of canvases) {
+      pendingResizes.add(canvas);
+    }
+    clearTimeout(resizeTimer);
+    resizeTimer = setTimeout(() => {
+      pendingResizes.forEach(resizePad);
+      pendingResizes.clear();
+    }, delay);
+  }
 
-      // Scale the context for retina displays
-      const ctx = canvas.getContext("2d");
-      ctx.scale(dpr, dpr);
+  const resizeObserver =
+    "ResizeObserver" in window
+      ? new ResizeObserver((entries) => scheduleResize(entries.map((entry) => entry.target.querySelector("canvas"))))
+      : null;
 
-      // If we have an existing signature pad instance, clear it
-      if (signaturePads[canvas.id]) {
-        signaturePads[canvas.id].clear();
-      } else {
-        // Initialize a new signature pad with options
-        signaturePads[canvas.id] = new SignaturePad(canvas, options);
-      }
+  // Device pixel ratio changes, such as zooming, don't always resize the wrappers
+  window.addEventListener("resize", () => scheduleResize(signaturePads.keys()));
+
+  // Handle orientation change on mobile
+  window.addEventListener("orientationchange", () => scheduleResize(signaturePads.keys(), 500));
+
+  // Bounds of the strokes in CSS pixels, padded by the largest line width
+  function getInkBounds(signaturePad, width, height) {
+    let minX = Infinity;
+    let minY = Infinity;
+    let maxX = -Infinity;
+    let maxY = -Infinity;
+    let padding = 2;
+    signaturePad.toData().forEach((group) => {
+      padding = Math.max(padding, (group.maxWidth || 0) + 2, (group.dotSize || 0) + 2);
+      group.points.forEach((point) => {
+        minX = Math.min(minX, point.x);
+        minY = Math.min(minY, point.y);
+        maxX = Math.max(maxX, point.x);
+        maxY = Math.max(maxY, point.y);
+      });
+    });
+    if (minX === Infinity) {
+      return null;
+    }
+    const x = Math.max(Math.floor(minX - padding), 0);
+    const y = Math.max(Math.floor(minY - padding), 0);
+    return {
+      x,
+      y,
+      width: Math.min(Math.ceil(maxX + padding), width) - x,
+      height: Math.min(Math.ceil(maxY + padding), height) - y,
+    };
+  }
 
-      // Restore the saved signature data if there was any
-      if (signatureData && signatureData.length > 0) {
-        signaturePads[canvas.id].fromData(signatureData);
+  // Return the canvas to export: the pad canvas itself, or a detached canvas with the
+  // signature cropped to its strokes and downscaled to the configured output size
+  function exportCanvas(canvas, signaturePad) {
+    const dpr = window.devicePixelRatio || 1;
+    let bounds = { x: 0, y: 0, width: canvas.width / dpr, height: canvas.height / dpr };
+    if (canvas.dataset.crop === "true") {
+      bounds = getInkBounds(signaturePad, bounds.width, bounds.height) || bounds;
+    }
+    const sourceWidth = Math.max(Math.round(bounds.width * dpr), 1);
+    const sourceHeight = Math.max(Math.round(bounds.height * dpr), 1);
+    const scale = Math.min(
+      1,
+      parseInt(canvas.dataset.outputWidth, 10) / sourceWidth || 1,
+      parseInt(canvas.dataset.outputHeight, 10) / sourceHeight || 1
+    );
+    if (sourceWidth === canvas.width && sourceHeight === canvas.height && scale === 1) {
+      return canvas;
+    }
+
+    const output = document.createElement("canvas");
+    output.width = Math.max(Math.round(sourceWidth * scale), 1);
+    output.height = Math.max(Math.round(sourceHeight * scale), 1);
+    const ctx = output.getContext("2d");
+    ctx.imageSmoothingQuality = "high";
+    ctx.drawImage(
+      canvas,
+      Math.round(bounds.x * dpr),
+      Math.round(bounds.y * dpr),
+      sourceWidth,
+      sourceHeight,
+      0,
+      0,
+      output.width,
+      output.height
+    );
+    return output;
+  }
+
+  // Lossless WebP is usually smaller than PNG for line art, but not every browser can encode it
+  let webpSupported = null;
+  function getOutputType(canvas) {
+    const formats = (canvas.dataset.formats || "png").split(" ");
+    if (formats.includes("webp")) {
+      if (webpSupported === null) {
+        const probe = document.createElement("canvas");
+        probe.width = probe.height = 1;
+        webpSupported = probe.toDataURL("image/webp").startsWith("data:image/webp");
+      }
+      if (webpSupported || !formats.includes("png")) {
+        return "image/webp";
       }
     }
+    return "image/png";
+  }
+
+  // Create the signature pad of a canvas, once
+  function initPad(canvas) {
+    if (signaturePads.has(canvas)) {
+      return signaturePads.get(canvas);
+    }
+    if (intersectionObserver) {
+      intersectionObserver.unobserve(canvas);
+    }
+    sizeCanvas(canvas);
+    const signaturePad = new SignaturePad(canvas, getOptions(canvas));
+    signaturePads.set(canvas, signaturePad);
+    if (resizeObserver) {
+      resizeObserver.observe(canvas.closest(".signature-pad-wrapper"));
+    }
+    return signaturePad;
+  }
 
-    // Initial resize and setup
-    resizeCanvas();
+  // Lazy pads are initialized when they get close to the viewport
+  const intersectionObserver =
+    "IntersectionObserver" in window
+      ? new IntersectionObserver(
+          (entries) => {
+            entries.forEach((entry) => {
+              if (entry.isIntersecting) {
+                initPad(entry.target);
+              }
+            });
+          },
+          { rootMargin: "200px" }
+        )
+      : null;
 
-    // Add resize event listener with debounce
-    let resizeTimer;
-    window.addEventListener("resize", () => {
-      clearTimeout(resizeTimer);
-      resizeTimer = setTimeout(resizeCanvas, 250);
-    });
+  function setUpCanvas(canvas) {
+    // Skip the empty form templates of admin inlines, which are cloned when adding a form
+    if (setUpCanvases.has(canvas) || canvas.id.includes("__prefix__")) {
+      return;
+    }
+    setUpCanvases.add(canvas);
 
-    // Handle orientation change on mobile
-    window.addEventListener("orientationchange", () => {
-      setTimeout(resizeCanvas, 500);
-    });
+    const container = canvas.closest(".signature-pad-container");
+    const wrapper = canvas.closest(".signature-pad-wrapper");
+    const input = container.querySelector('input[type="hidden"]');
+    const clearButton = container.querySelector(".signature-pad-clear-button");
+    const form = canvas.closest("form");
+    const warning = container.querySelector(".signature-pad-warning");
+
+    // Show a warning and return true when the exported signature exceeds the size budget
+    function exceedsBudget(size) {
+      const maxSizeKb = parseFloat(canvas.dataset.maxSizeKb);
+      if (!maxSizeKb || size <= maxSizeKb * 1024) {
+        return false;
+      }
+      if (warning) {
+        warning.textContent = warning.dataset.message.replace("%(size)s", (size / 1024).toFixed(2));
+        warning.hidden = false;
+      }
+      return true;
+    }
+
+    // Upload the signature as a binary image, and resolve to true once the input holds the
+    // returned token, or to false when the signature exceeds the size budget
+    function uploadSignature(output) {
+      const outputType = getOutputType(canvas);
+      return new Promise((resolve) => {
+        output.toBlob(
+          (blob) => {
+            if (exceedsBudget(blob.size)) {
+              resolve(false);
+              return;
+            }
+            const body = new FormData();
+            body.append("signature", blob, outputType === "image/webp" ? "signature.webp" : "signature.png");
+            const csrfToken = form.querySelector('input[name="csrfmiddlewaretoken"]');
+            fetch(canvas.dataset.uploadUrl, {
+              method: "POST",
+              body,
+              headers: csrfToken ? { "X-CSRFToken": csrfToken.value } : {},
+              credentials: "same-origin",
+            })
+              .then((response) => response.json())
+              .then((result) => {
+                if (!result.token) {
+                  throw new Error(result.error);
+                }
+                input.value = result.token;
+              })
+              .catch((error) => {
+                // Fall back to posting the data URL in the form
+                console.error("Signature upload failed", error);
+                input.value = output.toDataURL(outputType, 1);
+              })
+              .finally(() => resolve(true));
+          },
+          outputType,
+          1
+        );
+      });
+    }
 
     // Handle form submission
-    canvas.closest("form").addEventListener("submit", () => {
-      if (!signaturePads[canvas.id].isEmpty()) {
-        const dataURL = signaturePads[canvas.id].toDataURL("image/png");
-        input.value = dataURL;
+    form.addEventListener("submit", (event) => {
+      // Submitted again once the uploads of the form are done, with the inputs already set
+      if (resubmittedForms.has(form)) {
+        return;
+      }
+      const signaturePad = signaturePads.get(canvas);
+      if (signaturePad && !signaturePad.isEmpty()) {
+        if (canvas.dataset.outputFormat === "strokes") {
+          input.value = encodeStrokes(signaturePad, wrapper.clientWidth, wrapper.clientHeight);
+        } else if (canvas.dataset.uploadUrl) {
+          event.preventDefault();
+          queueUpload(form, uploadSignature(exportCanvas(canvas, signaturePad)), event.submitter);
+        } else {
+          // A quality of 1 makes browsers encode lossless WebP
+          const dataURL = exportCanvas(canvas, signaturePad).toDataURL(getOutputType(canvas), 1);
+          // Don't send a signature the server would reject for its size
+          if (exceedsBudget(Math.floor(((dataURL.length - dataURL.indexOf(",") - 1) * 3) / 4))) {
+            event.preventDefault();
+            blockedForms.add(form);
+            return;
+          }
+          input.value = dataURL;
+        }
       } else {
         input.value = "";
       }
@@ -108,8 +376,13 @@ document.addEventListener("DOMContentLoaded", () => {
 
     // Handle clear button
     clearButton.addEventListener("click", () => {
-      signaturePads[canvas.id].clear();
+      if (signaturePads.has(canvas)) {
+        signaturePads.get(canvas).clear();
+      }
       input.value = "";
+      if (warning) {
+        warning.hidden = true;
+      }
     });
 
     // Prevent scrolling on mobile when signing
@@ -122,5 +395,71 @@ document.addEventListener("DOMContentLoaded", () => {
       },
       { passive: false }
     );
-  });
-});
+
+    if (canvas.dataset.lazy === "true" && intersectionObserver) {
+      intersectionObserver.observe(canvas);
+      container.addEventListener("focusin", () => initPad(canvas), { once: true });
+    } else {
+      initPad(canvas);
+    }
+  }
+
+  // Release the pads of canvases removed from the page, such as deleted admin inlines
+  function tearDownCanvas(canvas) {
+    // Moved canvases are removed, then added back
+    if (canvas.isConnected) {
+      return;
+    }
+    const signaturePad = signaturePads.get(canvas);
+    if (signaturePad) {
+      signaturePad.off();
+      signaturePads.delete(canvas);
+    }
+    if (resizeObserver) {
+      resizeObserver.unobserve(canvas.closest(".signature-pad-wrapper"));
+    }
+    if (intersectionObserver) {
+      intersectionObserver.unobserve(canvas);
+    }
+  }
+
+  function findCanvases(node) {
+    if (node.nodeType !== Node.ELEMENT_NODE) {
+      return [];
+    }
+    const canvases = Array.from(node.querySelectorAll(CANVAS_SELECTOR));
+    if (node.matches(CANVAS_SELECTOR)) {
+      canvases.push(node);
+    }
+    return canvases;
+  }
+
+  function start() {
+    if (typeof SignaturePad === "undefined") {
+      // The library may be loaded by a script that runs after this one, such as an async or
+      // dynamically inserted one, so wait for the page to load before giving up
+      if (document.readyState !== "complete") {
+        window.addEventListener("load", start, { once: true });
+      } else {
+        console.error("SignaturePad is not available");
+      }
+      return;
+    }
+
+    document.querySelectorAll(CANVAS_SELECTOR).forEach(setUpCanvas);
+
+    // Set up pads added to the page later, such as admin inlines
+    new MutationObserver((mutations) => {
+      mutations.forEach((mutation) => {
+        mutation.removedNodes.forEach((node) => findCanvases(node).forEach(tearDownCanvas));
+        mutation.addedNodes.forEach((node) => findCanvases(node).forEach(setUpCanvas));
+      });
+    }).observe(document.body, { childList: true, subtree: true });
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", start, { once: true });
+  } else {
+    start();
+  }
+})();
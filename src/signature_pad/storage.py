@@ -0,0 +1,208 @@
+import hashlib
+import posixpath
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.utils import timezone
+
+from .images import decode_data_url, get_image_format, to_png
+
+
+class StoredSignature(str):
+    """Signature saved to a storage backend by a storage-backed SignaturePadField.
+
+    The value is the storage key kept in the database column, so it compares and
+    serializes like a plain string. The URL and content of the PNG or WebP file
+    are available through the field's storage.
+
+    Attributes:
+        storage (django.core.files.storage.Storage): The storage holding the file.
+    """
+
+    def __new__(cls, name, storage):
+        obj = super().__new__(cls, name)
+        obj.storage = storage
+        return obj
+
+    def __reduce__(self):
+        return self.__class__, (str(self), self.storage)
+
+    @property
+    def name(self):
+        """str: The storage key of the signature file."""
+        return str(self)
+
+    @property
+    def digest(self):
+        """str: The SHA-256 hex digest of the image, from its content-addressed key."""
+        return posixpath.basename(self.name)[:64]
+
+    @property
+    def url(self):
+        """str: The URL of the signature file, suitable for an ``<img src>``."""
+        return self.storage.url(self.name)
+
+    def open(self, mode="rb"):
+        """Open the signature file from the storage."""
+        return self.storage.open(self.name, mode)
+
+    def read(self):
+        """Return the image bytes of the signature."""
+        with self.open() as f:
+            return f.read()
+
+    @property
+    def image_bytes(self):
+        """bytes: The image data, read from the storage."""
+        return self.read()
+
+    @property
+    def png_bytes(self):
+        """bytes: The image data, read from the storage and transcoded to PNG if needed."""
+        return to_png(self.read())
+
+
+def save_to_storage(storage, upload_to, data):
+    """Save PNG or WebP bytes to a storage under a content-addressed key.
+
+    The key is derived from the SHA-256 digest of the data, so identical
+    signatures share a single file and existing files are never rewritten.
+
+    Args:
+        storage (django.core.files.storage.Storage): The target storage.
+        upload_to (str): Directory prefix for the key.
+        data (bytes): The image bytes.
+
+    Returns:
+        StoredSignature: The stored signature.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    name = posixpath.join(upload_to, f"{digest}.{get_image_format(data) or 'png'}")
+    if not storage.exists(name):
+        name = storage.save(name, ContentFile(data))
+    return StoredSignature(name, storage)
+
+
+def _batches(queryset, batch_size, last_pk=None):
+    """Yield lists of objects from a queryset, paginating on the primary key.
+
+    Each batch is a separate query filtering on the last primary key of the
+    previous one, so no cursor or transaction stays open between batches.
+    Pagination starts after ``last_pk`` when given.
+    """
+    queryset = queryset.order_by("pk")
+    while True:
+        batch = list((queryset if last_pk is None else queryset.filter(pk__gt=last_pk))[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_pk = batch[-1].pk
+
+
+def move_to_storage(model, field_name, batch_size=500):
+    """Move inline data URL signatures of a model to the field's storage.
+
+    Intended to be called from a ``RunPython`` data migration after switching a
+    SignaturePadField to a storage backend. Rows are processed in primary key
+    order, one batch at a time, and updated with ``bulk_update``.
+
+    Args:
+        model: The model class (a historical model inside a migration).
+        field_name (str): Name of the storage-backed SignaturePadField.
+        batch_size (int, optional): Number of rows per batch. Defaults to 500.
+
+    Returns:
+        int: The number of rows moved to storage.
+    """
+    field = model._meta.get_field(field_name)
+    queryset = model._default_manager.filter(**{f"{field_name}__startswith": "data:"})
+    moved = 0
+    for batch in _batches(queryset, batch_size):
+        for obj in batch:
+            setattr(obj, field.attname, field.store(decode_data_url(getattr(obj, field.attname))))
+        model._default_manager.bulk_update(batch, [field_name])
+        moved += len(batch)
+    return moved
+
+
+def copy_to_binary(model, from_field_name, to_field_name, batch_size=500):
+    """Copy inline data URL signatures of a model to a SignaturePadBinaryField.
+
+    Intended to be called from a ``RunPython`` data migration, between adding
+    the binary field and removing the text field. Rows are processed in primary
+    key order, one batch at a time, and updated with ``bulk_update``.
+
+    Args:
+        model: The model class (a historical model inside a migration).
+        from_field_name (str): Name of the SignaturePadField holding data URLs.
+        to_field_name (str): Name of the SignaturePadBinaryField to fill.
+        batch_size (int, optional): Number of rows per batch. Defaults to 500.
+
+    Returns:
+        int: The number of rows copied.
+    """
+    queryset = model._default_manager.filter(**{f"{from_field_name}__startswith": "data:"})
+    copied = 0
+    for batch in _batches(queryset, batch_size):
+        for obj in batch:
+            setattr(obj, to_field_name, decode_data_url(getattr(obj, from_field_name)))
+        model._default_manager.bulk_update(batch, [to_field_name])
+        copied += len(batch)
+    return copied
+
+
+def is_referenced(name, references):
+    """Return whether a row references a stored signature.
+
+    Args:
+        name (str): The key of the signature file.
+        references (list): (queryset, field name) pairs of the rows that may
+            reference signature files.
+    """
+    return any(queryset.filter(**{field_name: name}).exists() for queryset, field_name in references)
+
+
+def find_orphans(storage, upload_to, references, min_age=timedelta(hours=1), batch_size=500):
+    """Yield the keys of stored signatures that no row references anymore.
+
+    Signature files are shared by all the rows holding the same signature, so
+    they are not deleted with the rows. Files are written before the row is
+    committed, so recent files are skipped to avoid deleting signatures of
+    transactions in progress. Files are also skipped when the storage doesn't
+    report their modification time, unless ``min_age`` is zero.
+
+    The keys of the remaining files are looked up in the database in batches.
+    A file found unreferenced may be referenced again by a row saved since, as
+    existing files are reused as is, so callers check ``is_referenced`` again
+    right before deleting it.
+
+    Args:
+        storage (django.core.files.storage.Storage): The storage to scan.
+        upload_to (str): The directory holding the signature files.
+        references (list): (queryset, field name) pairs of the rows that may
+            reference the files.
+        min_age (datetime.timedelta, optional): Minimum age of orphan files.
+            Defaults to one hour.
+        batch_size (int, optional): Number of keys looked up per query.
+            Defaults to 500.
+    """
+    if not storage.exists(upload_to):
+        return
+    now = timezone.now()
+    directories, files = storage.listdir(upload_to)
+    candidates = []
+    for filename in files:
+        name = posixpath.join(upload_to, filename)
+        if min_age:
+            try:
+                if now - storage.get_modified_time(name) < min_age:
+                    continue
+            except NotImplementedError:
+                continue
+        candidates.append(name)
+    for i in range(0, len(candidates), batch_size):
+        batch = candidates[i : i + batch_size]
+        referenced = set()
+        for queryset, field_name in references:
+            referenced.update(queryset.filter(**{f"{field_name}__in": batch}).values_list(field_name, flat=True))
+        yield from (name for name in batch if name not in referenced)
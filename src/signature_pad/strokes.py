@@ -0,0 +1,249 @@
+"""Vector stroke payloads posted by SignaturePadWidget in "strokes" output format.
+
+The widget encodes the point groups returned by signature_pad's ``toData()`` as
+compact JSON::
+
+    {"v": 1, "w": 600, "h": 300, "s": [{"c": "rgb(0, 0, 0)", "min": 0.5, "max": 2.5, "p": [...]}]}
+
+``w`` and ``h`` are the canvas size in CSS pixels. Each stroke has a pen color,
+minimum and maximum line widths, and a flat list of points: four integers per
+point for x, y, time (milliseconds) and pressure (0-100). x, y and time are
+delta-encoded from the previous point of the stroke, the first point of each
+stroke being relative to (0, 0, 0), and time is counted from the start of the
+signature.
+"""
+
+import base64
+import functools
+import json
+import re
+from io import BytesIO
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.utils.functional import cached_property
+from django.utils.html import format_html, format_html_join
+from django.utils.translation import gettext_lazy as _
+
+from . import images
+
+STROKES_FORMAT_VERSION = 1
+# CSS colors accepted for strokes, as set by the penColor option: hex colors, rgb() with integer
+# components and color names, which SVG and Pillow render alike
+COLOR_RE = re.compile(
+    r"^(#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})|rgb\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)|[a-zA-Z]+)$"
+)
+MAX_LINE_WIDTH = 100
+
+
+def _is_valid_color(color):
+    """Return whether a pen color can be rendered as SVG and by render_png.
+
+    Color names are checked against those known to Pillow when it is installed.
+    """
+    match = COLOR_RE.match(color)
+    if not match or any(component and int(component) > 255 for component in match.groups()[2:]):
+        return False
+    if images.Image is not None:
+        from PIL import ImageColor
+
+        try:
+            ImageColor.getrgb(color)
+        except ValueError:
+            return False
+    return True
+
+
+def parse_strokes(value, max_points=5000, max_canvas_size=4096):
+    """Validate a stroke payload and return it with absolute point coordinates.
+
+    Args:
+        value (str): The JSON stroke payload.
+        max_points (int, optional): Maximum total number of points. Defaults to 5000.
+        max_canvas_size (int, optional): Maximum canvas width and height in CSS
+            pixels. Defaults to 4096.
+
+    Returns:
+        dict: ``width`` and ``height`` of the canvas, and ``strokes``, a list of
+            dicts with ``color``, ``min_width``, ``max_width`` and ``points``,
+            a list of (x, y, time, pressure) tuples.
+
+    Raises:
+        ValidationError: If the payload is malformed or out of bounds.
+    """
+    invalid = ValidationError(_("Invalid signature stroke data."), code="strokes")
+    try:
+        data = json.loads(value)
+    except ValueError:
+        raise invalid
+    if not isinstance(data, dict) or data.get("v") != STROKES_FORMAT_VERSION or not isinstance(data.get("s"), list):
+        raise invalid
+
+    width, height = data.get("w"), data.get("h")
+    for size in (width, height):
+        if type(size) is not int or not 0 < size <= max_canvas_size:
+            raise ValidationError(
+                _("Signature canvas size must be between 1 and %(max_size)d pixels."),
+                code="strokes_canvas",
+                params={"max_size": max_canvas_size},
+            )
+
+    strokes = []
+    total_points = 0
+    for stroke in data["s"]:
+        if not isinstance(stroke, dict):
+            raise invalid
+        color, min_width, max_width, flat = stroke.get("c"), stroke.get("min"), stroke.get("max"), stroke.get("p")
+        if not isinstance(color, str) or not _is_valid_color(color):
+            raise invalid
+        for line_width in (min_width, max_width):
+            if type(line_width) not in (int, float) or not 0 < line_width <= MAX_LINE_WIDTH:
+                raise invalid
+        if not isinstance(flat, list) or not flat or len(flat) % 4:
+            raise invalid
+
+        total_points += len(flat) // 4
+        if total_points > max_points:
+            raise ValidationError(
+                _("Signature has too many points. Maximum allowed is %(max_points)d."),
+                code="strokes_points",
+                params={"max_points": max_points},
+            )
+
+        points = []
+        x = y = time = 0
+        for i in range(0, len(flat), 4):
+            dx, dy, dt, pressure = flat[i : i + 4]
+            if not all(type(n) is int for n in (dx, dy, dt, pressure)):
+                raise invalid
+            x, y, time = x + dx, y + dy, time + dt
+            if not (0 <= x <= width and 0 <= y <= height and time >= 0 and 0 <= pressure <= 100):
+                raise ValidationError(_("Signature points are out of the canvas."), code="strokes_bounds")
+            points.append((x, y, time, pressure))
+        strokes.append({"color": color, "min_width": min_width, "max_width": max_width, "points": points})
+
+    return {"width": width, "height": height, "strokes": strokes}
+
+
+@functools.lru_cache(maxsize=256)
+def render_svg(value):
+    """Render a validated stroke payload as an SVG document.
+
+    Results are cached by payload, so rendering the same signature repeatedly
+    is cheap.
+    """
+    data = parse_strokes(value, max_points=float("inf"), max_canvas_size=float("inf"))
+    elements = []
+    for stroke in data["strokes"]:
+        line_width = (stroke["min_width"] + stroke["max_width"]) / 2
+        points = stroke["points"]
+        if len(points) == 1:
+            x, y = points[0][:2]
+            elements.append(
+                format_html('<circle cx="{}" cy="{}" r="{}" fill="{}"/>', x, y, line_width / 2, stroke["color"])
+            )
+        else:
+            path = "M" + " L".join(f"{x} {y}" for x, y, time, pressure in points)
+            elements.append(
+                format_html(
+                    '<path d="{}" fill="none" stroke="{}" stroke-width="{}" stroke-linecap="round" '
+                    'stroke-linejoin="round"/>',
+                    path,
+                    stroke["color"],
+                    line_width,
+                )
+            )
+    return format_html(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="{}" height="{}" viewBox="0 0 {} {}">{}</svg>',
+        data["width"],
+        data["height"],
+        data["width"],
+        data["height"],
+        format_html_join("", "{}", ((element,) for element in elements)),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def render_png(value, scale=1):
+    """Render a validated stroke payload as PNG bytes on a transparent background.
+
+    Args:
+        value (str): The JSON stroke payload.
+        scale (float, optional): Scale factor from CSS pixels. Defaults to 1.
+
+    Raises:
+        ImproperlyConfigured: If Pillow is not installed.
+    """
+    if images.Image is None:
+        raise ImproperlyConfigured("Pillow is required to render signatures: pip install django-signature-pad[images]")
+    from PIL import ImageDraw
+
+    data = parse_strokes(value, max_points=float("inf"), max_canvas_size=float("inf"))
+    image = images.Image.new("RGBA", (round(data["width"] * scale), round(data["height"] * scale)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for stroke in data["strokes"]:
+        line_width = (stroke["min_width"] + stroke["max_width"]) / 2 * scale
+        points = [(x * scale, y * scale) for x, y, time, pressure in stroke["points"]]
+        if len(points) > 1:
+            draw.line(points, fill=stroke["color"], width=max(round(line_width), 1), joint="curve")
+        radius = line_width / 2
+        for x, y in (points[0], points[-1]):
+            draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=stroke["color"])
+    output = BytesIO()
+    image.save(output, "PNG", optimize=True)
+    return output.getvalue()
+
+
+class SignatureStrokes:
+    """Signature stored as vector strokes by SignaturePadStrokesField.
+
+    Converting the value to a string returns an SVG data URL, so templates such
+    as ``<img src="{{ obj.signature }}">`` keep working at any resolution.
+
+    Attributes:
+        json (str): The JSON stroke payload, as stored in the database.
+    """
+
+    def __init__(self, json):
+        self.json = json
+
+    def __str__(self):
+        return self.svg_data_url
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {len(self.json)} bytes>"
+
+    def __bool__(self):
+        return bool(self.json)
+
+    def __eq__(self, other):
+        if isinstance(other, SignatureStrokes):
+            return self.json == other.json
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.json)
+
+    @cached_property
+    def svg(self):
+        """str: The signature rendered as an SVG document."""
+        return render_svg(self.json)
+
+    @property
+    def svg_data_url(self):
+        """str: The SVG document encoded as a data URL."""
+        return "data:image/svg+xml;base64," + base64.b64encode(self.svg.encode()).decode("ascii")
+
+    @property
+    def png_bytes(self):
+        """bytes: The signature rendered as a PNG at CSS pixel size. Requires Pillow."""
+        return render_png(self.json)
+
+    @property
+    def image_bytes(self):
+        """bytes: Same as png_bytes."""
+        return self.png_bytes
+
+    @property
+    def data_url(self):
+        """str: The PNG rendering encoded as a data URL. Requires Pillow."""
+        return images.encode_data_url(self.png_bytes)
@@ -0,0 +1,31 @@
+from django import template
+from django.core.exceptions import ValidationError
+
+from .. import images
+from ..thumbnails import get_thumbnail_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def signature_thumbnail(value, size):
+    """Return the URL of a downscaled variant of a signature.
+
+    Usage::
+
+        {% load signature_pad %}
+        <img src="{% signature_thumbnail document.signature "120x40" %}" alt="Signature" />
+
+    Without Pillow, or when the signature can't be decoded, such as invalid or
+    legacy values, the full-size signature URL or data URL is returned instead,
+    so that a single row doesn't break the page.
+    """
+    if not value:
+        return ""
+    if images.Image is not None:
+        try:
+            return get_thumbnail_url(value, size)
+        except (ValidationError, ValueError, OSError):
+            # OSError covers PIL.UnidentifiedImageError, and missing stored files
+            pass
+    return getattr(value, "url", None) or str(value)
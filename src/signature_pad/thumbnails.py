@@ -0,0 +1,142 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+
+from . import images
+
+# Thumbnails are immutable, since they are keyed by the hash of their source
+THUMBNAIL_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+MAX_THUMBNAIL_SIZE = 1024
+
+
+class ThumbnailCache:
+    """Two-level cache of thumbnails: an in-process LRU in front of a Django cache.
+
+    The Django cache is set by the ``SIGNATURE_PAD_CACHE`` setting, and defaults
+    to "default". It must be shared by all processes serving the thumbnail view.
+
+    Attributes:
+        maxsize (int): Maximum number of thumbnails kept in the LRU.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, "SIGNATURE_PAD_CACHE", "default")]
+
+    def get(self, key):
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                return self._lru[key]
+        data = self.cache.get(key)
+        if data is not None:
+            self._remember(key, data)
+        return data
+
+    def set(self, key, data):
+        self._remember(key, data)
+        self.cache.set(key, data, THUMBNAIL_CACHE_TIMEOUT)
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._lru[key] = data
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+
+thumbnail_cache = ThumbnailCache()
+
+
+def parse_size(size):
+    """Parse a "WIDTHxHEIGHT" thumbnail size.
+
+    Raises:
+        ValueError: If the size is malformed or larger than MAX_THUMBNAIL_SIZE.
+    """
+    width, height = (int(n) for n in size.lower().split("x"))
+    if not (0 < width <= MAX_THUMBNAIL_SIZE and 0 < height <= MAX_THUMBNAIL_SIZE):
+        raise ValueError(f"Thumbnail size must be between 1x1 and {MAX_THUMBNAIL_SIZE}x{MAX_THUMBNAIL_SIZE}.")
+    return width, height
+
+
+def get_cache_key(digest, width, height):
+    return f"signature_pad:thumbnail:{digest}:{width}x{height}"
+
+
+def make_thumbnail(data, width, height):
+    """Downscale PNG or WebP bytes to a PNG fitting within a size, keeping the aspect ratio.
+
+    Raises:
+        ImproperlyConfigured: If Pillow is not installed.
+    """
+    if images.Image is None:
+        raise ImproperlyConfigured(
+            "Pillow is required to generate thumbnails: pip install django-signature-pad[images]"
+        )
+    with images.Image.open(BytesIO(data)) as image:
+        image.thumbnail((width, height))
+        output = BytesIO()
+        image.save(output, "PNG", optimize=True)
+    return output.getvalue()
+
+
+def get_known_digest(value):
+    """Return the SHA-256 hex digest of a signature when it is known without reading the image, or None.
+
+    Stored signatures have the digest in their key, and the signatures read
+    from instances of models with a ``hash_field`` have it in that field.
+    """
+    digest = getattr(value, "digest", None)
+    if digest:
+        return digest
+    instance = getattr(value, "instance", None)
+    if instance is not None:
+        hash_field = getattr(instance._meta.get_field(value.field_name), "hash_field", None)
+        if hash_field:
+            return getattr(instance, hash_field) or None
+    return None
+
+
+def get_thumbnail_url(value, size):
+    """Return the URL of a thumbnail of a signature, generating it if needed.
+
+    Thumbnails are keyed by the SHA-256 of the signature image and the size, so
+    each variant is generated once and served by the ``signature_pad:thumbnail``
+    view with immutable caching headers. When the digest is known beforehand
+    (see ``get_known_digest``), the image is only read to generate a missing
+    thumbnail.
+
+    Args:
+        value: A signature field value.
+        size (str): Maximum size of the thumbnail, as "WIDTHxHEIGHT".
+
+    Returns:
+        str: The URL of the thumbnail.
+    """
+    width, height = parse_size(size)
+    known_digest = get_known_digest(value)
+    if known_digest is not None and thumbnail_cache.get(get_cache_key(known_digest, width, height)) is not None:
+        digest = known_digest
+    else:
+        data = images.get_image_bytes(value)
+        digest = hashlib.sha256(data).hexdigest()
+        key = get_cache_key(digest, width, height)
+        if digest == known_digest or thumbnail_cache.get(key) is None:
+            thumbnail_cache.set(key, make_thumbnail(data, width, height))
+    return reverse("signature_pad:thumbnail", kwargs={"digest": digest, "size": f"{width}x{height}"})
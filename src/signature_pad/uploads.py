@@ -0,0 +1,114 @@
+import secrets
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.utils.module_loading import import_string
+
+from .images import get_image_format
+
+# Value posted by the widget in place of the data URL, followed by the upload token
+UPLOAD_TOKEN_PREFIX = "upload:"
+UPLOAD_TIMEOUT = 60 * 60
+# Bytes needed to tell PNG and WebP images apart, see images.get_image_format
+UPLOAD_HEAD_SIZE = 12
+
+
+def get_upload_cache():
+    return caches[getattr(settings, "SIGNATURE_PAD_CACHE", "default")]
+
+
+def save_upload(data):
+    """Keep uploaded image bytes until the form referencing them is submitted.
+
+    Returns:
+        str: The value to post in the signature field, made of UPLOAD_TOKEN_PREFIX
+            and a random token.
+    """
+    token = secrets.token_urlsafe(24)
+    get_upload_cache().set(f"signature_pad:upload:{token}", data, UPLOAD_TIMEOUT)
+    return UPLOAD_TOKEN_PREFIX + token
+
+
+def get_upload(value):
+    """Return the image bytes of an upload token value, or None if it expired."""
+    token = value.removeprefix(UPLOAD_TOKEN_PREFIX)
+    return get_upload_cache().get(f"signature_pad:upload:{token}")
+
+
+def pop_upload(value):
+    """Return the image bytes of an upload token value and delete them, or None if it expired.
+
+    Tokens are consumed by the form or field resolving them, so that a token
+    can't be posted again. Only the request whose ``delete`` removes the key
+    gets the data, so concurrent submissions of the same token can't both use it.
+    """
+    key = f"signature_pad:upload:{value.removeprefix(UPLOAD_TOKEN_PREFIX)}"
+    cache = get_upload_cache()
+    data = cache.get(key)
+    if data is None or not cache.delete(key):
+        return None
+    return data
+
+
+def can_upload(request):
+    """Return whether a request may upload a signature to the upload view.
+
+    The ``SIGNATURE_PAD_UPLOAD_CHECK`` setting is a function, or its dotted
+    path, called with the request. Without it, anyone can upload, each upload
+    using up to ``SIGNATURE_PAD_UPLOAD_MAX_SIZE_KB`` of the cache for an hour.
+    """
+    check = getattr(settings, "SIGNATURE_PAD_UPLOAD_CHECK", None)
+    if check is None:
+        return True
+    if isinstance(check, str):
+        check = import_string(check)
+    return check(request)
+
+
+class SignatureUploadHandler(FileUploadHandler):
+    """Upload handler keeping a signature in memory, with a size cap and early format checks.
+
+    Chunks are checked as they arrive: the upload is stopped as soon as it
+    exceeds ``max_size`` bytes, or when its first bytes are not a PNG or WebP
+    header, so memory use per request stays bounded.
+
+    Attributes:
+        max_size (int): Maximum size of the upload in bytes.
+        error (str): Reason of a stopped upload, or None.
+    """
+
+    chunk_size = 16 * 1024
+
+    def __init__(self, request=None, max_size=100 * 1024):
+        super().__init__(request)
+        self.max_size = max_size
+        self.error = None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = BytesIO()
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > self.max_size:
+            self.error = "too_large"
+            raise StopUpload(connection_reset=True)
+        self.file.write(raw_data)
+        if start < UPLOAD_HEAD_SIZE <= self.file.tell():
+            if get_image_format(self.file.getvalue()[:UPLOAD_HEAD_SIZE]) is None:
+                self.error = "invalid"
+                raise StopUpload(connection_reset=True)
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        return InMemoryUploadedFile(
+            file=self.file,
+            field_name=self.field_name,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+        )
@@ -0,0 +1,11 @@
+from django.urls import path, re_path
+
+from . import views
+
+app_name = "signature_pad"
+
+urlpatterns = [
+    path("upload/", views.upload, name="upload"),
+    path("signatures/<str:token>/", views.serve_signature, name="signature"),
+    re_path(r"^thumbnails/(?P<digest>[0-9a-f]{64})/(?P<size>[0-9]+x[0-9]+)\.png$", views.thumbnail, name="thumbnail"),
+]
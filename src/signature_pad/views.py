@@ -0,0 +1,210 @@
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from django.views.decorators.http import condition, require_POST, require_safe
+from django.views.generic import View
+
+from .export import stream_pdf, stream_zip
+from .fields import SignaturePadFieldMixin
+from .images import get_image_format
+from .serving import get_content_type, get_signature_digest, get_size, has_access, iter_chunks, load_token
+from .storage import StoredSignature
+from .thumbnails import get_cache_key, parse_size, thumbnail_cache
+from .uploads import SignatureUploadHandler, can_upload, save_upload
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@require_safe
+@condition(etag_func=lambda request, digest, size: f"{digest}-{size}")
+def thumbnail(request, digest, size):
+    """Serve a signature thumbnail generated by the signature_thumbnail template tag.
+
+    Thumbnails are identified by the hash of their source and never change, so
+    they are served with a strong ETag and an immutable Cache-Control header.
+    """
+    try:
+        width, height = parse_size(size)
+    except ValueError:
+        raise Http404("Invalid thumbnail size.")
+    data = thumbnail_cache.get(get_cache_key(digest, width, height))
+    if data is None:
+        raise Http404("Thumbnail not found.")
+    response = HttpResponse(data, content_type="image/png")
+    response["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+@csrf_exempt
+@require_POST
+def upload(request):
+    """Receive a signature image uploaded as a binary file, and return a token referencing it.
+
+    The widget posts the canvas as a ``signature`` file when configured with an
+    ``upload_url``, then submits the returned token in the form instead of a
+    data URL. The upload is streamed through SignatureUploadHandler, capped at
+    ``SIGNATURE_PAD_UPLOAD_MAX_SIZE_KB`` kilobytes (default: 100), so it isn't
+    subject to DATA_UPLOAD_MAX_MEMORY_SIZE nor inflated by base64. Requests
+    rejected by ``uploads.can_upload`` get a 403 response before the upload is
+    read.
+    """
+    if not can_upload(request):
+        return JsonResponse({"error": "Signature uploads are not allowed."}, status=403)
+    handler = SignatureUploadHandler(
+        request, max_size=getattr(settings, "SIGNATURE_PAD_UPLOAD_MAX_SIZE_KB", 100) * 1024
+    )
+    # Upload handlers must be set before CSRF protection reads request.POST
+    request.upload_handlers = [handler]
+    return _upload(request, handler)
+
+
+@csrf_protect
+def _upload(request, handler):
+    uploaded_file = request.FILES.get("signature")
+    if handler.error == "too_large":
+        return JsonResponse({"error": "Signature image is too large."}, status=413)
+    if uploaded_file is None:
+        return JsonResponse({"error": "Invalid signature upload."}, status=400)
+    data = uploaded_file.read()
+    # The image is fully validated by the signature field when the form is submitted
+    if get_image_format(data) is None:
+        return JsonResponse({"error": "Invalid image data."}, status=400)
+    return JsonResponse({"token": save_upload(data)})
+
+
+@require_safe
+def serve_signature(request, token):
+    """Serve the signature of a model instance, from a URL returned by ``get_signature_url``.
+
+    The response has a strong ETag derived from the content hash, and is sent
+    as 304 Not Modified when it matches If-None-Match. Requests for the current
+    version of the signature, with the ``v`` parameter of the URL, are cached as
+    immutable, and other requests must be revalidated. Single byte ranges are
+    supported. The image is streamed from storage, or decoded from the data URL
+    a chunk at a time.
+
+    Expired URLs, and signatures the request may not read according to
+    ``serving.has_access``, get a 404 response.
+    """
+    try:
+        label, field_name, pk = load_token(token)
+        model = apps.get_model(label)
+        field = model._meta.get_field(field_name)
+    except (signing.BadSignature, LookupError, FieldDoesNotExist, ValueError):
+        raise Http404("Invalid signature URL.")
+    if not isinstance(field, SignaturePadFieldMixin):
+        raise Http404("Invalid signature URL.")
+    try:
+        instance = model._base_manager.only(field.attname, *filter(None, [field.hash_field])).get(pk=pk)
+    except (model.DoesNotExist, ValidationError, ValueError):
+        raise Http404("Signature not found.")
+    if not has_access(request, instance, field.name):
+        raise Http404("Signature not found.")
+    value = getattr(instance, field.attname)
+    if not value or (
+        isinstance(value, str) and not isinstance(value, StoredSignature) and not value.startswith("data:")
+    ):
+        raise Http404("Signature not found.")
+
+    digest = get_signature_digest(instance, field)
+    etag = f'"{digest}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        size = get_size(value)
+        byte_range = _get_range(request, etag, size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+        start, end = byte_range or (0, size)
+        response = StreamingHttpResponse(
+            iter_chunks(value, start, end), content_type=get_content_type(value), status=206 if byte_range else 200
+        )
+        response["Content-Length"] = end - start
+        if byte_range:
+            response["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+    response["ETag"] = etag
+    response["Accept-Ranges"] = "bytes"
+    if request.GET.get("v") == digest[:16]:
+        response["Cache-Control"] = "private, max-age=31536000, immutable"
+    else:
+        response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _get_range(request, etag, size):
+    """Return the (start, end) of the byte range requested, None for the whole image, or False if unsatisfiable.
+
+    Only single ranges are supported. Requests for several ranges, and ranges
+    conditional on another version with If-Range, get the whole image.
+    """
+    header = request.headers.get("Range")
+    if not header or request.headers.get("If-Range", etag) != etag:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match or match[1] == match[2] == "":
+        return None
+    if match[1] == "":
+        start, end = max(size - int(match[2]), 0), size
+    else:
+        start, end = int(match[1]), min(int(match[2]) + 1, size) if match[2] else size
+    if start >= size or start >= end:
+        return False
+    return start, end
+
+
+class SignatureExportView(View):
+    """Stream the signatures of a queryset as a ZIP archive or a PDF document.
+
+    The export is written while the response is sent, with memory use
+    independent of the number of rows. Restrict access to the view, and
+    override ``get_queryset`` to select the rows to export::
+
+        class DocumentSignaturesExport(PermissionRequiredMixin, SignatureExportView):
+            permission_required = "documents.view_document"
+            queryset = Document.objects.filter(signed=True)
+            field_name = "signature"
+
+    The format is taken from the ``format`` URL argument or query parameter,
+    defaulting to ``export_format``.
+
+    Attributes:
+        queryset: The queryset of the model instances to export.
+        field_name (str): The name of the signature field.
+        export_format (str): "zip" or "pdf". Defaults to "zip".
+        filename (str): Name of the downloaded file, without extension.
+            Defaults to "signatures".
+        workers (int): Number of threads decoding signatures ahead of the
+            writer. Defaults to 0.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    queryset = None
+    field_name = "signature"
+    export_format = "zip"
+    filename = "signatures"
+    workers = 0
+    # Function returning the name of the signature of an instance, see iter_signatures
+    get_name = None
+    writers = {"zip": (stream_zip, "application/zip"), "pdf": (stream_pdf, "application/pdf")}
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    def get(self, request, *args, **kwargs):
+        export_format = kwargs.get("format") or request.GET.get("format") or self.export_format
+        if export_format not in self.writers:
+            raise Http404("Unsupported export format.")
+        writer, content_type = self.writers[export_format]
+        response = StreamingHttpResponse(
+            writer(self.get_queryset(), self.field_name, get_name=self.get_name, workers=self.workers),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{self.filename}.{export_format}"'
+        return response
@@ -2,10 +2,30 @@
 
 from django import forms
 
-from .models import SignatureModel
+from signature_pad.forms import AsyncSignatureFormMixin
+
+from .models import BinarySignatureModel, DeferredSignatureModel, SignatureModel
 
 
 class SignatureModelForm(forms.ModelForm):
     class Meta:
         model = SignatureModel
         fields = ["signature"]
+
+
+class BinarySignatureModelForm(forms.ModelForm):
+    class Meta:
+        model = BinarySignatureModel
+        fields = ["signature"]
+
+
+class AsyncSignatureModelForm(AsyncSignatureFormMixin, forms.ModelForm):
+    class Meta:
+        model = SignatureModel
+        fields = ["signature"]
+
+
+class DeferredSignatureModelForm(forms.ModelForm):
+    class Meta:
+        model = DeferredSignatureModel
+        fields = ["signature"]
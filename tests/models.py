@@ -1,8 +1,10 @@
 # tests/models.py
 
+from django.core.files.storage import InMemoryStorage
 from django.db import models
 
-from signature_pad.fields import SignaturePadField
+from signature_pad.fields import SignaturePadBinaryField, SignaturePadField, SignaturePadStrokesField
+from signature_pad.similarity import SignatureQuerySet, phash_indexes
 
 
 class SignatureModel(models.Model):
@@ -10,3 +12,80 @@ class SignatureModel(models.Model):
 
     class Meta:
         app_label = "tests"
+
+
+class StoredSignatureModel(models.Model):
+    signature = SignaturePadField(blank=True, null=True, storage=InMemoryStorage(base_url="/media/"))
+
+    class Meta:
+        app_label = "tests"
+
+
+class OtherStoredSignatureModel(models.Model):
+    signature = SignaturePadField(blank=True, null=True, storage=InMemoryStorage(base_url="/media/"))
+
+    class Meta:
+        app_label = "tests"
+
+
+class BinarySignatureModel(models.Model):
+    signature = SignaturePadBinaryField(blank=True, null=True)
+    # Inline data URLs, to test the conversion to the binary field
+    legacy_signature = SignaturePadField(blank=True, null=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+class OptimizedSignatureModel(models.Model):
+    signature = SignaturePadField(blank=True, null=True, optimize=True)
+    signature_in_background = SignaturePadField(
+        blank=True,
+        null=True,
+        optimize=True,
+        optimize_in_background=True,
+        size_field="signature_in_background_size",
+        hash_field="signature_in_background_hash",
+    )
+    signature_in_background_size = models.PositiveIntegerField(blank=True, null=True)
+    signature_in_background_hash = models.CharField(max_length=64, blank=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+class StrokesSignatureModel(models.Model):
+    signature = SignaturePadStrokesField(blank=True, null=True, max_points=100)
+
+    class Meta:
+        app_label = "tests"
+
+
+class DeferredSignatureModel(models.Model):
+    name = models.CharField(max_length=200, blank=True)
+    signature = SignaturePadField(
+        blank=True, null=True, defer_by_default=True, size_field="signature_size", hash_field="signature_hash"
+    )
+    signature_size = models.PositiveIntegerField(blank=True, null=True)
+    signature_hash = models.CharField(max_length=64, blank=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+class WebPSignatureModel(models.Model):
+    signature = SignaturePadField(blank=True, null=True, formats=("png", "webp"))
+
+    class Meta:
+        app_label = "tests"
+
+
+class PhashSignatureModel(models.Model):
+    signature = SignaturePadField(blank=True, null=True, phash_field="signature_phash")
+    signature_phash = models.BigIntegerField(blank=True, null=True)
+
+    objects = SignatureQuerySet.as_manager()
+
+    class Meta:
+        app_label = "tests"
+        indexes = phash_indexes("signature_phash", name="tests_signature_phash")
@@ -16,6 +16,8 @@ DATABASES = {
     }
 }
 
+ROOT_URLCONF = "tests.urls"
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
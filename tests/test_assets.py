@@ -0,0 +1,108 @@
+# tests/test_assets.py
+
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from signature_pad import SignaturePadWidget
+from signature_pad.assets import BUNDLE_JS, VENDORED_JS, WIDGET_CSS, WIDGET_JS, build_bundle, check_scripts
+
+LIBRARY = "var SignaturePad = function () {};\n//# sourceMappingURL=signature_pad.umd.min.js.map\n"
+
+
+@override_settings(STATIC_URL="/static/")
+class WidgetMediaTests(TestCase):
+    def test_external(self):
+        media = str(SignaturePadWidget().media)
+        self.assertIn('<script src="/static/signature_pad/js/signature_pad_widget.js"></script>', media)
+        self.assertIn(WIDGET_CSS, media)
+
+    @override_settings(SIGNATURE_PAD_SCRIPTS="vendored")
+    def test_vendored(self):
+        media = str(SignaturePadWidget().media)
+        self.assertLess(media.index(VENDORED_JS), media.index(WIDGET_JS))
+        self.assertIn(f'<script src="/static/{VENDORED_JS}" defer></script>', media)
+        self.assertIn(f'<script src="/static/{WIDGET_JS}" defer></script>', media)
+        self.assertIn(WIDGET_CSS, media)
+
+    @override_settings(SIGNATURE_PAD_SCRIPTS="bundle")
+    def test_bundle(self):
+        media = SignaturePadWidget().media
+        self.assertEqual(str(media), f'<script src="/static/{BUNDLE_JS}" defer></script>')
+        # Scripts are merged with the media of other widgets
+        self.assertEqual(str(media + SignaturePadWidget().media), str(media))
+
+    @override_settings(SIGNATURE_PAD_SCRIPTS="cdn")
+    def test_invalid_setting(self):
+        self.assertEqual([error.id for error in check_scripts()], ["signature_pad.E003"])
+
+    # Installing staticfiles would reset the app registry
+    @mock.patch("signature_pad.assets.apps.is_installed", return_value=True)
+    def test_check_files(self, is_installed):
+        """Test that the checks name the command building missing or outdated files."""
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            override_settings(SIGNATURE_PAD_SCRIPTS="bundle", STATICFILES_DIRS=[tmp]),
+        ):
+            errors = check_scripts()
+            self.assertEqual([error.id for error in errors], ["signature_pad.W001"])
+            self.assertIn("manage.py signature_pad bundle --library", errors[0].hint)
+
+            library = Path(tmp) / "signature_pad.umd.min.js"
+            library.write_text(LIBRARY)
+            call_command("signature_pad", "bundle", library=str(library), output=tmp, stdout=StringIO())
+            self.assertEqual(check_scripts(), [])
+
+            bundle = Path(tmp) / BUNDLE_JS
+            bundle.write_text(bundle.read_text().replace("signaturePads", "previousSignaturePads"))
+            self.assertEqual([error.id for error in check_scripts()], ["signature_pad.W002"])
+
+
+@override_settings(STATIC_URL="/static/")
+class BundleTests(TestCase):
+    def test_build_bundle(self):
+        bundle = build_bundle(LIBRARY, "start();\n", ".signature-pad-wrapper { display: block; }\n")
+        self.assertNotIn("sourceMappingURL", bundle)
+        self.assertLess(bundle.index("var SignaturePad"), bundle.index("start();"))
+        self.assertIn('style.textContent = ".signature-pad-wrapper { display: block; }";', bundle)
+
+    def test_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            library = Path(tmp) / "signature_pad.umd.min.js"
+            library.write_text(LIBRARY)
+            output = Path(tmp) / "static"
+            call_command("signature_pad", "bundle", library=str(library), output=str(output), stdout=StringIO())
+
+            self.assertNotIn("sourceMappingURL", (output / VENDORED_JS).read_text())
+            bundle = (output / BUNDLE_JS).read_text()
+            self.assertIn("var SignaturePad", bundle)
+            self.assertIn("signaturePads", bundle)
+            self.assertIn("signature-pad-wrapper", bundle)
+
+            # The files are hashed by ManifestStaticFilesStorage, without references to missing files
+            storage = ManifestStaticFilesStorage(location=output)
+            paths = {path: (storage, path) for path in (VENDORED_JS, BUNDLE_JS)}
+            errors = [result for name, hashed, result in storage.post_process(paths) if isinstance(result, Exception)]
+            self.assertEqual(errors, [])
+            self.assertRegex(storage.stored_name(BUNDLE_JS), r"signature_pad\.bundle\.[0-9a-f]{12}\.js$")
+
+    def test_command_without_library(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaisesMessage(CommandError, "--library"):
+                call_command("signature_pad", "bundle", library=str(Path(tmp) / "missing.js"), output=tmp)
+            # The library isn't shipped with the package
+            with self.assertRaisesMessage(CommandError, "--library"):
+                call_command("signature_pad", "bundle", output=tmp)
+
+    def test_command_reuses_library(self):
+        """Test that the bundle is rebuilt from the library written by a previous run."""
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / VENDORED_JS).parent.mkdir(parents=True)
+            (Path(tmp) / VENDORED_JS).write_text(LIBRARY)
+            call_command("signature_pad", "bundle", output=tmp, stdout=StringIO())
+            self.assertIn("var SignaturePad", (Path(tmp) / BUNDLE_JS).read_text())
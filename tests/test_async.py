@@ -0,0 +1,100 @@
+# tests/test_async.py
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+
+from signature_pad import images
+from signature_pad.fields import SignaturePadFieldMixin
+
+from .forms import AsyncSignatureModelForm
+from .models import SignatureModel
+from .test_storage import VALID_DATA_URL
+
+
+class AsyncValidationTests(TestCase):
+    def setUp(self):
+        self.field = SignatureModel._meta.get_field("signature")
+
+    async def test_avalidate_png_data_url(self):
+        await self.field.avalidate_png_data_url(VALID_DATA_URL)
+        await self.field.avalidate_png_data_url("")
+        with self.assertRaisesMessage(ValidationError, "Invalid PNG data URL format."):
+            await self.field.avalidate_png_data_url("data:image/jpeg;base64,AAAA")
+
+    async def test_avalidate_signature_bytes(self):
+        with self.assertRaisesMessage(ValidationError, "missing PNG signature"):
+            await self.field.avalidate_signature(b"GIF89a" + b"\0" * 32)
+
+    async def test_validation_runs_off_event_loop(self):
+        """Test that decoding runs in the signature pad thread pool."""
+        threads = []
+        decode = SignaturePadFieldMixin.decode_png_data_url
+
+        def record_thread(field, value):
+            threads.append(threading.current_thread().name)
+            return decode(field, value)
+
+        with mock.patch.object(SignaturePadFieldMixin, "decode_png_data_url", record_thread):
+            await self.field.avalidate_png_data_url(VALID_DATA_URL)
+        self.assertTrue(threads[0].startswith("signature_pad"))
+
+    @override_settings(SIGNATURE_PAD_ASYNC_CONCURRENCY=1, SIGNATURE_PAD_MAX_WORKERS=2)
+    async def test_concurrency_limit(self):
+        """Test that concurrent validations are limited by SIGNATURE_PAD_ASYNC_CONCURRENCY."""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def slow_decode(field, value):
+            with lock:
+                active.append(value)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(value)
+
+        with mock.patch.object(SignaturePadFieldMixin, "decode_png_data_url", slow_decode):
+            await asyncio.gather(*(self.field.avalidate_png_data_url(VALID_DATA_URL) for _ in range(4)))
+        self.assertEqual(max(peak), 1)
+        self.assertEqual(len(peak), 4)
+
+    @override_settings(SIGNATURE_PAD_MAX_WORKERS=1)
+    async def test_shares_pool_with_background_work(self):
+        """Test that async validation and background optimization are bounded by the same pool."""
+        with mock.patch.object(images, "_executor", None):
+            self.addCleanup(images.get_executor().shutdown)
+            release = threading.Event()
+            background = images.run_in_background(release.wait, 5)
+
+            validation = asyncio.ensure_future(self.field.avalidate_png_data_url(VALID_DATA_URL))
+            done, _ = await asyncio.wait([validation], timeout=0.05)
+            self.assertFalse(done)
+
+            release.set()
+            await validation
+            self.assertTrue(background.result())
+
+
+class AsyncSignatureFormTests(TestCase):
+    async def test_ais_valid(self):
+        form = AsyncSignatureModelForm(data={"signature": VALID_DATA_URL})
+        self.assertTrue(await form.ais_valid())
+
+        form = AsyncSignatureModelForm(data={"signature": "data:image/png;base64,invalid"})
+        self.assertFalse(await form.ais_valid())
+        self.assertIn("signature", form.errors)
+
+    async def test_unbound_form(self):
+        self.assertFalse(await AsyncSignatureModelForm().ais_valid())
+
+    async def test_asave(self):
+        form = AsyncSignatureModelForm(data={"signature": VALID_DATA_URL})
+        self.assertTrue(await form.ais_valid())
+        obj = await form.asave()
+
+        self.assertEqual((await SignatureModel.objects.aget(pk=obj.pk)).signature, VALID_DATA_URL)
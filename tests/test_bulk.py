@@ -0,0 +1,91 @@
+# tests/test_bulk.py
+
+import base64
+import hashlib
+import multiprocessing
+from unittest import mock, skipUnless
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from signature_pad import images
+
+from signature_pad.bulk import bulk_create
+from signature_pad.fields import SignaturePadField
+
+from .models import DeferredSignatureModel, PhashSignatureModel, SignatureModel, StoredSignatureModel
+from .test_images import make_signature_png
+from .test_storage import VALID_DATA_URL, VALID_PNG_DATA
+
+VALID_PNG = base64.b64decode(VALID_PNG_DATA)
+
+
+class ValidateManyTests(TestCase):
+    def setUp(self):
+        self.field = SignaturePadField()
+        self.values = [
+            VALID_DATA_URL,
+            "data:image/png;base64,invalid",
+            base64.b64decode(VALID_PNG_DATA),
+            b"GIF89a",
+            "",
+        ]
+
+    def assert_results(self, results):
+        self.assertEqual(len(results), 5)
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], ValidationError)
+        self.assertIsNone(results[2])
+        self.assertIsInstance(results[3], ValidationError)
+        self.assertIsNone(results[4])
+
+    def test_thread_pool(self):
+        self.assert_results(self.field.validate_many(self.values, workers=2))
+
+    def test_process_pool(self):
+        self.assert_results(self.field.validate_many(self.values, workers=2, executor="process"))
+
+    def test_spawned_process_pool(self):
+        """Test that worker processes started without fork set up Django to unpickle model fields."""
+        field = SignatureModel._meta.get_field("signature")
+        with mock.patch("multiprocessing.get_context", return_value=multiprocessing.get_context("spawn")):
+            self.assert_results(field.validate_many(self.values, workers=1, executor="process"))
+
+
+class BulkCreateTests(TestCase):
+    def test_creates_valid_objects_and_reports_errors(self):
+        objs = [
+            SignatureModel(signature=VALID_DATA_URL),
+            SignatureModel(signature="data:image/png;base64,invalid"),
+            SignatureModel(signature=VALID_DATA_URL),
+        ]
+
+        created, errors = bulk_create(SignatureModel, objs, workers=2, batch_size=100)
+
+        self.assertEqual(len(created), 2)
+        self.assertEqual(SignatureModel.objects.count(), 2)
+        self.assertEqual(list(errors), [1])
+        self.assertIsInstance(errors[1]["signature"], ValidationError)
+
+    def test_updates_metadata_fields(self):
+        """Test that the size and hash fields are set, as pre_save isn't sent by QuerySet.bulk_create."""
+        created, errors = bulk_create(DeferredSignatureModel, [DeferredSignatureModel(signature=VALID_DATA_URL)])
+
+        obj = DeferredSignatureModel.objects.get(pk=created[0].pk)
+        self.assertEqual(obj.signature_size, len(VALID_PNG))
+        self.assertEqual(obj.signature_hash, hashlib.sha256(VALID_PNG).hexdigest())
+        self.assertTrue(obj.signature_info.has_signature)
+
+    @skipUnless(images.Image, "Pillow is not installed")
+    def test_updates_phash_field(self):
+        data_url = images.encode_data_url(make_signature_png())
+        created, errors = bulk_create(PhashSignatureModel, [PhashSignatureModel(signature=data_url)])
+
+        self.assertIsNotNone(PhashSignatureModel.objects.get(pk=created[0].pk).signature_phash)
+        self.assertEqual(PhashSignatureModel.objects.similar_signatures(data_url), created)
+
+    def test_stores_signatures(self):
+        created, errors = bulk_create(StoredSignatureModel, [StoredSignatureModel(signature=VALID_DATA_URL)])
+
+        obj = StoredSignatureModel.objects.get(pk=created[0].pk)
+        self.assertEqual(obj.signature.read(), VALID_PNG)
@@ -0,0 +1,221 @@
+# tests/test_commands.py
+
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from signature_pad import images
+from signature_pad.images import decode_data_url, encode_data_url, is_palette_png
+from signature_pad.management.commands import signature_pad as command_module
+from signature_pad.management.commands.signature_pad import Command, _recompress
+
+from .models import (
+    DeferredSignatureModel,
+    OtherStoredSignatureModel,
+    SignatureModel,
+    StoredSignatureModel,
+    WebPSignatureModel,
+)
+from .test_formats import HAS_WEBP
+from .test_images import make_signature_png
+from .test_storage import VALID_DATA_URL
+
+
+class SignaturePadGcCommandTests(TestCase):
+    def call(self, *args):
+        out = StringIO()
+        call_command("signature_pad", "gc", *args, stdout=out)
+        return out.getvalue()
+
+    def test_shared_signature_kept_while_referenced(self):
+        first = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        storage = first.signature.storage
+
+        first.delete()
+        self.call("--min-age", "0")
+
+        self.assertTrue(storage.exists(first.signature.name))
+
+    def test_orphans_deleted(self):
+        obj = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        storage = obj.signature.storage
+        obj.delete()
+
+        # Recent files may belong to transactions in progress
+        self.call()
+        self.assertTrue(storage.exists(obj.signature.name))
+
+        self.assertIn(obj.signature.name, self.call("--min-age", "0", "--dry-run"))
+        self.assertTrue(storage.exists(obj.signature.name))
+
+        self.call("--min-age", "0")
+        self.assertFalse(storage.exists(obj.signature.name))
+
+    def test_file_reused_during_gc_kept(self):
+        """Test that files referenced again after the orphans were looked up are kept."""
+        obj = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        storage = obj.signature.storage
+        obj.delete()
+        original_find_orphans = command_module.find_orphans
+
+        def find_orphans(*args, **kwargs):
+            for name in original_find_orphans(*args, **kwargs):
+                # The same signature is saved again, reusing the existing file
+                StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+                yield name
+
+        with mock.patch.object(command_module, "find_orphans", find_orphans):
+            self.assertIn("Deleted 0 orphan", self.call("--min-age", "0"))
+        self.assertTrue(storage.exists(obj.signature.name))
+
+    def test_storage_instances_over_the_same_files(self):
+        # Callable storages give each field its own instance
+        with tempfile.TemporaryDirectory() as location:
+            fields = [
+                model._meta.get_field("signature") for model in (StoredSignatureModel, OtherStoredSignatureModel)
+            ]
+            with (
+                mock.patch.object(fields[0], "storage", FileSystemStorage(location)),
+                mock.patch.object(fields[1], "storage", FileSystemStorage(location)),
+            ):
+                kept = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+                orphan = OtherStoredSignatureModel.objects.create(signature=encode_data_url(make_signature_png()))
+                orphan.delete()
+
+                output = self.call("--min-age", "0", "--dry-run")
+                self.assertNotIn(kept.signature.name, output)
+                self.assertIn(f"{orphan.signature.name}\nFound 1 orphan", output)
+                self.call("--min-age", "0")
+                self.assertTrue(fields[0].storage.exists(kept.signature.name))
+                self.assertFalse(fields[0].storage.exists(orphan.signature.name))
+                kept.delete()
+
+
+class SignaturePadProcessingCommandTests(TestCase):
+    def call(self, *args):
+        out = StringIO()
+        call_command("signature_pad", *args, stdout=out, stderr=StringIO())
+        return out.getvalue()
+
+    def test_scan(self):
+        SignatureModel.objects.create(signature=VALID_DATA_URL)
+        SignatureModel.objects.create(signature="data:image/png;base64,bad")
+        output = self.call("scan", "tests.SignatureModel")
+        self.assertIn("tests.SignatureModel.signature: 1 signature(s)", output)
+        self.assertIn("1 unreadable, formats: png 1.", output)
+
+    def test_unknown_label(self):
+        with self.assertRaisesMessage(CommandError, "No signature fields match: tests.Missing."):
+            self.call("scan", "tests.Missing")
+
+    def test_validate(self):
+        SignatureModel.objects.create(signature=VALID_DATA_URL)
+        invalid = SignatureModel.objects.create(signature="data:image/png;base64,AAAA")
+        stored = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        storage = stored.signature.storage
+        storage.delete(stored.signature.name)
+        storage.save(stored.signature.name, ContentFile(b"GIF89a"))
+        self.addCleanup(storage.delete, stored.signature.name)
+
+        output = self.call("validate", "tests.SignatureModel", "tests.StoredSignatureModel.signature")
+        self.assertIn(f"tests.SignatureModel.signature pk={invalid.pk}: Invalid PNG data", output)
+        self.assertIn(f"tests.StoredSignatureModel.signature pk={stored.pk}: Invalid PNG data", output)
+        self.assertIn("Found 2 invalid signature(s).", output)
+
+    def test_validate_with_workers(self):
+        invalid = [SignatureModel.objects.create(signature="data:image/png;base64,AAAA") for _ in range(3)]
+        SignatureModel.objects.create(signature=VALID_DATA_URL)
+        output = self.call("validate", "tests.SignatureModel", "--workers", "2", "--batch-size", "2")
+        for obj in invalid:
+            self.assertIn(f"pk={obj.pk}:", output)
+        self.assertIn("Found 3 invalid signature(s).", output)
+
+    def test_validate_with_spawned_workers(self):
+        """Test that worker processes started without fork set up Django to unpickle model fields."""
+        invalid = SignatureModel.objects.create(signature="data:image/png;base64,AAAA")
+        with mock.patch("multiprocessing.get_context", return_value=multiprocessing.get_context("spawn")):
+            output = self.call("validate", "tests.SignatureModel", "--workers", "2")
+        self.assertIn(f"pk={invalid.pk}:", output)
+        self.assertIn("Found 1 invalid signature(s).", output)
+
+    def test_checkpoint(self):
+        first = SignatureModel.objects.create(signature="data:image/png;base64,AAAA")
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "checkpoint.json")
+            self.assertIn(f"pk={first.pk}:", self.call("validate", "tests.SignatureModel", "--checkpoint", checkpoint))
+            with open(checkpoint) as f:
+                self.assertEqual(json.load(f), {"validate tests.SignatureModel.signature": str(first.pk)})
+
+            # Resumes after the last row processed
+            second = SignatureModel.objects.create(signature="data:image/png;base64,AAAA")
+            output = self.call("validate", "tests.SignatureModel", "--checkpoint", checkpoint)
+            self.assertNotIn(f"pk={first.pk}:", output)
+            self.assertIn(f"pk={second.pk}:", output)
+
+    @skipUnless(images.Image, "Pillow is not installed")
+    def test_recompress(self):
+        data = make_signature_png()
+        obj = DeferredSignatureModel.objects.create(signature=encode_data_url(data))
+        small = SignatureModel.objects.create(signature=encode_data_url(data))
+
+        self.assertIn(
+            "Would update 1 signature(s)", self.call("recompress", "tests.DeferredSignatureModel", "--dry-run")
+        )
+        self.assertEqual(DeferredSignatureModel.objects.get().signature_size, len(data))
+
+        output = self.call("recompress", "tests.DeferredSignatureModel", "tests.SignatureModel", "--min-size-kb", "1")
+        self.assertIn("tests.DeferredSignatureModel.signature: Updated 1 signature(s)", output)
+        obj = DeferredSignatureModel.objects.get()
+        optimized = decode_data_url(obj.signature)
+        self.assertTrue(is_palette_png(optimized))
+        self.assertEqual(obj.signature_size, len(optimized))
+        self.assertEqual(obj.signature_hash, hashlib.sha256(optimized).hexdigest())
+        small.refresh_from_db()
+        self.assertTrue(is_palette_png(decode_data_url(small.signature)))
+
+        # Optimized signatures are left unchanged
+        self.assertIn("Updated 0 signature(s)", self.call("recompress", "tests.DeferredSignatureModel"))
+
+    @skipUnless(images.Image, "Pillow is not installed")
+    def test_recompress_skips_rows_changed_during_run(self):
+        obj = SignatureModel.objects.create(signature=encode_data_url(make_signature_png()))
+        command = Command(stdout=StringIO())
+        command.subcommand = "recompress"
+        options = {"labels": ["tests.SignatureModel"], "batch_size": 500, "workers": 1, "checkpoint": None}
+        original_process = command.process
+
+        def process(*args, **kwargs):
+            for batch in original_process(*args, **kwargs):
+                SignatureModel.objects.filter(pk=obj.pk).update(signature=VALID_DATA_URL)
+                yield batch
+
+        command.process = process
+        for model, field, label in command.run(options):
+            command.update(model, field, label, _recompress, {**options, "dry_run": False})
+        self.assertIn("1 signature(s) changed during the run were skipped.", command.stdout.getvalue())
+        obj.refresh_from_db()
+        self.assertEqual(obj.signature, VALID_DATA_URL)
+
+    @skipUnless(HAS_WEBP, "Pillow is not installed or lacks WebP support")
+    def test_convert(self):
+        obj = WebPSignatureModel.objects.create(signature=encode_data_url(make_signature_png()))
+        SignatureModel.objects.create(signature=VALID_DATA_URL)
+
+        output = self.call("convert", "--to", "webp", "tests.WebPSignatureModel", "tests.SignatureModel")
+        self.assertIn("tests.WebPSignatureModel.signature: Updated 1 signature(s)", output)
+        obj.refresh_from_db()
+        self.assertTrue(obj.signature.startswith("data:image/webp;base64,"))
+
+        self.call("convert", "--to", "png", "tests.WebPSignatureModel")
+        obj.refresh_from_db()
+        self.assertTrue(obj.signature.startswith("data:image/png;base64,"))
@@ -0,0 +1,99 @@
+# tests/test_export.py
+
+import base64
+import re
+import zipfile
+from io import BytesIO
+from unittest import skipUnless
+
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
+
+from signature_pad import images
+from signature_pad.export import stream_pdf, stream_zip
+from signature_pad.views import SignatureExportView
+
+from .models import BinarySignatureModel, SignatureModel, StoredSignatureModel
+from .test_images import make_signature_png
+from .test_storage import VALID_DATA_URL, VALID_PNG_DATA
+
+PNG_DATA = base64.b64decode(VALID_PNG_DATA)
+
+
+class ExportTests(TestCase):
+    def test_zip(self):
+        objs = [SignatureModel.objects.create(signature=VALID_DATA_URL) for _ in range(3)]
+        SignatureModel.objects.create(signature="")
+
+        chunks = list(stream_zip(SignatureModel.objects.all(), "signature", chunk_size=2))
+        # An entry per signature, then the central directory
+        self.assertEqual(len(chunks), 4)
+        with zipfile.ZipFile(BytesIO(b"".join(chunks))) as archive:
+            self.assertEqual(archive.namelist(), [f"{obj.pk}.png" for obj in objs])
+            self.assertEqual(archive.read(f"{objs[0].pk}.png"), PNG_DATA)
+            self.assertIsNone(archive.testzip())
+
+    @override_settings(USE_TZ=False)
+    def test_zip_without_time_zones(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+
+        with zipfile.ZipFile(BytesIO(b"".join(stream_zip(SignatureModel.objects.all(), "signature")))) as archive:
+            self.assertEqual(archive.read(f"{obj.pk}.png"), PNG_DATA)
+
+    def test_zip_with_workers_and_names(self):
+        for _ in range(5):
+            StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        BinarySignatureModel.objects.create(signature=PNG_DATA)
+
+        chunks = stream_zip(
+            StoredSignatureModel.objects.order_by("-pk"), "signature", get_name=lambda obj: f"doc-{obj.pk}", workers=2
+        )
+        with zipfile.ZipFile(BytesIO(b"".join(chunks))) as archive:
+            pks = StoredSignatureModel.objects.order_by("-pk").values_list("pk", flat=True)
+            self.assertEqual(archive.namelist(), [f"doc-{pk}.png" for pk in pks])
+        with zipfile.ZipFile(
+            BytesIO(b"".join(stream_zip(BinarySignatureModel.objects.all(), "signature")))
+        ) as archive:
+            self.assertEqual(archive.read(archive.namelist()[0]), PNG_DATA)
+
+    @skipUnless(images.Image, "Pillow is not installed")
+    def test_pdf(self):
+        SignatureModel.objects.create(signature=images.encode_data_url(make_signature_png()))
+        SignatureModel.objects.create(signature=images.encode_data_url(make_signature_png(size=(200, 100))))
+
+        pdf = b"".join(stream_pdf(SignatureModel.objects.all(), "signature", get_name=lambda obj: f"Doc (#{obj.pk})"))
+        self.assertTrue(pdf.startswith(b"%PDF-1.4"))
+        self.assertTrue(pdf.endswith(b"%%EOF\n"))
+        self.assertIn(b"/Count 2", pdf)
+        self.assertIn(b"(Doc \\(#1\\)) Tj", pdf)
+        # The cross-reference table points to each object
+        xref = int(re.search(rb"startxref\n(\d+)", pdf)[1])
+        self.assertTrue(pdf[xref:].startswith(b"xref\n0 10\n"))
+        offsets = re.findall(rb"(\d{10}) 00000 n", pdf[xref:])
+        for number, offset in enumerate(offsets, start=1):
+            self.assertTrue(pdf[int(offset) :].startswith(b"%d 0 obj" % number))
+
+
+class SignatureExportViewTests(TestCase):
+    def get(self, **query):
+        view = SignatureExportView.as_view(queryset=SignatureModel.objects.all(), filename="export")
+        return view(RequestFactory().get("/export/", query))
+
+    def test_zip_response(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+        response = self.get()
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="export.zip"')
+        with zipfile.ZipFile(BytesIO(b"".join(response.streaming_content))) as archive:
+            self.assertEqual(archive.namelist(), [f"{obj.pk}.png"])
+
+    @skipUnless(images.Image, "Pillow is not installed")
+    def test_pdf_response(self):
+        SignatureModel.objects.create(signature=images.encode_data_url(make_signature_png()))
+        response = self.get(format="pdf")
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"%PDF"))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(Http404):
+            self.get(format="tar")
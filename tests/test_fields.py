@@ -2,13 +2,14 @@
 
 import base64
 
+from django.contrib import admin
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
-from signature_pad.fields import SignaturePadField, SignaturePadWidget
+from signature_pad.fields import SignatureBytes, SignaturePadBinaryField, SignaturePadField, SignaturePadWidget
 
-from .forms import SignatureModelForm
-from .models import SignatureModel
+from .forms import BinarySignatureModelForm, SignatureModelForm
+from .models import BinarySignatureModel, SignatureModel
 
 
 class SignaturePadWidgetTests(TestCase):
@@ -44,6 +45,83 @@ class SignaturePadWidgetTests(TestCase):
             {"penColor": "rgb(0, 0, 255)", "backgroundColor": "rgb(240, 240, 240)"},
         )
 
+    def test_widget_option_attrs_cached(self):
+        """Test that the data attributes are computed once, and again when options change."""
+        widget = SignaturePadWidget(penColor="rgb(0, 0, 255)")
+        attrs = widget.get_context("signature", None, {})["widget"]["signature_pad_attrs"]
+
+        self.assertEqual(attrs, 'data-signature-pad-pencolor="rgb(0, 0, 255)"')
+        self.assertIs(widget.get_context("signature", None, {})["widget"]["signature_pad_attrs"], attrs)
+
+        widget.signature_pad_options["dotSize"] = 2
+        self.assertEqual(
+            widget.get_context("signature", None, {})["widget"]["signature_pad_attrs"],
+            'data-signature-pad-dotsize="2" data-signature-pad-pencolor="rgb(0, 0, 255)"',
+        )
+
+    def test_widget_options_copied_with_form(self):
+        """Test that changing the options of a form's widget doesn't change other forms."""
+        form = SignatureModelForm()
+        form.fields["signature"].widget.signature_pad_options["penColor"] = "red"
+
+        self.assertIsNone(SignatureModelForm().fields["signature"].widget.signature_pad_options["penColor"])
+
+    def test_fast_render(self):
+        """Test that the fast render path returns the same markup as the template."""
+        attrs = {"id": "id_signature", "required": True, "class": 'a"b'}
+        for value in (None, "data:image/png;base64,<>"):
+            with self.subTest(value=value):
+                widget = SignaturePadWidget(penColor="<red>", upload_url="/upload/")
+                fast_widget = SignaturePadWidget(penColor="<red>", upload_url="/upload/", fast_render=True)
+                self.assertHTMLEqual(
+                    fast_widget.render("signature", value, attrs), widget.render("signature", value, attrs)
+                )
+
+    def test_widget_lazy(self):
+        html = SignaturePadWidget(lazy=True).render("signature", None, {"id": "id_signature"})
+        self.assertIn('data-lazy="true"', html)
+        self.assertNotIn("data-lazy", SignaturePadWidget().render("signature", None, {"id": "id_signature"}))
+
+    def test_widget_size_budget(self):
+        """Test that the model field passes its size budget to the widget."""
+        widget = SignatureModelForm().fields["signature"].widget
+        self.assertEqual(widget.max_size_kb, 100)
+
+        html = widget.render("signature", None, {"id": "id_signature"})
+        self.assertIn('data-max-size-kb="100"', html)
+        self.assertIn('class="signature-pad-warning"', html)
+        self.assertNotIn("signature-pad-warning", SignaturePadWidget().render("signature", None, {"id": "id_x"}))
+
+    def test_formfield_keeps_meta_widget(self):
+        """Test that a widget set in Meta.widgets is kept, and gets the size budget."""
+
+        class Form(SignatureModelForm):
+            class Meta(SignatureModelForm.Meta):
+                widgets = {"signature": SignaturePadWidget(crop=True, output_width=400, max_size_kb=20)}
+
+        widget = Form().fields["signature"].widget
+        self.assertTrue(widget.crop)
+        self.assertEqual(widget.max_size_kb, 20)
+        html = widget.render("signature", None, {"id": "id_signature"})
+        self.assertIn('data-crop="true"', html)
+        self.assertIn('data-output-width="400"', html)
+
+    def test_admin_widget_replaced(self):
+        """Test that the admin gets the signature pad, not the textarea of text fields."""
+        model_admin = admin.ModelAdmin(SignatureModel, admin.AdminSite())
+        for model in (SignatureModel, BinarySignatureModel):
+            with self.subTest(model=model.__name__):
+                formfield = model_admin.formfield_for_dbfield(model._meta.get_field("signature"), request=None)
+                self.assertIsInstance(formfield.widget, SignaturePadWidget)
+                self.assertEqual(formfield.widget.max_size_kb, 100)
+
+    def test_fast_render_options_changed(self):
+        widget = SignaturePadWidget(fast_render=True)
+        widget.render("signature", None, {"id": "id_signature"})
+        widget.signature_pad_options["penColor"] = "blue"
+
+        self.assertIn('data-signature-pad-pencolor="blue"', widget.render("signature", None, {"id": "id_signature"}))
+
 
 class SignaturePadFieldSecurityTests(TestCase):
     def setUp(self):
@@ -86,6 +164,8 @@ class SignaturePadFieldSecurityTests(TestCase):
             "data:image/png;base64,$$$$invalid!!!!",
             # Empty data part
             "data:image/png;base64,",
+            # Truncated base64 data
+            f"data:image/png;base64,{self.valid_png_data[:-3]}",
         ]
 
         for invalid_format in invalid_formats:
@@ -121,6 +201,29 @@ class SignaturePadFieldSecurityTests(TestCase):
         # Verify the error message mentions the size
         self.assertIn("too large", str(cm.exception))
 
+    def test_size_limit_checked_before_decoding(self):
+        """Test that oversized payloads are rejected from their encoded length."""
+        # 200KB of base64 with an invalid trailing character: only the size check can report it
+        oversized = "data:image/png;base64," + "A" * 273064 + "!!!!"
+
+        with self.assertRaises(ValidationError) as cm:
+            self.field.validate_png_data_url(oversized)
+
+        self.assertIn("too large", str(cm.exception))
+
+    def test_missing_ihdr_chunk(self):
+        """Test rejection of a PNG signature not followed by an IHDR chunk."""
+        data = base64.b64encode(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32).decode("ascii")
+
+        with self.assertRaises(ValidationError) as cm:
+            self.field.validate_png_data_url(f"data:image/png;base64,{data}")
+
+        self.assertIn("IHDR", str(cm.exception))
+
+    def test_decode_png_data_url(self):
+        """Test that decoding returns the PNG bytes."""
+        self.assertEqual(self.field.decode_png_data_url(self.valid_data_url), base64.b64decode(self.valid_png_data))
+
     def test_custom_max_size(self):
         """Test field initialization with custom max_size_kb."""
         custom_field = SignaturePadField(max_size_kb=200)
@@ -167,3 +270,64 @@ class SignaturePadFieldSecurityTests(TestCase):
         form = SignatureModelForm(data={"signature": invalid_data})
         self.assertFalse(form.is_valid())
         self.assertIn("signature", form.errors)
+
+
+class SignaturePadBinaryFieldTests(TestCase):
+    def setUp(self):
+        self.valid_png_data = (
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+P+/HgAFeAJdijKHqwAAAABJRU5ErkJggg=="
+        )
+        self.valid_data_url = f"data:image/png;base64,{self.valid_png_data}"
+        self.field = BinarySignatureModel._meta.get_field("signature")
+
+    def test_clean_decodes_data_url(self):
+        """Test that clean validates and decodes the data URL to PNG bytes."""
+        value = self.field.clean(self.valid_data_url, BinarySignatureModel())
+
+        self.assertIsInstance(value, SignatureBytes)
+        self.assertEqual(value.png_bytes, base64.b64decode(self.valid_png_data))
+        self.assertEqual(value.data_url, self.valid_data_url)
+        self.assertEqual(str(value), self.valid_data_url)
+
+    def test_clean_rejects_invalid_data_url(self):
+        with self.assertRaises(ValidationError):
+            self.field.clean("data:image/png;base64,invalid", BinarySignatureModel())
+
+    def test_clean_validates_bytes(self):
+        """Test that raw bytes and strings other than data URLs go through the same checks."""
+        png = base64.b64decode(self.valid_png_data)
+        self.assertEqual(self.field.clean(png, BinarySignatureModel()), png)
+        invalid_values = [
+            (b"garbage" * 10, "signature"),
+            # Bare base64, which BinaryField.to_python would decode
+            ("Z2FyYmFnZQ==", "format"),
+            (png[:33] + b"\x00" * 200 * 1024, "size"),
+        ]
+        for value, code in invalid_values:
+            with self.subTest(code=code), self.assertRaises(ValidationError) as cm:
+                self.field.clean(value, BinarySignatureModel())
+            self.assertEqual(cm.exception.code, code)
+
+    def test_save_and_load(self):
+        """Test that raw bytes are stored and loaded back as SignatureBytes."""
+        obj = BinarySignatureModel(signature=self.valid_data_url)
+        obj.full_clean()
+        obj.save()
+
+        loaded = BinarySignatureModel.objects.get(pk=obj.pk)
+        self.assertIsInstance(loaded.signature, SignatureBytes)
+        self.assertEqual(loaded.signature.data_url, self.valid_data_url)
+
+    def test_form(self):
+        """Test that the field is editable through SignaturePadWidget."""
+        form = BinarySignatureModelForm(data={"signature": self.valid_data_url})
+        self.assertIsInstance(form.fields["signature"].widget, SignaturePadWidget)
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.save().signature.png_bytes, base64.b64decode(self.valid_png_data))
+
+        form = BinarySignatureModelForm(data={"signature": "data:image/png;base64,invalid"})
+        self.assertFalse(form.is_valid())
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = SignaturePadBinaryField(max_size_kb=50).deconstruct()
+        self.assertEqual(kwargs, {"max_size_kb": 50})
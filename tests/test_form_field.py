@@ -0,0 +1,80 @@
+# tests/test_form_field.py
+
+import base64
+import hashlib
+from unittest import mock
+
+from django import forms
+from django.test import TestCase
+
+from signature_pad import images
+from signature_pad.fields import SignatureImage
+from signature_pad.forms import SignaturePadFormField
+from signature_pad.signals import signature_validated
+
+from .forms import BinarySignatureModelForm, DeferredSignatureModelForm, SignatureModelForm
+from .models import BinarySignatureModel, DeferredSignatureModel, SignatureModel
+from .test_storage import VALID_DATA_URL, VALID_PNG_DATA
+
+PNG_DATA = base64.b64decode(VALID_PNG_DATA)
+
+
+class SignaturePadFormFieldTests(TestCase):
+    def test_default_form_field(self):
+        for form_class in (SignatureModelForm, BinarySignatureModelForm):
+            with self.subTest(form_class.__name__):
+                field = form_class().fields["signature"]
+                self.assertIsInstance(field, SignaturePadFormField)
+                self.assertIs(field.signature_field, form_class._meta.model._meta.get_field("signature"))
+
+    def test_parsed_value(self):
+        value = SignaturePadFormField().clean(VALID_DATA_URL)
+        self.assertIsInstance(value, SignatureImage)
+        self.assertEqual(value, PNG_DATA)
+        self.assertEqual((value.format, value.width, value.height), ("png", 1, 1))
+        self.assertEqual(value.digest, hashlib.sha256(PNG_DATA).hexdigest())
+        self.assertEqual(str(value), VALID_DATA_URL)
+        with self.assertRaises(AttributeError):
+            value.width = 2
+
+    def test_standalone_options(self):
+        class Form(forms.Form):
+            signature = SignaturePadFormField(max_size_kb=20, max_pixels=100, required=False)
+
+        form = Form(data={"signature": "data:image/png;base64,AAAA"})
+        self.assertFalse(form.is_valid())
+        self.assertIn("Invalid PNG data: missing PNG signature.", form.errors["signature"])
+        self.assertEqual(form.fields["signature"].widget.max_size_kb, 20)
+        self.assertTrue(Form(data={"signature": ""}).is_valid())
+
+    def test_decoded_once(self):
+        """Test that a submission is decoded once, from the form to the saved size and hash fields."""
+        calls = []
+        signature_validated.connect(receiver := lambda sender, **kwargs: calls.append(kwargs))
+        self.addCleanup(signature_validated.disconnect, receiver)
+
+        for form_class in (SignatureModelForm, BinarySignatureModelForm, DeferredSignatureModelForm):
+            with self.subTest(form_class.__name__):
+                calls.clear()
+                with (
+                    mock.patch.object(images, "decode_data_url", wraps=images.decode_data_url) as decode,
+                    mock.patch.object(base64, "b64decode", wraps=base64.b64decode) as b64decode,
+                ):
+                    form = form_class(data={"signature": VALID_DATA_URL})
+                    self.assertTrue(form.is_valid(), form.errors)
+                    form.save()
+                self.assertEqual(len(calls), 1)
+                decode.assert_not_called()
+                # The head of the payload, then the whole payload
+                self.assertEqual(b64decode.call_count, 2)
+
+        self.assertEqual(SignatureModel.objects.get().signature, VALID_DATA_URL)
+        self.assertEqual(BinarySignatureModel.objects.get().signature, PNG_DATA)
+        obj = DeferredSignatureModel.objects.get()
+        self.assertEqual(obj.signature_hash, hashlib.sha256(PNG_DATA).hexdigest())
+        self.assertEqual(obj.signature_size, len(PNG_DATA))
+
+    def test_invalid_submission(self):
+        form = SignatureModelForm(data={"signature": "data:image/gif;base64,AAAA"})
+        self.assertFalse(form.is_valid())
+        self.assertIn("Invalid PNG data URL format.", form.errors["signature"])
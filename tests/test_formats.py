@@ -0,0 +1,136 @@
+# tests/test_formats.py
+
+import base64
+from io import BytesIO
+from unittest import skipUnless
+
+from django.core.exceptions import ValidationError
+from django.core.files.storage import InMemoryStorage
+from django.test import TestCase
+
+from signature_pad import SignaturePadBinaryField, SignaturePadField
+from signature_pad.images import encode_data_url, get_dimensions, get_image_format, to_png
+
+from .test_storage import VALID_DATA_URL, VALID_PNG_DATA
+
+try:
+    from PIL import features
+except ImportError:
+    features = None
+
+HAS_WEBP = features is not None and features.check("webp")
+
+
+def make_webp(mode="RGBA", size=(40, 20), **options):
+    from PIL import Image
+
+    output = BytesIO()
+    Image.new(mode, size, (0, 0, 0, 255) if mode == "RGBA" else (0, 0, 0)).save(output, "WEBP", **options)
+    return output.getvalue()
+
+
+class ImageHeaderTests(TestCase):
+    def test_png(self):
+        data = base64.b64decode(VALID_PNG_DATA)
+        self.assertEqual(get_image_format(data), "png")
+        self.assertEqual(get_dimensions(data), (1, 1))
+
+    def test_unknown(self):
+        self.assertIsNone(get_image_format(b"GIF89a"))
+        self.assertIsNone(get_dimensions(b"GIF89a" + b"\0" * 30))
+
+    @skipUnless(HAS_WEBP, "Pillow is not installed or lacks WebP support")
+    def test_webp_dimensions(self):
+        """Test that dimensions are read from lossless, lossy and extended WebP headers."""
+        for label, data in (
+            ("lossless", make_webp(lossless=True)),
+            ("lossy", make_webp(mode="RGB")),
+            ("extended", make_webp(mode="RGBA", exif=b"Exif\0\0")),
+        ):
+            with self.subTest(label):
+                self.assertEqual(get_image_format(data), "webp")
+                self.assertEqual(get_dimensions(data[:30]), (40, 20))
+
+    @skipUnless(HAS_WEBP, "Pillow is not installed or lacks WebP support")
+    def test_to_png(self):
+        png = base64.b64decode(VALID_PNG_DATA)
+        self.assertEqual(to_png(png), png)
+        self.assertEqual(get_dimensions(to_png(make_webp(lossless=True))), (40, 20))
+
+
+class FormatValidationTests(TestCase):
+    def setUp(self):
+        self.png_field = SignaturePadField()
+        self.field = SignaturePadField(formats=("png", "webp"))
+
+    def test_png_only_by_default(self):
+        webp_url = "data:image/webp;base64," + base64.b64encode(b"RIFF\0\0\0\0WEBPVP8L" + b"\0" * 20).decode()
+        with self.assertRaisesMessage(ValidationError, "Invalid PNG data URL format."):
+            self.png_field.validate_png_data_url(webp_url)
+
+    def test_unaccepted_format_message(self):
+        with self.assertRaisesMessage(ValidationError, "Accepted formats: PNG, WebP."):
+            self.field.validate_png_data_url("data:image/gif;base64,R0lGODlh")
+
+    def test_png_still_accepted(self):
+        self.field.validate_png_data_url(VALID_DATA_URL)
+
+    def test_invalid_webp_header(self):
+        data = base64.b64encode(b"RIFX\0\0\0\0WEBPVP8L" + b"\0" * 20).decode()
+        with self.assertRaisesMessage(ValidationError, "missing RIFF header"):
+            self.field.validate_png_data_url(f"data:image/webp;base64,{data}")
+
+    def test_missing_dimensions(self):
+        """Test rejection of headers declaring an empty image."""
+        head = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 17
+        with self.assertRaisesMessage(ValidationError, "Invalid PNG data: missing image dimensions."):
+            self.png_field.validate_png(head)
+        # Lossless bitstream without its signature byte
+        data = base64.b64encode(b"RIFF\0\0\0\0WEBPVP8L" + b"\0" * 20).decode()
+        with self.assertRaisesMessage(ValidationError, "Invalid WebP data: missing image dimensions."):
+            self.field.validate_png_data_url(f"data:image/webp;base64,{data}")
+
+    def test_check_unsupported_format(self):
+        errors = SignaturePadField(formats=("png", "gif")).check()
+        self.assertEqual([error.id for error in errors], ["signature_pad.E002"])
+
+    def test_deconstruct(self):
+        self.assertEqual(self.field.deconstruct()[3]["formats"], ("png", "webp"))
+        self.assertNotIn("formats", self.png_field.deconstruct()[3])
+
+    def test_widget_formats(self):
+        widget = self.field.formfield().widget
+        self.assertEqual(widget.formats, ("png", "webp"))
+        self.assertIn('data-formats="png webp"', widget.render("signature", None, {"id": "id_signature"}))
+
+
+@skipUnless(HAS_WEBP, "Pillow is not installed or lacks WebP support")
+class WebpSignatureTests(TestCase):
+    def setUp(self):
+        self.webp = make_webp(lossless=True)
+        self.data_url = encode_data_url(self.webp)
+
+    def test_encode_data_url(self):
+        self.assertTrue(self.data_url.startswith("data:image/webp;base64,"))
+
+    def test_validate_webp(self):
+        field = SignaturePadField(formats=("png", "webp"))
+        self.assertEqual(field.decode_png_data_url(self.data_url), self.webp)
+        field.validate_png(self.webp)
+
+    def test_stored_webp(self):
+        """Test that WebP signatures are stored with their extension, and transcoded to PNG on read."""
+        field = SignaturePadField(formats=("png", "webp"), storage=InMemoryStorage())
+        stored = field.store(self.webp)
+
+        self.assertTrue(stored.name.endswith(".webp"))
+        self.assertEqual(stored.image_bytes, self.webp)
+        self.assertEqual(get_image_format(stored.png_bytes), "png")
+
+    def test_binary_webp(self):
+        field = SignaturePadBinaryField(formats=("webp",))
+        value = field.to_python(self.data_url)
+
+        self.assertEqual(bytes(value), self.webp)
+        self.assertEqual(str(value), self.data_url)
+        self.assertEqual(get_image_format(value.png_bytes), "png")
@@ -0,0 +1,119 @@
+# tests/test_images.py
+
+import hashlib
+import threading
+from io import BytesIO
+from unittest import mock, skipUnless
+
+from django.test import TestCase, override_settings
+
+from signature_pad import images
+from signature_pad.images import decode_data_url, encode_data_url, is_palette_png, optimize_png
+
+from .models import OptimizedSignatureModel
+
+if images.Image is not None:
+    from PIL import Image, ImageDraw
+
+
+def make_signature_png(size=(600, 300), background=(0, 0, 0, 0)):
+    """Draw a signature-like stroke on a full-size RGBA canvas, as the browser does."""
+    image = Image.new("RGBA", size, background)
+    draw = ImageDraw.Draw(image)
+    draw.line([(150, 200), (220, 100), (300, 180), (380, 90), (450, 170)], fill=(0, 0, 0, 255), width=4)
+    output = BytesIO()
+    image.save(output, "PNG")
+    return output.getvalue()
+
+
+@skipUnless(images.Image, "Pillow is not installed")
+class OptimizePngTests(TestCase):
+    def test_trims_to_ink_and_uses_palette(self):
+        data = make_signature_png()
+        optimized = optimize_png(data, colors=2)
+
+        self.assertLess(len(optimized), len(data))
+        self.assertTrue(is_palette_png(optimized))
+        with Image.open(BytesIO(optimized)) as image:
+            self.assertEqual(image.mode, "P")
+            self.assertLess(image.width, 320)
+            self.assertLess(image.height, 130)
+
+    def test_opaque_background(self):
+        data = make_signature_png(background=(245, 245, 245, 255))
+        with Image.open(BytesIO(optimize_png(data))) as image:
+            self.assertLess(image.width, 320)
+
+
+@skipUnless(images.Image, "Pillow is not installed")
+class SignaturePadFieldOptimizeTests(TestCase):
+    def setUp(self):
+        self.data_url = encode_data_url(make_signature_png())
+
+    def test_optimize_on_save(self):
+        obj = OptimizedSignatureModel.objects.create(signature=self.data_url)
+
+        self.assertTrue(is_palette_png(decode_data_url(obj.signature)))
+        self.assertLess(len(obj.signature), len(self.data_url))
+
+        # Already optimized signatures are left unchanged
+        optimized = obj.signature
+        obj.save()
+        self.assertEqual(obj.signature, optimized)
+
+    def test_optimize_in_background(self):
+        """Test that the signature is optimized after commit, through the thread pool."""
+        with mock.patch.object(images, "run_in_background", side_effect=lambda func, *args: func(*args)) as run:
+            with self.captureOnCommitCallbacks(execute=True):
+                obj = OptimizedSignatureModel.objects.create(signature_in_background=self.data_url)
+
+            # The request saves the signature as submitted
+            self.assertEqual(obj.signature_in_background, self.data_url)
+
+        run.assert_called_once()
+        obj.refresh_from_db()
+        optimized = decode_data_url(obj.signature_in_background)
+        self.assertTrue(is_palette_png(optimized))
+        # The metadata fields describe the optimized signature
+        self.assertEqual(obj.signature_in_background_size, len(optimized))
+        self.assertEqual(obj.signature_in_background_hash, hashlib.sha256(optimized).hexdigest())
+
+    def test_optimize_in_background_keeps_newer_value(self):
+        field = OptimizedSignatureModel._meta.get_field("signature_in_background")
+        obj = OptimizedSignatureModel.objects.create(signature_in_background=self.data_url)
+        OptimizedSignatureModel.objects.update(signature_in_background="")
+
+        field.optimize_saved(OptimizedSignatureModel, obj.pk, self.data_url)
+
+        obj.refresh_from_db()
+        self.assertEqual(obj.signature_in_background, "")
+
+
+class SignaturePadFieldOptimizeCheckTests(TestCase):
+    def test_pillow_required(self):
+        field = OptimizedSignatureModel._meta.get_field("signature")
+        with mock.patch.object(images, "Image", None):
+            errors = field.check()
+        self.assertEqual([error.id for error in errors], ["signature_pad.E001"])
+
+
+class ExecutorTests(TestCase):
+    @override_settings(SIGNATURE_PAD_MAX_WORKERS=2)
+    def test_shared_pool_bounds_workers(self):
+        with mock.patch.object(images, "_executor", None):
+            executor = images.get_executor()
+            self.addCleanup(executor.shutdown)
+            self.assertIs(images.get_executor(), executor)
+
+            release = threading.Event()
+            threads = set()
+
+            def task():
+                threads.add(threading.current_thread().name)
+                release.wait(5)
+
+            futures = [images.run_in_background(task) for _ in range(20)]
+            release.set()
+            for future in futures:
+                future.result()
+        self.assertLessEqual(len(threads), 2)
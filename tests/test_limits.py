@@ -0,0 +1,92 @@
+# tests/test_limits.py
+
+import base64
+import struct
+import zlib
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from signature_pad import SignaturePadBinaryField, SignaturePadField
+from signature_pad.images import PNG_SIGNATURE, get_png_data_size, verify_png_data
+
+
+def make_chunk(chunk_type, data):
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def make_png(width, height, raw_size=None, color_type=6, interlace=0):
+    """Build an RGBA PNG whose compressed data inflates to ``raw_size`` bytes."""
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, interlace)
+    if raw_size is None:
+        raw_size = height * (1 + width * 4)
+    return (
+        PNG_SIGNATURE
+        + make_chunk(b"IHDR", ihdr)
+        + make_chunk(b"IDAT", zlib.compress(b"\0" * raw_size, 9))
+        + make_chunk(b"IEND", b"")
+    )
+
+
+def to_data_url(data):
+    return "data:image/png;base64," + base64.b64encode(data).decode()
+
+
+class PngDataTests(TestCase):
+    def test_data_size(self):
+        self.assertEqual(get_png_data_size(make_png(10, 3)), 3 * 41)
+        # Adam7 passes of a 3x3 RGB image: 1x1, none, none, 1x1, 2x1, 1x2 and 3x1 pixels
+        self.assertEqual(get_png_data_size(make_png(3, 3, color_type=2, interlace=1)), 33)
+        self.assertIsNone(get_png_data_size(make_png(3, 3, color_type=5)))
+
+    def test_verify(self):
+        self.assertIsNone(verify_png_data(make_png(10, 10)))
+        self.assertEqual(verify_png_data(make_png(10, 10, raw_size=10)), "truncated")
+        self.assertEqual(verify_png_data(make_png(10, 10)[:-30]), "invalid")
+
+    def test_verify_bomb(self):
+        """Test that a stream inflating far past the declared size is rejected early."""
+        self.assertEqual(verify_png_data(make_png(10, 10, raw_size=50 * 1024 * 1024)), "too_large")
+
+
+class DimensionLimitTests(TestCase):
+    def test_max_width_and_height(self):
+        field = SignaturePadField(max_width=600, max_height=200)
+        field.validate_png_data_url(to_data_url(make_png(600, 200)))
+        for width, height in ((601, 200), (600, 201)):
+            with self.subTest(width=width, height=height):
+                with self.assertRaises(ValidationError) as cm:
+                    field.validate_png_data_url(to_data_url(make_png(width, height)))
+                self.assertIn(f"{width}×{height}", cm.exception.messages[0])
+
+    def test_max_pixels(self):
+        field = SignaturePadBinaryField(max_pixels=10_000)
+        field.validate_png(make_png(100, 100))
+        with self.assertRaises(ValidationError):
+            field.validate_png(make_png(101, 100))
+
+    def test_checked_before_decoding(self):
+        """Test that dimensions are checked from the head of the data URL."""
+        field = SignaturePadField(max_pixels=100)
+        value = to_data_url(make_png(20, 20))[:66] + "!" * 20
+        with self.assertRaisesMessage(ValidationError, "400 pixels"):
+            field.validate_png_data_url(value)
+
+    def test_verify_data(self):
+        field = SignaturePadField(verify_data=True)
+        field.validate_png_data_url(to_data_url(make_png(10, 10)))
+        with self.assertRaisesMessage(ValidationError, "exceeds the declared dimensions"):
+            field.validate_png_data_url(to_data_url(make_png(10, 10, raw_size=1024 * 1024)))
+        with self.assertRaisesMessage(ValidationError, "truncated"):
+            field.validate_png(make_png(10, 10, raw_size=200))
+        SignaturePadField().validate_png_data_url(to_data_url(make_png(10, 10, raw_size=1024 * 1024)))
+
+    def test_deconstruct(self):
+        field = SignaturePadField(max_width=800, max_pixels=10**6, verify_data=True)
+        _, _, _, kwargs = field.deconstruct()
+        self.assertEqual(kwargs["max_width"], 800)
+        self.assertEqual(kwargs["max_pixels"], 10**6)
+        self.assertTrue(kwargs["verify_data"])
+        self.assertNotIn("max_height", kwargs)
+        _, _, _, kwargs = SignaturePadField().deconstruct()
+        self.assertNotIn("verify_data", kwargs)
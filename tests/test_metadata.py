@@ -0,0 +1,91 @@
+# tests/test_metadata.py
+
+import base64
+import hashlib
+
+from django.db import models
+from django.test import TestCase
+from django.test.utils import isolate_apps
+
+from signature_pad import SignaturePadField
+
+from .models import DeferredSignatureModel, SignatureModel
+
+VALID_PNG_DATA = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+P+/HgAFeAJdijKHqwAAAABJRU5ErkJggg=="
+VALID_DATA_URL = f"data:image/png;base64,{VALID_PNG_DATA}"
+VALID_PNG_BYTES = base64.b64decode(VALID_PNG_DATA)
+
+
+class DeferByDefaultTests(TestCase):
+    def test_default_manager_defers_field(self):
+        DeferredSignatureModel.objects.create(name="doc", signature=VALID_DATA_URL)
+
+        obj = DeferredSignatureModel.objects.get()
+        self.assertIn("signature", obj.get_deferred_fields())
+
+        # Accessing the field loads it on demand
+        self.assertEqual(obj.signature, VALID_DATA_URL)
+
+    def test_base_manager_loads_field(self):
+        DeferredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        obj = DeferredSignatureModel._base_manager.get()
+        self.assertNotIn("signature", obj.get_deferred_fields())
+
+    def test_manager_keeps_class_name(self):
+        manager = DeferredSignatureModel.objects
+        self.assertEqual(manager.__class__.__name__, "Manager")
+        self.assertIsInstance(manager, models.Manager)
+
+    def test_other_models_unchanged(self):
+        SignatureModel.objects.create(signature=VALID_DATA_URL)
+        self.assertEqual(SignatureModel.objects.get().get_deferred_fields(), set())
+
+
+class MetadataFieldsTests(TestCase):
+    def test_metadata_updated_on_save(self):
+        obj = DeferredSignatureModel.objects.create(signature=VALID_DATA_URL)
+
+        self.assertEqual(obj.signature_size, len(VALID_PNG_BYTES))
+        self.assertEqual(obj.signature_hash, hashlib.sha256(VALID_PNG_BYTES).hexdigest())
+
+        obj.signature = ""
+        obj.save()
+        self.assertIsNone(obj.signature_size)
+        self.assertEqual(obj.signature_hash, "")
+
+    def test_info_without_loading_signature(self):
+        DeferredSignatureModel.objects.create(name="signed", signature=VALID_DATA_URL)
+        DeferredSignatureModel.objects.create(name="unsigned")
+
+        objs = list(DeferredSignatureModel.objects.order_by("pk"))
+        with self.assertNumQueries(0):
+            self.assertTrue(objs[0].signature_info.has_signature)
+            self.assertEqual(objs[0].signature_info.size, len(VALID_PNG_BYTES))
+            self.assertFalse(objs[1].signature_info)
+
+    def test_saving_deferred_instance_keeps_metadata(self):
+        DeferredSignatureModel.objects.create(name="doc", signature=VALID_DATA_URL)
+        obj = DeferredSignatureModel.objects.get()
+
+        obj.name = "renamed"
+        with self.assertNumQueries(1):
+            obj.save()
+
+        obj = DeferredSignatureModel._base_manager.get()
+        self.assertEqual(obj.signature, VALID_DATA_URL)
+        self.assertEqual(obj.signature_size, len(VALID_PNG_BYTES))
+
+    def test_info_without_metadata_fields(self):
+        obj = SignatureModel(signature=VALID_DATA_URL)
+        self.assertTrue(obj.signature_info.has_signature)
+        self.assertIsNone(obj.signature_info.size)
+
+    @isolate_apps("tests")
+    def test_info_keeps_model_attribute(self):
+        class Document(models.Model):
+            signature = SignaturePadField()
+
+            def signature_info(self):
+                return "defined by the model"
+
+        self.assertEqual(Document(signature=VALID_DATA_URL).signature_info(), "defined by the model")
@@ -0,0 +1,121 @@
+# tests/test_operations.py
+
+from unittest import mock
+
+from django.db import NotSupportedError, connection, migrations, models
+from django.db.migrations.state import ProjectState
+from django.test import TestCase
+
+from signature_pad import SignaturePadField
+from signature_pad.operations import AlterSignatureStorage
+
+
+def make_state(**options):
+    state = ProjectState()
+    state.add_model(
+        migrations.state.ModelState(
+            "tests",
+            "Contract",
+            [("id", models.AutoField(primary_key=True)), ("signature", SignaturePadField(**options))],
+        )
+    )
+    return state
+
+
+def postgresql_editor(pg_version=160000):
+    editor = mock.Mock()
+    editor.connection.vendor = "postgresql"
+    editor.connection.alias = "default"
+    editor.connection.pg_version = pg_version
+    editor.quote_name = lambda name: f'"{name}"'
+    return editor
+
+
+class AlterSignatureStorageTests(TestCase):
+    def test_field_options(self):
+        field = SignaturePadField(db_storage="external", db_compression="lz4")
+        _, _, _, kwargs = field.deconstruct()
+        self.assertEqual(kwargs["db_storage"], "external")
+        self.assertEqual(kwargs["db_compression"], "lz4")
+        self.assertNotIn("db_storage", SignaturePadField().deconstruct()[3])
+        # Changing the options doesn't alter the column
+        old_field = SignaturePadField()
+        for f in (old_field, field):
+            f.set_attributes_from_name("signature")
+        self.assertFalse(connection.schema_editor()._field_should_be_altered(old_field, field))
+
+    def test_invalid_options(self):
+        field = SignaturePadField(db_storage="toast", db_compression="zstd")
+        field.set_attributes_from_name("signature")
+        self.assertEqual([error.id for error in field.check()], ["signature_pad.E004", "signature_pad.E005"])
+        with self.assertRaises(ValueError):
+            AlterSignatureStorage("contract", "signature", storage="toast")
+        with self.assertRaises(ValueError):
+            AlterSignatureStorage("contract", "signature", old_compression="zstd")
+
+    def test_postgresql(self):
+        from_state = make_state()
+        to_state = make_state(db_storage="external", db_compression="lz4")
+        operation = AlterSignatureStorage("Contract", "signature")
+        editor = postgresql_editor()
+        operation.database_forwards("tests", editor, from_state, to_state)
+        editor.execute.assert_called_once_with(
+            'ALTER TABLE "tests_contract" ALTER COLUMN "signature" SET STORAGE EXTERNAL, '
+            'ALTER COLUMN "signature" SET COMPRESSION lz4'
+        )
+
+    def test_unapply(self):
+        """Test that reversing the migration restores the previous options, not those of the altered field."""
+        migration = migrations.Migration("0002_alter_contract_signature", "tests")
+        migration.operations = [
+            migrations.AlterField(
+                "Contract", "signature", SignaturePadField(db_storage="external", db_compression="lz4")
+            ),
+            AlterSignatureStorage("Contract", "signature"),
+        ]
+        editor = postgresql_editor()
+        migration.unapply(make_state(), editor)
+        editor.execute.assert_called_once_with(
+            'ALTER TABLE "tests_contract" ALTER COLUMN "signature" SET STORAGE EXTENDED, '
+            'ALTER COLUMN "signature" SET COMPRESSION default'
+        )
+
+        migration.operations[-1] = AlterSignatureStorage(
+            "Contract", "signature", old_storage="main", old_compression="pglz"
+        )
+        editor = postgresql_editor()
+        migration.unapply(make_state(db_storage="main", db_compression="pglz"), editor)
+        editor.execute.assert_called_once_with(
+            'ALTER TABLE "tests_contract" ALTER COLUMN "signature" SET STORAGE MAIN, '
+            'ALTER COLUMN "signature" SET COMPRESSION pglz'
+        )
+
+    def test_arguments_override_field_options(self):
+        state = make_state(db_storage="external")
+        editor = postgresql_editor()
+        AlterSignatureStorage("Contract", "signature", storage="main", compression="pglz").database_forwards(
+            "tests", editor, state, state
+        )
+        self.assertIn("SET STORAGE MAIN", editor.execute.call_args[0][0])
+        self.assertIn("SET COMPRESSION pglz", editor.execute.call_args[0][0])
+
+    def test_compression_requires_postgresql_14(self):
+        state = make_state(db_storage="external")
+        editor = postgresql_editor(pg_version=130000)
+        AlterSignatureStorage("Contract", "signature").database_forwards("tests", editor, state, state)
+        editor.execute.assert_called_once_with(
+            'ALTER TABLE "tests_contract" ALTER COLUMN "signature" SET STORAGE EXTERNAL'
+        )
+        with self.assertRaises(NotSupportedError):
+            AlterSignatureStorage("Contract", "signature", compression="lz4").database_forwards(
+                "tests", editor, state, state
+            )
+
+    def test_noop_on_other_databases(self):
+        state = make_state(db_storage="external", db_compression="lz4")
+        operation = AlterSignatureStorage("Contract", "signature")
+        editor = connection.schema_editor()
+        with self.assertNumQueries(0):
+            operation.database_forwards("tests", editor, state, state)
+        self.assertEqual(operation.migration_name_fragment, "alter_contract_signature_storage")
+        self.assertEqual(operation.deconstruct(), ("AlterSignatureStorage", ("Contract", "signature"), {}))
@@ -0,0 +1,139 @@
+# tests/test_serving.py
+
+import base64
+import pickle
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from signature_pad import serving
+from signature_pad.fields import SignatureBytes, SignatureDataURL
+from signature_pad.serving import iter_chunks
+
+from .models import BinarySignatureModel, DeferredSignatureModel, SignatureModel, StoredSignatureModel
+from .test_storage import VALID_DATA_URL, VALID_PNG_DATA
+
+PNG_DATA = base64.b64decode(VALID_PNG_DATA)
+
+
+class ServeSignatureTests(TestCase):
+    def get(self, url, **headers):
+        response = self.client.get(url, headers=headers)
+        response.body = b"".join(response.streaming_content) if response.streaming else response.content
+        return response
+
+    def test_inline_signature(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+        self.assertIsInstance(obj.signature, SignatureDataURL)
+        self.assertEqual(obj.signature, VALID_DATA_URL)
+
+        response = self.get(obj.signature.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(response["Content-Length"], str(len(PNG_DATA)))
+        self.assertEqual(response.body, PNG_DATA)
+        self.assertIn("immutable", response["Cache-Control"])
+
+    def test_binary_and_stored_signatures(self):
+        binary = BinarySignatureModel.objects.create(signature=PNG_DATA)
+        stored = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        binary = BinarySignatureModel.objects.get()
+        stored = StoredSignatureModel.objects.get()
+
+        self.assertEqual(self.get(binary.signature.url).body, PNG_DATA)
+        # Stored signatures are served by the storage
+        self.assertEqual(stored.signature.url, stored.signature.storage.url(stored.signature.name))
+        url = serving.get_signature_url(stored, "signature")
+        response = self.get(url)
+        self.assertEqual(response.body, PNG_DATA)
+        self.assertEqual(response["ETag"], f'"{stored.signature.digest}"')
+
+    def test_conditional_get(self):
+        obj = DeferredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        url = obj.signature.url
+        response = self.get(url)
+        self.assertEqual(response["ETag"], f'"{obj.signature_hash}"')
+
+        response = self.get(url, if_none_match=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b"")
+
+        # Without the version of the URL, the response must be revalidated
+        response = self.get(url.split("?")[0])
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+
+    def test_range(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+        url = obj.signature.url
+        etag = self.get(url)["ETag"]
+        for header, expected in (
+            ("bytes=0-7", PNG_DATA[:8]),
+            ("bytes=60-", PNG_DATA[60:]),
+            ("bytes=-10", PNG_DATA[-10:]),
+            ("bytes=8-1000", PNG_DATA[8:]),
+        ):
+            with self.subTest(header):
+                response = self.get(url, range=header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(response.body, expected)
+                self.assertEqual(response["Content-Length"], str(len(expected)))
+        response = self.get(url, range="bytes=0-7")
+        self.assertEqual(response["Content-Range"], f"bytes 0-7/{len(PNG_DATA)}")
+
+        self.assertEqual(self.get(url, range="bytes=500-").status_code, 416)
+        # Ranges of another version get the whole image
+        self.assertEqual(self.get(url, range="bytes=0-7", if_range='"other"').status_code, 200)
+        self.assertEqual(self.get(url, range="bytes=0-7", if_range=etag).status_code, 206)
+
+    def test_invalid_urls(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+        url = obj.signature.url
+        token = url.split("/")[-2]
+        self.assertEqual(self.client.get(url.replace(token, token[:-1] + "x")).status_code, 404)
+        obj.delete()
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.post(url).status_code, 405)
+
+    def test_expired_url(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+        url = obj.signature.url
+        with override_settings(SIGNATURE_PAD_URL_MAX_AGE=60):
+            self.assertEqual(self.client.get(url).status_code, 200)
+            with mock.patch("django.core.signing.time.time", return_value=time.time() + 61):
+                self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_access_check(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+        check = mock.Mock(return_value=False)
+        with override_settings(SIGNATURE_PAD_ACCESS_CHECK=check):
+            self.assertEqual(self.client.get(obj.signature.url).status_code, 404)
+            check.return_value = True
+            self.assertEqual(self.client.get(obj.signature.url).status_code, 200)
+        request, instance, field_name = check.call_args[0]
+        self.assertEqual((instance.pk, field_name), (obj.pk, "signature"))
+
+    def test_unsaved_instance(self):
+        with self.assertRaises(ValueError):
+            SignatureModel(signature=VALID_DATA_URL).signature.url
+        with self.assertRaises(ValueError):
+            SignatureBytes(PNG_DATA).url
+
+    def test_values_pickle_without_instance(self):
+        obj = SignatureModel.objects.create(signature=VALID_DATA_URL)
+        value = pickle.loads(pickle.dumps(obj.signature))
+        self.assertEqual(value, VALID_DATA_URL)
+        self.assertIsNone(value.instance)
+        self.assertIsInstance(pickle.loads(pickle.dumps(obj)).signature, SignatureDataURL)
+
+
+class IterChunksTests(TestCase):
+    def test_data_url_decoded_in_chunks(self):
+        data = bytes(range(256)) * 1000
+        value = "data:image/png;base64," + base64.b64encode(data).decode()
+        with mock.patch.object(serving, "SERVE_BASE64_CHUNK_SIZE", 400):
+            chunks = list(iter_chunks(value))
+            self.assertEqual(b"".join(chunks), data)
+            self.assertEqual(len(chunks[0]), 300)
+            self.assertEqual(b"".join(iter_chunks(value, 1000, 5000)), data[1000:5000])
+        self.assertEqual(serving.get_size(value), len(data))
@@ -0,0 +1,73 @@
+# tests/test_signals.py
+
+import base64
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from signature_pad import SignaturePadBinaryField, SignaturePadField, SignaturePadWidget
+from signature_pad.signals import signature_rendered, signature_saved, signature_validated
+
+from .models import BinarySignatureModel, SignatureModel
+from .test_storage import VALID_DATA_URL, VALID_PNG_DATA
+
+
+class SignalsTests(TestCase):
+    def connect(self, signal):
+        calls = []
+
+        def receiver(sender, **kwargs):
+            calls.append({"sender": sender, **kwargs})
+
+        signal.connect(receiver)
+        self.addCleanup(signal.disconnect, receiver)
+        return calls
+
+    def test_validated(self):
+        calls = self.connect(signature_validated)
+        field = SignaturePadField()
+        field.validate_png_data_url(VALID_DATA_URL)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0]["sender"], SignaturePadField)
+        self.assertIs(calls[0]["field"], field)
+        self.assertEqual(calls[0]["size"], len(VALID_DATA_URL))
+        self.assertIsNone(calls[0]["code"])
+        self.assertGreaterEqual(calls[0]["duration"], 0)
+
+    def test_rejection_codes(self):
+        calls = self.connect(signature_validated)
+        field = SignaturePadField(max_size_kb=1)
+        for value, code in (
+            ("data:image/gif;base64,AAAA", "format"),
+            ("data:image/png;base64,AAA!", "base64"),
+            ("data:image/png;base64,AAAA", "signature"),
+            ("data:image/png;base64," + "A" * 2000, "size"),
+        ):
+            with self.subTest(code=code):
+                with self.assertRaises(ValidationError) as cm:
+                    field.validate_png_data_url(value)
+                self.assertEqual(cm.exception.code, code)
+                self.assertEqual(calls[-1]["code"], code)
+
+    def test_validated_raw_bytes(self):
+        calls = self.connect(signature_validated)
+        with self.assertRaises(ValidationError):
+            SignaturePadBinaryField().validate_png(b"GIF89a" + b"\0" * 30)
+        self.assertEqual(calls[0]["sender"], SignaturePadBinaryField)
+        self.assertEqual(calls[0]["code"], "signature")
+
+    def test_saved(self):
+        calls = self.connect(signature_saved)
+        SignatureModel.objects.create(signature=VALID_DATA_URL)
+        data = base64.b64decode(VALID_PNG_DATA)
+        BinarySignatureModel.objects.bulk_create([BinarySignatureModel(signature=data)])
+        self.assertEqual([call["sender"] for call in calls], [SignatureModel, BinarySignatureModel])
+        self.assertEqual(calls[0]["size"], len(VALID_DATA_URL))
+        self.assertEqual(calls[1]["size"], len(data))
+
+    def test_rendered(self):
+        calls = self.connect(signature_rendered)
+        html = SignaturePadWidget(fast_render=True).render("signature", None, {"id": "id_signature"})
+        self.assertIn("<canvas", html)
+        self.assertEqual(calls[0]["name"], "signature")
+        self.assertGreaterEqual(calls[0]["duration"], 0)
@@ -0,0 +1,123 @@
+# tests/test_similarity.py
+
+import random
+from io import BytesIO
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from signature_pad import images
+from signature_pad.forms import SignaturePadFormField
+from signature_pad.similarity import MAX_SIMILARITY_DISTANCE, hamming_distance, to_signed
+
+from .models import PhashSignatureModel
+
+if images.Image:
+    from PIL import Image, ImageDraw
+
+STROKE = [(150, 200), (220, 100), (300, 180), (380, 90), (450, 170)]
+OTHER_STROKE = [(100, 100), (160, 220), (240, 120), (300, 240), (480, 110)]
+
+
+def draw_signature(points=STROKE, size=(600, 300), offset=(0, 0), color=(0, 0, 0, 255), background=(0, 0, 0, 0)):
+    image = Image.new("RGBA", size, background)
+    ImageDraw.Draw(image).line([(x + offset[0], y + offset[1]) for x, y in points], fill=color, width=4)
+    output = BytesIO()
+    image.save(output, "PNG")
+    return output.getvalue()
+
+
+@skipUnless(images.Image, "Pillow is not installed")
+class PerceptualHashTests(TestCase):
+    def test_hash_ignores_position_and_colors(self):
+        phash = images.perceptual_hash(draw_signature())
+        self.assertNotEqual(phash, 0)
+        self.assertLess(phash, 1 << 64)
+        for variant in (
+            draw_signature(size=(800, 400), offset=(120, 60)),
+            draw_signature(color=(20, 40, 200, 255), background=(250, 250, 240, 255)),
+        ):
+            self.assertLessEqual(hamming_distance(phash, images.perceptual_hash(variant)), 4)
+        self.assertGreater(hamming_distance(phash, images.perceptual_hash(draw_signature(OTHER_STROKE))), 16)
+
+    def test_blank_signature(self):
+        self.assertEqual(images.perceptual_hash(draw_signature(points=[])), 0)
+
+    def test_submissions_not_cached(self):
+        # Hashes are computed from user submissions, which mustn't be kept in memory
+        self.assertFalse(hasattr(images.perceptual_hash, "cache_info"))
+
+
+@skipUnless(images.Image, "Pillow is not installed")
+class PhashFieldTests(TestCase):
+    def test_saved_with_signature(self):
+        data = draw_signature()
+        obj = PhashSignatureModel.objects.create(signature=images.encode_data_url(data))
+        self.assertEqual(obj.signature_phash, to_signed(images.perceptual_hash(data)))
+        obj.signature = None
+        obj.save()
+        self.assertIsNone(PhashSignatureModel.objects.get().signature_phash)
+
+    def test_computed_in_clean(self):
+        field = PhashSignatureModel._meta.get_field("signature")
+        value = SignaturePadFormField(signature_field=field).clean(images.encode_data_url(draw_signature()))
+        obj = PhashSignatureModel()
+        field.clean(value, obj)
+        self.assertIsNotNone(obj.signature_phash)
+        # The image hashed in clean isn't hashed again on save
+        obj.signature = value
+        obj.signature_phash = 42
+        obj.save()
+        self.assertEqual(obj.signature_phash, 42)
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = PhashSignatureModel._meta.get_field("signature").deconstruct()
+        self.assertEqual(kwargs["phash_field"], "signature_phash")
+
+
+class SimilarSignaturesTests(TestCase):
+    def test_multi_index_search_matches_linear_scan(self):
+        rng = random.Random(0)
+        query = rng.getrandbits(64)
+        hashes = [rng.getrandbits(64) for _ in range(200)]
+        # Hashes at every distance from the query, with the differing bits spread across segments
+        for distance in range(MAX_SIMILARITY_DISTANCE + 3):
+            hashes.append(query ^ sum(1 << bit for bit in rng.sample(range(64), distance)))
+        PhashSignatureModel.objects.bulk_create(
+            PhashSignatureModel(signature="", signature_phash=to_signed(phash)) for phash in hashes
+        )
+
+        for max_distance in (0, 3, 6, MAX_SIMILARITY_DISTANCE):
+            with self.subTest(max_distance=max_distance):
+                matches = PhashSignatureModel.objects.similar_signatures(query, max_distance=max_distance)
+                expected = sorted(
+                    hamming_distance(query, phash)
+                    for phash in hashes
+                    if hamming_distance(query, phash) <= max_distance
+                )
+                self.assertEqual([obj.similarity_distance for obj in matches], expected)
+
+    def test_uses_segment_indexes(self):
+        queryset = PhashSignatureModel.objects.alias(
+            segment=PhashSignatureModel._meta.indexes[0].expressions[0]
+        ).filter(segment__in=[1, 2])
+        if connection.vendor == "sqlite":
+            self.assertIn("tests_signature_phash_0", queryset.explain())
+
+    @skipUnless(images.Image, "Pillow is not installed")
+    def test_similar_to_a_signature(self):
+        original = PhashSignatureModel.objects.create(signature=images.encode_data_url(draw_signature()))
+        PhashSignatureModel.objects.create(signature=images.encode_data_url(draw_signature(OTHER_STROKE)))
+        submitted = draw_signature(size=(700, 350), offset=(40, 20), color=(0, 0, 120, 255))
+        self.assertEqual(PhashSignatureModel.objects.similar_signatures(submitted), [original])
+        self.assertEqual(
+            PhashSignatureModel.objects.filter(pk=original.pk).similar_signatures(images.encode_data_url(submitted)),
+            [original],
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PhashSignatureModel.objects.similar_signatures(0, max_distance=MAX_SIMILARITY_DISTANCE + 1)
+        with self.assertRaises(ValueError):
+            PhashSignatureModel.objects.similar_signatures(0, field_name="signature_phash")
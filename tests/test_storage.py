@@ -0,0 +1,84 @@
+# tests/test_storage.py
+
+import base64
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from signature_pad.storage import StoredSignature, copy_to_binary, move_to_storage
+
+from .models import BinarySignatureModel, StoredSignatureModel
+
+VALID_PNG_DATA = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+P+/HgAFeAJdijKHqwAAAABJRU5ErkJggg=="
+VALID_DATA_URL = f"data:image/png;base64,{VALID_PNG_DATA}"
+
+
+class SignaturePadStorageTests(TestCase):
+    def setUp(self):
+        self.field = StoredSignatureModel._meta.get_field("signature")
+
+    def test_save_writes_png_to_storage(self):
+        """Test that saving stores the decoded PNG and keeps only its key in the row."""
+        obj = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+
+        self.assertIsInstance(obj.signature, StoredSignature)
+        self.assertTrue(obj.signature.startswith("signatures/"))
+        self.assertTrue(obj.signature.url.startswith("/media/signatures/"))
+        self.assertEqual(obj.signature.read(), base64.b64decode(VALID_PNG_DATA))
+
+        raw = StoredSignatureModel.objects.values_list("signature", flat=True).get(pk=obj.pk)
+        self.assertEqual(raw, obj.signature.name)
+
+    def test_load_from_db(self):
+        """Test that values loaded from the database expose the storage."""
+        obj = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        loaded = StoredSignatureModel.objects.get(pk=obj.pk)
+
+        self.assertIsInstance(loaded.signature, StoredSignature)
+        self.assertEqual(loaded.signature.url, obj.signature.url)
+
+    def test_identical_signatures_share_key(self):
+        """Test that keys are content-addressed."""
+        first = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        second = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        self.assertEqual(first.signature, second.signature)
+
+    def test_clean_rejects_arbitrary_keys(self):
+        """Test that only stored signatures skip data URL validation."""
+        obj = StoredSignatureModel.objects.create(signature=VALID_DATA_URL)
+        self.field.clean(obj.signature, obj)
+
+        with self.assertRaises(ValidationError):
+            self.field.clean(str(obj.signature), obj)
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = self.field.deconstruct()
+        self.assertIs(kwargs["storage"], self.field.storage)
+        self.assertNotIn("upload_to", kwargs)
+
+    def test_move_to_storage(self):
+        """Test migrating existing inline rows in batches."""
+        objs = [StoredSignatureModel.objects.create() for _ in range(3)]
+        StoredSignatureModel.objects.update(signature=VALID_DATA_URL)
+
+        moved = move_to_storage(StoredSignatureModel, "signature", batch_size=2)
+
+        self.assertEqual(moved, 3)
+        for obj in objs:
+            obj.refresh_from_db()
+            self.assertTrue(obj.signature.startswith("signatures/"))
+        self.assertEqual(move_to_storage(StoredSignatureModel, "signature"), 0)
+
+
+class CopyToBinaryTests(TestCase):
+    def test_copy_to_binary(self):
+        """Test converting inline data URLs to a binary column in batches."""
+        objs = [BinarySignatureModel.objects.create(legacy_signature=VALID_DATA_URL) for _ in range(3)]
+        BinarySignatureModel.objects.create()
+
+        copied = copy_to_binary(BinarySignatureModel, "legacy_signature", "signature", batch_size=2)
+
+        self.assertEqual(copied, 3)
+        for obj in objs:
+            obj.refresh_from_db()
+            self.assertEqual(obj.signature.data_url, VALID_DATA_URL)
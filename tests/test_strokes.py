@@ -0,0 +1,125 @@
+# tests/test_strokes.py
+
+import json
+from io import BytesIO
+from unittest import skipUnless
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from signature_pad import images
+from signature_pad.fields import SignaturePadWidget
+from signature_pad.strokes import SignatureStrokes, parse_strokes
+
+from .models import StrokesSignatureModel
+
+
+def make_payload(points=((10, 20), (30, 40), (50, 20)), color="rgb(0, 0, 0)", width=200, height=100, strokes=None):
+    """Encode the absolute points of one stroke, or of several ``strokes``, as the widget does."""
+    encoded = []
+    time = 0
+    for stroke_points in strokes or [points]:
+        flat = []
+        last_x = last_y = last_time = 0
+        for x, y in stroke_points:
+            time += 16
+            flat += [x - last_x, y - last_y, time - last_time, 50]
+            last_x, last_y, last_time = x, y, time
+        encoded.append({"c": color, "min": 0.5, "max": 2.5, "p": flat})
+    return json.dumps({"v": 1, "w": width, "h": height, "s": encoded})
+
+
+class ParseStrokesTests(TestCase):
+    def test_valid_payload(self):
+        data = parse_strokes(make_payload())
+
+        self.assertEqual((data["width"], data["height"]), (200, 100))
+        self.assertEqual(data["strokes"][0]["points"], [(10, 20, 16, 50), (30, 40, 32, 50), (50, 20, 48, 50)])
+
+    def test_several_strokes(self):
+        """Test that the points of each stroke are delta-encoded from the origin, and time across strokes."""
+        data = parse_strokes(make_payload(strokes=[((10, 20), (30, 40)), ((150, 80), (5, 5))]))
+
+        self.assertEqual(
+            [stroke["points"] for stroke in data["strokes"]],
+            [
+                [(10, 20, 16, 50), (30, 40, 32, 50)],
+                [(150, 80, 48, 50), (5, 5, 64, 50)],
+            ],
+        )
+
+    def test_invalid_payloads(self):
+        invalid_payloads = [
+            "not json",
+            "[]",
+            json.dumps({"v": 2, "w": 200, "h": 100, "s": []}),
+            # Point outside of the canvas
+            make_payload(points=((10, 20), (250, 40))),
+            # Canvas too large
+            make_payload(width=100000),
+            # Unsafe color
+            make_payload(color='red" onload="alert(1)'),
+        ]
+        for payload in invalid_payloads:
+            with self.assertRaises(ValidationError):
+                parse_strokes(payload)
+
+    def test_colors(self):
+        """Test that only colors rendered alike as SVG and PNG are accepted."""
+        for color in ("#000", "#1a237eff", "rgb(0, 0, 0)", "rgb(26,35,126)", "navy"):
+            with self.subTest(color=color):
+                strokes = SignatureStrokes(make_payload(color=color))
+                if images.Image is not None:
+                    self.assertTrue(strokes.png_bytes)
+        for color in ("rgba(0, 0, 0, 0.5)", "rgb(300, 0, 0)", "rgb(0%, 0%, 0%)", "currentColor", "#12345"):
+            with self.subTest(color=color), self.assertRaises(ValidationError):
+                parse_strokes(make_payload(color=color))
+
+    def test_max_points(self):
+        with self.assertRaises(ValidationError) as cm:
+            parse_strokes(make_payload(), max_points=2)
+        self.assertEqual(cm.exception.code, "strokes_points")
+
+
+class SignatureStrokesTests(TestCase):
+    def test_svg(self):
+        strokes = SignatureStrokes(make_payload())
+
+        self.assertIn('viewBox="0 0 200 100"', strokes.svg)
+        self.assertIn('<path d="M10 20 L30 40 L50 20"', strokes.svg)
+        self.assertTrue(str(strokes).startswith("data:image/svg+xml;base64,"))
+
+    @skipUnless(images.Image, "Pillow is not installed")
+    def test_png(self):
+        strokes = SignatureStrokes(make_payload())
+
+        with images.Image.open(BytesIO(strokes.png_bytes)) as image:
+            self.assertEqual(image.size, (200, 100))
+        self.assertTrue(strokes.data_url.startswith("data:image/png;base64,"))
+
+
+class SignaturePadStrokesFieldTests(TestCase):
+    def setUp(self):
+        self.field = StrokesSignatureModel._meta.get_field("signature")
+
+    def test_save_and_load(self):
+        obj = StrokesSignatureModel(signature=make_payload())
+        obj.full_clean()
+        obj.save()
+
+        loaded = StrokesSignatureModel.objects.get(pk=obj.pk)
+        self.assertIsInstance(loaded.signature, SignatureStrokes)
+        self.assertEqual(loaded.signature, obj.signature)
+
+    def test_clean_enforces_bounds(self):
+        too_many_points = make_payload(points=[(i % 200, 50) for i in range(101)])
+        with self.assertRaises(ValidationError):
+            self.field.clean(too_many_points, StrokesSignatureModel())
+
+    def test_formfield_widget(self):
+        form_class = forms.modelform_factory(StrokesSignatureModel, fields=["signature"])
+        widget = form_class().fields["signature"].widget
+
+        self.assertIsInstance(widget, SignaturePadWidget)
+        self.assertIn('data-output-format="strokes"', widget.render("signature", None, {"id": "id_signature"}))
@@ -0,0 +1,83 @@
+# tests/test_thumbnails.py
+
+from io import BytesIO
+from unittest import mock, skipUnless
+
+from django.template import Context, Template
+from django.test import TestCase
+
+from signature_pad import images
+from signature_pad.images import encode_data_url
+from signature_pad.thumbnails import parse_size, thumbnail_cache
+
+from .models import DeferredSignatureModel, StoredSignatureModel
+from .test_images import make_signature_png
+
+
+@skipUnless(images.Image, "Pillow is not installed")
+class SignatureThumbnailTests(TestCase):
+    def setUp(self):
+        thumbnail_cache.clear()
+        self.data_url = encode_data_url(make_signature_png())
+
+    def render(self, value, size="120x40"):
+        template = Template("{% load signature_pad %}{% signature_thumbnail value size %}")
+        return template.render(Context({"value": value, "size": size}))
+
+    def test_tag_renders_thumbnail_url(self):
+        url = self.render(self.data_url)
+        self.assertRegex(url, r"^/signature-pad/thumbnails/[0-9a-f]{64}/120x40\.png$")
+
+    def test_known_digest_skips_reading_image(self):
+        """Test that signatures with a known digest are only read to generate missing thumbnails."""
+        for model in (StoredSignatureModel, DeferredSignatureModel):
+            with self.subTest(model=model.__name__):
+                obj = model.objects.create(signature=self.data_url)
+                obj = model.objects.get(pk=obj.pk)
+                url = self.render(obj.signature)
+                self.assertRegex(url, r"^/signature-pad/thumbnails/[0-9a-f]{64}/120x40\.png$")
+
+                with mock.patch.object(images, "get_image_bytes") as get_image_bytes:
+                    self.assertEqual(self.render(obj.signature), url)
+                get_image_bytes.assert_not_called()
+
+    def test_view_serves_cacheable_thumbnail(self):
+        url = self.render(self.data_url)
+        # Served from the Django cache when the in-process LRU is empty
+        thumbnail_cache.clear()
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertIn("immutable", response["Cache-Control"])
+        with images.Image.open(BytesIO(response.content)) as image:
+            self.assertLessEqual(image.width, 120)
+            self.assertLessEqual(image.height, 40)
+
+        response = self.client.get(url, headers={"if-none-match": response["ETag"]})
+        self.assertEqual(response.status_code, 304)
+
+    def test_view_unknown_thumbnail(self):
+        response = self.client.get(f"/signature-pad/thumbnails/{'0' * 64}/120x40.png")
+        self.assertEqual(response.status_code, 404)
+
+    def test_empty_value(self):
+        self.assertEqual(self.render(None), "")
+
+    def test_invalid_values(self):
+        """Test that values that can't be decoded fall back to the value instead of failing the page."""
+        for value in ("data:image/png;base64,invalid", "data:image/png;base64,iVBORw0KGgo="):
+            with self.subTest(value=value):
+                self.assertEqual(self.render(value), value)
+
+    def test_fallback_without_pillow(self):
+        with mock.patch.object(images, "Image", None):
+            self.assertEqual(self.render(self.data_url), self.data_url)
+
+
+class ParseSizeTests(TestCase):
+    def test_parse_size(self):
+        self.assertEqual(parse_size("120x40"), (120, 40))
+        for size in ("120", "0x40", "5000x40", "axb"):
+            with self.assertRaises(ValueError):
+                parse_size(size)
@@ -0,0 +1,145 @@
+# tests/test_uploads.py
+
+import base64
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from signature_pad import SignaturePadWidget
+from signature_pad.uploads import UPLOAD_TOKEN_PREFIX, get_upload, get_upload_cache, pop_upload, save_upload
+
+from .forms import BinarySignatureModelForm, SignatureModelForm
+from .models import BinarySignatureModel, SignatureModel, StoredSignatureModel
+from .test_storage import VALID_DATA_URL, VALID_PNG_DATA
+
+PNG_BYTES = base64.b64decode(VALID_PNG_DATA)
+
+
+class SignatureUploadViewTests(TestCase):
+    def setUp(self):
+        self.url = reverse("signature_pad:upload")
+
+    def upload(self, data, client=None):
+        client = client or self.client
+        return client.post(self.url, {"signature": SimpleUploadedFile("signature.png", data, "image/png")})
+
+    def test_upload_returns_token(self):
+        """Test that an uploaded PNG is kept and referenced by the returned token."""
+        response = self.upload(PNG_BYTES)
+
+        self.assertEqual(response.status_code, 200)
+        token = response.json()["token"]
+        self.assertTrue(token.startswith(UPLOAD_TOKEN_PREFIX))
+        self.assertEqual(get_upload(token), PNG_BYTES)
+
+    def test_upload_webp(self):
+        """Test that WebP uploads are accepted, leaving format checks to the field."""
+        response = self.upload(b"RIFF\0\0\0\0WEBPVP8L" + b"\0" * 20)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(SIGNATURE_PAD_UPLOAD_MAX_SIZE_KB=1)
+    def test_upload_too_large(self):
+        """Test that uploads over the size cap are rejected."""
+        response = self.upload(PNG_BYTES + b"\0" * 2048)
+
+        self.assertEqual(response.status_code, 413)
+        self.assertIn("too large", response.json()["error"])
+
+    def test_upload_not_png(self):
+        """Test that uploads not starting with a PNG signature and IHDR chunk are rejected."""
+        for data in (b"GIF89a" + b"\0" * 100, b"\x89PNG"):
+            with self.subTest(data=data[:8]):
+                response = self.upload(data)
+                self.assertEqual(response.status_code, 400)
+
+    def test_upload_missing_file(self):
+        response = self.client.post(self.url, {})
+        self.assertEqual(response.status_code, 400)
+
+    def test_upload_requires_post(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+
+    def test_upload_check(self):
+        check = mock.Mock(return_value=False)
+        with override_settings(SIGNATURE_PAD_UPLOAD_CHECK=check):
+            self.assertEqual(self.upload(PNG_BYTES).status_code, 403)
+            check.return_value = True
+            self.assertEqual(self.upload(PNG_BYTES).status_code, 200)
+        self.assertEqual(check.call_args[0][0].path, self.url)
+
+    def test_upload_csrf_protected(self):
+        """Test that the view is protected against CSRF although upload handlers are replaced."""
+        response = self.upload(PNG_BYTES, client=Client(enforce_csrf_checks=True))
+        self.assertEqual(response.status_code, 403)
+
+
+class SignatureUploadTokenTests(TestCase):
+    def test_model_form_resolves_token(self):
+        """Test that a form posting an upload token saves the uploaded signature."""
+        form = SignatureModelForm(data={"signature": save_upload(PNG_BYTES)})
+
+        self.assertTrue(form.is_valid(), form.errors)
+        obj = form.save()
+        self.assertEqual(SignatureModel.objects.get(pk=obj.pk).signature, VALID_DATA_URL)
+
+    def test_binary_model_form_resolves_token(self):
+        form = BinarySignatureModelForm(data={"signature": save_upload(PNG_BYTES)})
+
+        self.assertTrue(form.is_valid(), form.errors)
+        obj = form.save()
+        self.assertEqual(bytes(BinarySignatureModel.objects.get(pk=obj.pk).signature), PNG_BYTES)
+
+    def test_stored_signature_from_token(self):
+        """Test that uploaded signatures are written to storage without a data URL round trip."""
+        obj = StoredSignatureModel(signature=save_upload(PNG_BYTES))
+        obj.full_clean()
+        obj.save()
+
+        self.assertEqual(obj.signature.read(), PNG_BYTES)
+
+    def test_token_consumed(self):
+        """Test that a token can't be posted again once it was resolved."""
+        token = save_upload(PNG_BYTES)
+        self.assertTrue(SignatureModelForm(data={"signature": token}).is_valid())
+        self.assertIsNone(get_upload(token))
+
+        form = SignatureModelForm(data={"signature": token})
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors.as_data()["signature"][0].code, "upload")
+
+    def test_token_claimed_once(self):
+        """Test that of concurrent submissions of the same token, only the one deleting the upload gets it."""
+        token = save_upload(PNG_BYTES)
+        cache = get_upload_cache()
+        get = cache.get
+
+        def get_then_claimed(key, *args, **kwargs):
+            data = get(key, *args, **kwargs)
+            # Another request claims the upload between the get and the delete of this one
+            cache.delete(key)
+            return data
+
+        with mock.patch.object(cache, "get", side_effect=get_then_claimed):
+            self.assertIsNone(pop_upload(token))
+
+    def test_expired_token(self):
+        """Test that unknown or expired tokens fail validation."""
+        form = SignatureModelForm(data={"signature": UPLOAD_TOKEN_PREFIX + "expired"})
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors.as_data()["signature"][0].code, "upload")
+
+    def test_uploaded_data_is_validated(self):
+        """Test that uploads are checked again against the field's limits."""
+        field = SignatureModel._meta.get_field("signature")
+        with self.assertRaisesMessage(ValidationError, "missing PNG signature"):
+            field.clean(save_upload(b"not a png" * 4), None)
+
+    def test_widget_upload_url(self):
+        """Test that the widget exposes the upload URL to the script."""
+        html = SignaturePadWidget(upload_url="/signature-pad/upload/").render("signature", "", {"id": "id_signature"})
+        self.assertIn('data-upload-url="/signature-pad/upload/"', html)
+        self.assertNotIn("data-upload-url", SignaturePadWidget().render("signature", "", {"id": "id_signature"}))
@@ -0,0 +1,7 @@
+# tests/urls.py
+
+from django.urls import include, path
+
+urlpatterns = [
+    path("signature-pad/", include("signature_pad.urls")),
+]